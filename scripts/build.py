@@ -4,12 +4,18 @@ Build script for SyncSentinel using PyInstaller.
 This script creates standalone executables and optional installers for Windows and macOS.
 """
 
+import hashlib
+import json
 import os
+import pkgutil
 import platform
 import shutil
 import subprocess
 import sys
+import threading
 import argparse
+import importlib
+from concurrent.futures import ThreadPoolExecutor
 
 # Import version from main module
 try:
@@ -17,8 +23,117 @@ try:
 except ImportError:
     VERSION = "0.9.0"  # Fallback version
 
+# Modules PyInstaller cannot find by itself (imported lazily, per platform or optional)
+THIRD_PARTY_HIDDEN_IMPORTS = (
+    'pystray',
+    'PIL',
+    'PIL.Image',
+    'tkinter',
+    'tkinter.filedialog',
+    'tkinter.scrolledtext',
+    'tkinter.messagebox',
+    'tkinter.ttk',
+    'win32api',
+    'win32con',
+    'win32gui',
+    'win32clipboard',
+    'win32service',
+    'pywintypes',
+    'orjson',
+    'googleapiclient.discovery',
+    'google_auth_oauthlib.flow',
+    'google.auth.transport.requests',
+    'google_auth_httplib2',
+    'cryptography.fernet',
+    'cryptography.hazmat.primitives',
+    'cryptography.hazmat.primitives.ciphers.aead',
+    'watchdog.events',
+    'watchdog.observers',
+    'watchdog.observers.polling',
+    'watchdog.observers.fsevents',  # macOS
+    'watchdog.observers.read_directory_changes',  # Windows
+    'watchdog.observers.inotify_buffer',  # Linux
+)
+
+# Records the inputs icons and the .spec file were last generated from, so unchanged ones are skipped
+BUILD_CACHE_PATH = 'build_cache.json'
+_build_cache_lock = threading.Lock()
+
+def _load_cache():
+    """Load the build cache, empty if it is missing or unreadable."""
+    try:
+        with open(BUILD_CACHE_PATH, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save_cache(cache):
+    """Write the build cache."""
+    with open(BUILD_CACHE_PATH, 'w') as f:
+        json.dump(cache, f, indent=2)
+
+def _update_cache(key, value):
+    """Record one build cache entry; icon conversion and spec creation may run at the same time."""
+    with _build_cache_lock:
+        cache = _load_cache()
+        cache[key] = value
+        _save_cache(cache)
+
+def _source_stamp(path):
+    """(mtime_ns, size) of a build input, as stored in the build cache."""
+    st = os.stat(path)
+    return [st.st_mtime_ns, st.st_size]
+
+def _icon_is_current(png_path, icon_path):
+    """Check whether an icon exists and was converted from the PNG in its current state."""
+    if not os.path.exists(icon_path):
+        return False
+    recorded = _load_cache().get(icon_path)
+    if recorded is None:
+        # Icon made before the cache existed: adopt it as up to date
+        _update_cache(icon_path, _source_stamp(png_path))
+        return True
+    return recorded == _source_stamp(png_path)
+
+# Build cache entry holding the module set of the last successful build
+ANALYSIS_CACHE_KEY = 'pyinstaller_analysis'
+
+# Modules PyInstaller would otherwise pull in through optional imports; SyncSentinel uses none of them
+EXCLUDED_MODULES = (
+    'numpy',
+    'pandas',
+    'IPython',
+    'matplotlib',
+    'lib2to3',
+    'pydoc_data',
+    'test',
+    'tkinter.test',
+)
+
+# Binaries UPX is known to break
+UPX_EXCLUDE = ('vcruntime140.dll', 'python3.dll', f'python3{sys.version_info.minor}.dll')
+
+# Sizes embedded in the Windows .ico
+ICO_SIZES = [(16,16), (32,32), (48,48), (64,64), (256,256)]
+
+def _save_ico(png_path, ico_path):
+    """
+    Convert a PNG to a multi-size ICO and record it in the build cache.
+
+    The PNG is decoded once; Pillow LANCZOS-resamples each size from that image.
+    """
+    from PIL import Image
+    with Image.open(png_path) as img:
+        img.convert('RGBA').save(ico_path, format='ICO', sizes=ICO_SIZES)
+    _update_cache(ico_path, _source_stamp(png_path))
+
+def collect_hidden_imports():
+    """List every syncsentinel submodule followed by the third-party hidden imports."""
+    own_modules = [module.name for module in pkgutil.walk_packages(['syncsentinel'], prefix='syncsentinel.')]
+    return own_modules + list(THIRD_PARTY_HIDDEN_IMPORTS)
+
 def convert_icon_formats():
-    """Convert syncsentinel_icon.png to platform-specific formats if they don't exist."""
+    """Convert syncsentinel_icon.png to platform-specific formats if they are missing or out of date."""
     
     png_path = 'assets/syncsentinel_icon.png'
     if not os.path.exists(png_path):
@@ -36,25 +151,33 @@ def convert_icon_formats():
     
     if current_platform == 'Windows':
         ico_path = 'assets/syncsentinel_icon.ico'
-        if not os.path.exists(ico_path):
+        if not _icon_is_current(png_path, ico_path):
             try:
-                img = Image.open(png_path)
-                img.save(ico_path, format='ICO', sizes=[(16,16), (32,32), (48,48), (64,64), (256,256)])
+                _save_ico(png_path, ico_path)
                 print(f"Converted {png_path} to {ico_path}")
             except Exception as e:
                 print(f"Error converting to ICO: {e}")
     elif current_platform == 'Darwin':  # macOS
         icns_path = 'assets/syncsentinel_icon.icns'
-        if not os.path.exists(icns_path):
+        if not _icon_is_current(png_path, icns_path):
             try:
                 img = Image.open(png_path)
                 img.save(icns_path, format='ICNS')
+                _update_cache(icns_path, _source_stamp(png_path))
                 print(f"Converted {png_path} to {icns_path}")
             except Exception as e:
                 print(f"Error converting to ICNS: {e}")
 
-def build_executable():
-    """Build the executable using PyInstaller."""
+def build_executable(onefile=False):
+    """
+    Build the executable using PyInstaller.
+
+    The default one-folder build starts faster, since a one-file build unpacks
+    itself to a temp folder on every launch.
+
+    Args:
+        onefile (bool): Build a single self-extracting executable instead
+    """
     
     # Determine platform-specific settings
     current_platform = platform.system()
@@ -62,36 +185,24 @@ def build_executable():
         # Base PyInstaller command
     cmd = [
         'pyinstaller',
-        '--onefile',
+        '--onefile' if onefile else '--onedir',
         '--windowed',
         '--name', f'SyncSentinel-{VERSION}',
         '--icon=assets/syncsentinel_icon.ico',
-        '--hidden-import=pystray',
-        '--hidden-import=PIL',
-        '--hidden-import=PIL.Image',
-        '--hidden-import=tkinter',
-        '--hidden-import=tkinter.filedialog',
-        '--hidden-import=tkinter.scrolledtext',
-        '--hidden-import=tkinter.messagebox',
-        '--hidden-import=tkinter.ttk',
-        '--hidden-import=win32api',
-        '--hidden-import=win32con',
-        '--hidden-import=win32gui',
-        '--hidden-import=win32service',
-        '--hidden-import=pywintypes',
-        '--hidden-import=googleapiclient.discovery',
-        '--hidden-import=google_auth_oauthlib.flow',
-        '--hidden-import=google.auth.transport.requests',
-        '--hidden-import=cryptography.fernet',
-        '--hidden-import=cryptography.hazmat.primitives',
-        '--hidden-import=cryptography.hazmat.primitives.kdf.pbkdf2',
-        '--hidden-import=watchdog.events',
-        '--hidden-import=watchdog.observers',
-        '--hidden-import=watchdog.observers.fsevents',
-        '--hidden-import=watchdog.observers.read_directory_changes',
-        '--hidden-import=watchdog.observers.inotify_buffer',
         '--paths=.',
     ]
+    # Keep PyInstaller's analysis cache unless the module set changed, in which case a
+    # fresh analysis keeps stale modules out of the bundle
+    hidden_imports = collect_hidden_imports()
+    analysis_digest = hashlib.sha256(repr((hidden_imports, EXCLUDED_MODULES)).encode()).hexdigest()
+    if _load_cache().get(ANALYSIS_CACHE_KEY) != analysis_digest:
+        cmd.append('--clean')
+    cmd.extend([f'--hidden-import={module}' for module in hidden_imports])
+    cmd.extend([f'--exclude-module={module}' for module in EXCLUDED_MODULES])
+    cmd.extend([f'--upx-exclude={name}' for name in UPX_EXCLUDE])
+    if current_platform == 'Linux':
+        # Stripping breaks Windows binaries and the code signatures of macOS dylibs
+        cmd.append('--strip')
     
     # Add platform-specific options
     if current_platform == 'Windows':
@@ -116,8 +227,30 @@ def build_executable():
     print("Building SyncSentinel executable...")
     print(f"Command: {' '.join(cmd)}")
     
+    # Run PyInstaller in this interpreter when it is importable, saving a second Python startup
+    try:
+        from PyInstaller import __main__ as pyi_main
+    except ImportError:
+        pyi_main = None
+    
+    if pyi_main is not None:
+        try:
+            pyi_main.run(cmd[1:])
+        except SystemExit as e:
+            if e.code not in (None, 0):
+                print(f"Build failed: PyInstaller exited with {e.code}")
+                return False
+        except Exception as e:
+            print(f"Build failed: {e}")
+            return False
+        _update_cache(ANALYSIS_CACHE_KEY, analysis_digest)
+        print("Build completed successfully!")
+        print("Executable created in 'dist' folder")
+        return True
+    
     try:
         result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+        _update_cache(ANALYSIS_CACHE_KEY, analysis_digest)
         print("Build completed successfully!")
         print("Executable created in 'dist' folder")
         return True
@@ -132,13 +265,13 @@ def create_spec_file():
     
     spec_filename = f'SyncSentinel-{VERSION}.spec'
     
-    # Check if spec file exists and is up to date
-    if os.path.exists(spec_filename):
-        with open(spec_filename, 'r') as f:
-            content = f.read()
-            if f"name='SyncSentinel-{VERSION}'" in content:
-                print(f"Spec file {spec_filename} already exists and is up to date.")
-                return
+    # Check if spec file exists and was generated from the current version and hidden imports
+    hidden_imports = collect_hidden_imports()
+    strip = platform.system() == 'Linux'  # see build_executable
+    spec_digest = hashlib.sha256(repr((VERSION, hidden_imports, EXCLUDED_MODULES, UPX_EXCLUDE, strip)).encode()).hexdigest()
+    if os.path.exists(spec_filename) and _load_cache().get(spec_filename) == spec_digest:
+        print(f"Spec file {spec_filename} already exists and is up to date.")
+        return
     
     spec_content = f'''# -*- mode: python ; coding: utf-8 -*-
 
@@ -149,40 +282,11 @@ a = Analysis(
     pathex=['.'],
     binaries=[],
     datas=[('assets/syncsentinel_icon.ico', '.'), ('assets/syncsentinel_icon.png', '.')],
-    hiddenimports=[
-        'watchdog.events',
-        'watchdog.observers',
-        'watchdog.observers.fsevents',  # macOS
-        'watchdog.observers.read_directory_changes',  # Windows
-        'watchdog.observers.inotify_buffer',  # Linux
-        'pystray',
-        'PIL',
-        'PIL.Image',
-        'tkinter',
-        'tkinter.filedialog',
-        'tkinter.scrolledtext',
-        'tkinter.messagebox',
-        'tkinter.ttk',
-        'win32api',
-        'win32con',
-        'win32gui',
-        'win32service',
-        'pywintypes',
-        'googleapiclient.discovery',
-        'google_auth_oauthlib.flow',
-        'google.auth.transport.requests',
-        'cryptography.fernet',
-        'cryptography.hazmat.primitives',
-        'cryptography.hazmat.primitives.kdf.pbkdf2',
-        'parser',
-        'handler',
-        'gui_utils',
-        'google_sheets',
-    ],
+    hiddenimports={hidden_imports!r},
     hookspath=[],
     hooksconfig={{}},
     runtime_hooks=[],
-    excludes=[],
+    excludes={list(EXCLUDED_MODULES)!r},
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
     cipher=block_cipher,
@@ -201,9 +305,9 @@ exe = EXE(
     name='SyncSentinel-{VERSION}',
     debug=False,
     bootloader_ignore_signals=False,
-    strip=False,
+    strip={strip},
     upx=True,
-    upx_exclude=[],
+    upx_exclude={list(UPX_EXCLUDE)!r},
     runtime_tmpdir=None,
     console=False,
     disable_windowed_traceback=False,
@@ -218,20 +322,25 @@ exe = EXE(
     with open(spec_filename, 'w') as f:
         f.write(spec_content)
     
+    _update_cache(spec_filename, spec_digest)
+    
     print(f"Created {spec_filename}")
 
-def create_inno_setup_iss():
-    """Create Inno Setup Script (ISS) file for Windows installer."""
+def create_inno_setup_iss(onefile=False):
+    """
+    Create Inno Setup Script (ISS) file for Windows installer.
+
+    Args:
+        onefile (bool): Package a one-file build instead of the one-folder build
+    """
     
     # Convert PNG to ICO if needed
     try:
-        from PIL import Image
         ico_path = 'assets/syncsentinel_icon.ico'
         png_path = 'assets/syncsentinel_icon.png'
         
-        if not os.path.exists(ico_path) and os.path.exists(png_path):
-            img = Image.open(png_path)
-            img.save(ico_path, format='ICO', sizes=[(16,16), (32,32), (48,48), (64,64), (256,256)])
+        if os.path.exists(png_path) and not _icon_is_current(png_path, ico_path):
+            _save_ico(png_path, ico_path)
             print("Converted assets/syncsentinel_icon.png to assets/syncsentinel_icon.ico")
         elif not os.path.exists(ico_path):
             print("Warning: Neither assets/syncsentinel_icon.ico nor assets/syncsentinel_icon.png found")
@@ -249,6 +358,11 @@ def create_inno_setup_iss():
             os.remove(os.path.join('installers', f))
             print(f"Cleaned up old file: {f}")
     
+    if onefile:
+        exe_files = f'Source: "dist\\SyncSentinel-{VERSION}.exe"; DestDir: "{{app}}"; Flags: ignoreversion'
+    else:
+        exe_files = f'Source: "dist\\SyncSentinel-{VERSION}\\*"; DestDir: "{{app}}"; Flags: ignoreversion recursesubdirs createallsubdirs'
+    
     iss_content = f'''[Setup]
 AppId={{{{B5A7F0E0-1234-5678-9ABC-DEF012345678}}}}
 AppName=SyncSentinel
@@ -261,8 +375,10 @@ DefaultDirName={{pf}}\\SyncSentinel
 DefaultGroupName=SyncSentinel
 OutputDir=installers
 OutputBaseFilename=SyncSentinel-{VERSION}-Installer
-Compression=lzma
+Compression=lzma2/ultra64
 SolidCompression=yes
+LZMAUseSeparateProcess=yes
+LZMANumBlockThreads={os.cpu_count() or 1}
 WizardStyle=modern
 SetupIconFile=assets/syncsentinel_icon.ico
 UninstallDisplayIcon={{app}}\\assets\\syncsentinel_icon.ico
@@ -279,7 +395,7 @@ Name: "desktopicon"; Description: "{{cm:CreateDesktopIcon}}"; GroupDescription:
 Name: "startmenuicon"; Description: "Create Start Menu icon"; GroupDescription: "{{cm:AdditionalIcons}}"; Flags: unchecked
 
 [Files]
-Source: "dist\\SyncSentinel-{VERSION}.exe"; DestDir: "{{app}}"; Flags: ignoreversion
+{exe_files}
 Source: "assets/syncsentinel_icon.ico"; DestDir: "{{app}}"; Flags: ignoreversion
 Source: "assets/syncsentinel_icon.png"; DestDir: "{{app}}"; Flags: ignoreversion
 
@@ -321,19 +437,19 @@ end;
     
     print(f"Created SyncSentinel-{VERSION}.iss file")
 
-def build_windows_installer():
+def build_windows_installer(onefile=False):
     """Build Windows installer using Inno Setup."""
     
-    create_inno_setup_iss()
+    create_inno_setup_iss(onefile)
     
     # Debug: Check iscc path
     print(f"iscc path: {shutil.which('iscc')}")
     
     # Determine iscc command
     if shutil.which('iscc') is None:
-        cmd = [r'C:\Program Files (x86)\Inno Setup 6\iscc.exe', f'SyncSentinel-{VERSION}.iss']
+        cmd = [r'C:\Program Files (x86)\Inno Setup 6\iscc.exe', '/Qp', f'SyncSentinel-{VERSION}.iss']
     else:
-        cmd = ['iscc', f'SyncSentinel-{VERSION}.iss']
+        cmd = ['iscc', '/Qp', f'SyncSentinel-{VERSION}.iss']
     
     print("Building Windows installer...")
     print(f"Command: {' '.join(cmd)}")
@@ -376,38 +492,32 @@ def build_mac_installer():
         print("brew install create-dmg")
         return False
     
-    # Create a temporary app folder
-    app_folder = 'dist/SyncSentinel.app'
-    os.makedirs(app_folder, exist_ok=True)
-    
-    # Copy executable and icon
-    import shutil
-    shutil.copy('dist/SyncSentinel', f'{app_folder}/SyncSentinel')
-    if os.path.exists('assets/syncsentinel_icon.png'):
-        shutil.copy('assets/syncsentinel_icon.png', f'{app_folder}/')
-    
-    # Make executable
-    os.chmod(f'{app_folder}/SyncSentinel', 0o755)
-    
+    # PyInstaller's --windowed build is already an app bundle, in onefile and onedir mode alike
+    app_bundle = f'SyncSentinel-{VERSION}.app'
+    if not os.path.isdir(f'dist/{app_bundle}'):
+        print(f"dist/{app_bundle} not found, build the executable first")
+        return False
+
+    # create-dmg copies the contents of its source folder, so stage the bundle in one;
+    # symlinks=True keeps the framework links inside the bundle intact
+    dmg_folder = 'dist/dmg'
+    shutil.rmtree(dmg_folder, ignore_errors=True)
+    shutil.copytree(f'dist/{app_bundle}', f'{dmg_folder}/{app_bundle}', symlinks=True)
+
     # Create DMG
-    cmd = [
-        'create-dmg',
-        '--volname', 'SyncSentinel',
-        '--volicon', 'assets/syncsentinel_icon.png' if os.path.exists('assets/syncsentinel_icon.png') else '',
+    cmd = ['create-dmg', '--volname', 'SyncSentinel']
+    if os.path.exists('assets/syncsentinel_icon.png'):
+        cmd.extend(['--volicon', 'assets/syncsentinel_icon.png'])
+    cmd.extend([
         '--window-pos', '200', '120',
         '--window-size', '800', '400',
         '--icon-size', '100',
-        '--icon', 'SyncSentinel.app', '200', '190',
-        '--hide-extension', 'SyncSentinel.app',
+        '--icon', app_bundle, '200', '190',
+        '--hide-extension', app_bundle,
         '--app-drop-link', '600', '185',
         'SyncSentinel.dmg',
-        app_folder
-    ]
-    
-    # Remove empty volicon if no icon
-    if not os.path.exists('assets/syncsentinel_icon.png'):
-        cmd.remove('--volicon')
-        cmd.remove('assets/syncsentinel_icon.png')
+        dmg_folder
+    ])
     
     print("Building macOS DMG installer...")
     print(f"Command: {' '.join(cmd)}")
@@ -423,13 +533,13 @@ def build_mac_installer():
         print(f"stderr: {e.stderr}")
         return False
 
-def build_installer():
+def build_installer(onefile=False):
     """Build platform-specific installer."""
     
     current_platform = platform.system()
     
     if current_platform == 'Windows':
-        return build_windows_installer()
+        return build_windows_installer(onefile)
     elif current_platform == 'Darwin':
         return build_mac_installer()
     else:
@@ -441,37 +551,40 @@ def main():
     
     parser = argparse.ArgumentParser(description='Build SyncSentinel executable and optional installer')
     parser.add_argument('--installer', action='store_true', help='Build installer after executable')
+    parser.add_argument('--onefile', action='store_true', help='Build a single-file executable instead of a folder')
     args = parser.parse_args()
     
     print("SyncSentinel Build Script")
     print("=" * 30)
     
-    # Check if PyInstaller is installed
-    try:
-        import PyInstaller
-    except ImportError:
-        print("PyInstaller not found. Install with: pip install pyinstaller")
-        sys.exit(1)
-    
     # Check if icon exists
     if not os.path.exists('assets/syncsentinel_icon.ico'):
         print("Warning: assets/syncsentinel_icon.ico not found in project root")
         print("The build will continue but without an icon")
     
-    # Convert icon formats if needed
-    convert_icon_formats()
-    
-    # Create .spec file
-    create_spec_file()
+    # Import PyInstaller, convert icon formats and create the .spec file side by side;
+    # the three are independent and all finish before PyInstaller runs
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        pyinstaller_import = executor.submit(importlib.import_module, 'PyInstaller')
+        preparation = [executor.submit(convert_icon_formats), executor.submit(create_spec_file)]
+        
+        # Check if PyInstaller is installed
+        try:
+            pyinstaller_import.result()
+        except ImportError:
+            print("PyInstaller not found. Install with: pip install pyinstaller")
+            sys.exit(1)
+        for future in preparation:
+            future.result()
     
     # Build executable
-    success = build_executable()
+    success = build_executable(args.onefile)
     
     if success:
         print("\nExecutable build completed successfully!")
         if args.installer:
             print("\nBuilding installer...")
-            installer_success = build_installer()
+            installer_success = build_installer(args.onefile)
             if installer_success:
                 print("Installer build completed successfully!")
             else:
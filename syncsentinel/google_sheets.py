@@ -4,20 +4,133 @@ Handles Google Sheets API authentication and data upload.
 """
 
 import os
-import pickle
+import re
 import json
 import base64
-import secrets
+import pickle
 import platform
-from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-import requests
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+import time
+import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to the standard library json module
+
+# The Google API client and cryptography packages are imported inside the
+# methods that use them, keeping this module cheap to import
+
+
+def _json_dumps(obj):
+    """Serialize obj to UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def _json_loads(data):
+    """Deserialize UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode())
+
+
+# Day zero of the Google Sheets / Lotus date serial numbering
+_SHEETS_EPOCH = datetime.datetime(1899, 12, 30)
+
+
+def _to_sheets_serial(date, timestamp):
+    """
+    Convert a FreeFileSync date and time to Google Sheets serial numbers.
+
+    Args:
+        date (str): Date such as '9/13/2025'
+        timestamp (str): Time such as '2:30:20 PM'
+
+    Returns:
+        tuple: (date serial, time serial as fraction of a day), or None if unparseable
+    """
+    try:
+        moment = datetime.datetime.strptime(f"{date} {timestamp}", '%m/%d/%Y %I:%M:%S %p')
+    except (TypeError, ValueError):
+        return None
+    days = (moment - _SHEETS_EPOCH).total_seconds() / 86400
+    return int(days), days - int(days)
+
+
+# Matches https://docs.google.com/spreadsheets/d/SPREADSHEET_ID/edit#gid=SHEET_ID
+# capturing the spreadsheet ID and either the gid or another fragment
+_SHEETS_URL_RE = re.compile(
+    r'docs\.google\.com/spreadsheets/d/([^/#?]+)[^#]*(?:#(?:gid=(\d+)|(.+)))?'
+)
+
+
+def extract_sheet_info(url_or_id):
+    """
+    Extract spreadsheet ID and sheet name/ID from URL or return ID if already provided.
+
+    Args:
+        url_or_id (str): Google Sheets URL or ID
+
+    Returns:
+        dict: {'spreadsheet_id': str, 'sheet_name': str or None}
+    """
+    spreadsheet_id = None
+    sheet_name = None
+
+    if '/' in url_or_id:
+        # Extract from URL
+        match = _SHEETS_URL_RE.search(url_or_id)
+        if match:
+            spreadsheet_id = match.group(1)
+            if match.group(2):
+                # For gid, we can't reliably determine the sheet name without API call
+                # Store the gid for now, we'll resolve it later if needed
+                sheet_name = f"gid_{match.group(2)}"  # Special marker for gid-based sheets
+            elif match.group(3):
+                sheet_name = match.group(3)
+    else:
+        # Assume it's already an ID
+        spreadsheet_id = url_or_id
+
+    return {
+        'spreadsheet_id': spreadsheet_id,
+        'sheet_name': sheet_name
+    }
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket that paces calls to a steady rate with bursts.
+    """
+
+    def __init__(self, rate, burst):
+        """
+        Initialize the bucket full.
+
+        Args:
+            rate (float): Tokens added per second
+            burst (int): Maximum number of tokens held
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping until one is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Reserve the token now so concurrent callers queue up behind us
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
 
 
 class GoogleSheetsManager:
@@ -26,10 +139,19 @@ class GoogleSheetsManager:
     """
 
     SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
-    TOKEN_FILE = 'token.pickle'
+    TOKEN_FILE = 'token.json'
+    LEGACY_TOKEN_FILE = 'token.pickle'  # written by releases before the token was stored as JSON
     CREDENTIALS_FILE = 'credentials.json'
     ENCRYPTED_CREDENTIALS_FILE = 'credentials.enc'
     KEY_FILE = 'credentials.key'
+    NONCE_SIZE = 12  # bytes, recommended nonce length for AES-GCM
+    NUM_RETRIES = 5  # retries with exponential backoff on 5xx/429 responses
+    METADATA_CACHE_TTL = 60  # seconds
+    TOKEN_REFRESH_MARGIN = 300  # seconds before expiry to refresh in the background
+    # Uploads per second. Each upload makes two reads and one write, so 24 uploads/min
+    # is 48 reads/min, leaving headroom under the 60/min read quota for retries
+    UPLOAD_RATE = 0.4
+    UPLOAD_BURST = 5
 
     def __init__(self):
         """Initialize the Google Sheets manager."""
@@ -40,33 +162,42 @@ class GoogleSheetsManager:
             # For other platforms, use home directory
             self.base_dir = os.path.join(os.path.expanduser('~'), '.syncsentinel')
         os.makedirs(self.base_dir, exist_ok=True)
-        self.TOKEN_FILE = os.path.join(self.base_dir, 'token.pickle')
+        self.TOKEN_FILE = os.path.join(self.base_dir, 'token.json')
+        self.LEGACY_TOKEN_FILE = os.path.join(self.base_dir, 'token.pickle')
         self.CREDENTIALS_FILE = os.path.join(self.base_dir, 'credentials.json')
         self.ENCRYPTED_CREDENTIALS_FILE = os.path.join(self.base_dir, 'credentials.enc')
         self.KEY_FILE = os.path.join(self.base_dir, 'credentials.key')
+        # Everything remove_credentials deletes
+        self.credential_files = (self.ENCRYPTED_CREDENTIALS_FILE, self.CREDENTIALS_FILE,
+                                 self.TOKEN_FILE, self.LEGACY_TOKEN_FILE, self.KEY_FILE)
         
         self.creds = None
         self.service = None
+        self._http = None
+        self._worker_http = None
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='sheets')
         self.encryption_key = None
+        self._aesgcm = None
+        self._meta_cache = {}  # spreadsheet_id -> (fetch time, sheets list)
+        self._creds_lock = threading.Lock()
+        self._refresh_timer = None
+        self._credentials_exist = None  # cached os.path.exists results, see invalidate_status_cache()
+        self._token_exists = None
+        self._upload_bucket = TokenBucket(self.UPLOAD_RATE, self.UPLOAD_BURST)
         self._load_encryption_key()
 
     def _load_encryption_key(self):
         """Load or generate encryption key."""
+        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
         try:
             if os.path.exists(self.KEY_FILE):
                 with open(self.KEY_FILE, 'rb') as f:
                     self.encryption_key = f.read()
             else:
-                # Generate a new key
-                salt = secrets.token_bytes(16)
-                password = secrets.token_hex(32).encode()
-                kdf = PBKDF2HMAC(
-                    algorithm=hashes.SHA256(),
-                    length=32,
-                    salt=salt,
-                    iterations=100000,
-                )
-                self.encryption_key = base64.urlsafe_b64encode(kdf.derive(password))
+                # Generate a new random key; there is no user password to stretch,
+                # so a KDF adds startup cost without adding security
+                self.encryption_key = self._generate_key()
 
                 # Save the key
                 with open(self.KEY_FILE, 'wb') as f:
@@ -74,14 +205,28 @@ class GoogleSheetsManager:
         except Exception as e:
             print(f"Error loading encryption key: {e}")
             # Fallback to a simple key for basic functionality
-            self.encryption_key = Fernet.generate_key()
+            self.encryption_key = self._generate_key()
+
+        # Build the cipher once and reuse it for every encrypt/decrypt
+        try:
+            self._aesgcm = AESGCM(base64.urlsafe_b64decode(self.encryption_key))
+        except Exception as e:
+            print(f"Error initializing encryption: {e}")
+            self.encryption_key = self._generate_key()
+            self._aesgcm = AESGCM(base64.urlsafe_b64decode(self.encryption_key))
+
+    def _generate_key(self):
+        """Generate a random AES-256 key, base64-encoded as stored in KEY_FILE."""
+        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+        return base64.urlsafe_b64encode(AESGCM.generate_key(bit_length=256))
 
     def _encrypt_credentials(self, credentials_data):
-        """Encrypt credentials data."""
+        """Encrypt credentials data with AES-256-GCM, returning nonce + ciphertext."""
         try:
-            fernet = Fernet(self.encryption_key)
-            json_data = json.dumps(credentials_data).encode()
-            encrypted_data = fernet.encrypt(json_data)
+            json_data = _json_dumps(credentials_data)
+            nonce = os.urandom(self.NONCE_SIZE)
+            encrypted_data = nonce + self._aesgcm.encrypt(nonce, json_data, None)
             return encrypted_data
         except Exception as e:
             print(f"Error encrypting credentials: {e}")
@@ -89,6 +234,8 @@ class GoogleSheetsManager:
 
     def _decrypt_credentials(self):
         """Decrypt credentials data."""
+        from cryptography.exceptions import InvalidTag
+
         try:
             if not os.path.exists(self.ENCRYPTED_CREDENTIALS_FILE):
                 return None
@@ -96,9 +243,22 @@ class GoogleSheetsManager:
             with open(self.ENCRYPTED_CREDENTIALS_FILE, 'rb') as f:
                 encrypted_data = f.read()
 
-            fernet = Fernet(self.encryption_key)
-            decrypted_data = fernet.decrypt(encrypted_data)
-            credentials_data = json.loads(decrypted_data.decode())
+            try:
+                nonce, ciphertext = encrypted_data[:self.NONCE_SIZE], encrypted_data[self.NONCE_SIZE:]
+                decrypted_data = self._aesgcm.decrypt(nonce, ciphertext, None)
+            except InvalidTag:
+                # Credentials written by earlier versions are Fernet tokens under the same key;
+                # re-encrypt them in the current format
+                from cryptography.fernet import Fernet
+                decrypted_data = Fernet(self.encryption_key).decrypt(encrypted_data)
+                credentials_data = _json_loads(decrypted_data)
+                reencrypted_data = self._encrypt_credentials(credentials_data)
+                if reencrypted_data:
+                    with open(self.ENCRYPTED_CREDENTIALS_FILE, 'wb') as f:
+                        f.write(reencrypted_data)
+                return credentials_data
+
+            credentials_data = _json_loads(decrypted_data)
             return credentials_data
         except Exception as e:
             print(f"Error decrypting credentials: {e}")
@@ -136,10 +296,11 @@ class GoogleSheetsManager:
                 with open(self.ENCRYPTED_CREDENTIALS_FILE, 'wb') as f:
                     f.write(encrypted_data)
 
-                # Also save unencrypted version for Google API compatibility
-                with open(self.CREDENTIALS_FILE, 'w') as f:
-                    json.dump(credentials_data, f, indent=2)
+                # Remove any plaintext copy left behind by earlier versions
+                if os.path.exists(self.CREDENTIALS_FILE):
+                    os.remove(self.CREDENTIALS_FILE)
 
+                self._credentials_exist = True
                 return True
             return False
 
@@ -149,8 +310,27 @@ class GoogleSheetsManager:
 
     def has_credentials(self):
         """Check if credentials are available."""
-        return (os.path.exists(self.CREDENTIALS_FILE) or
-                os.path.exists(self.ENCRYPTED_CREDENTIALS_FILE))
+        if self._credentials_exist is None:
+            self._credentials_exist = (os.path.exists(self.CREDENTIALS_FILE) or
+                                       os.path.exists(self.ENCRYPTED_CREDENTIALS_FILE))
+        return self._credentials_exist
+
+    def invalidate_status_cache(self):
+        """Forget cached credential/token file existence after files change on disk."""
+        self._credentials_exist = None
+        self._token_exists = None
+
+    def clear_credentials(self):
+        """Stop the token refresh and drop the in-memory credentials and connections."""
+        with self._creds_lock:
+            if self._refresh_timer is not None:
+                self._refresh_timer.cancel()
+                self._refresh_timer = None
+            self.creds = None
+            self.service = None
+            self._http = None
+            self._worker_http = None
+            self._meta_cache.clear()
 
     def get_setup_instructions(self):
         """Get setup instructions for Google Sheets integration."""
@@ -176,49 +356,129 @@ class GoogleSheetsManager:
             tuple: (bool, str) - Success status and error message if failed
         """
         try:
-            # Load existing credentials
-            if os.path.exists(self.TOKEN_FILE):
-                with open(self.TOKEN_FILE, 'rb') as token:
-                    self.creds = pickle.load(token)
-
-            # If there are no (valid) credentials available, let the user log in
-            if not self.creds or not self.creds.valid:
-                if self.creds and self.creds.expired and self.creds.refresh_token:
-                    self.creds.refresh(Request())
-                else:
-                    # Try to load credentials from encrypted file if regular file doesn't exist
-                    if not os.path.exists(self.CREDENTIALS_FILE):
+            from google.auth.transport.requests import Request
+            from google.oauth2.credentials import Credentials
+            from google_auth_httplib2 import AuthorizedHttp
+            from google_auth_oauthlib.flow import InstalledAppFlow
+            from googleapiclient.discovery import build
+            from googleapiclient.http import build_http
+
+            with self._creds_lock:
+                # Reuse the existing service while the in-memory credentials are valid
+                if self.service is not None and self.creds and self.creds.valid:
+                    return True, "Authentication successful"
+
+                # Load existing credentials
+                if not self.creds and not os.path.exists(self.TOKEN_FILE):
+                    self._migrate_legacy_token()
+                if not self.creds and os.path.exists(self.TOKEN_FILE):
+                    self.creds = Credentials.from_authorized_user_file(self.TOKEN_FILE, self.SCOPES)
+
+                # If there are no (valid) credentials available, let the user log in
+                if not self.creds or not self.creds.valid:
+                    if self.creds and self.creds.expired and self.creds.refresh_token:
+                        # Inline fallback, e.g. when the background refresh was missed due to clock skew
+                        self.creds.refresh(Request())
+                    else:
+                        # Prefer the encrypted credentials, decrypted in memory only;
+                        # a plaintext file is still accepted from the manual setup
                         if os.path.exists(self.ENCRYPTED_CREDENTIALS_FILE):
                             credentials_data = self._decrypt_credentials()
-                            if credentials_data:
-                                with open(self.CREDENTIALS_FILE, 'w') as f:
-                                    json.dump(credentials_data, f, indent=2)
-                            else:
+                            if not credentials_data:
                                 return False, "Failed to decrypt credentials"
+                            flow = InstalledAppFlow.from_client_config(credentials_data, self.SCOPES)
+                        elif os.path.exists(self.CREDENTIALS_FILE):
+                            flow = InstalledAppFlow.from_client_secrets_file(self.CREDENTIALS_FILE, self.SCOPES)
                         else:
                             return False, "No credentials found. Please complete the setup process first."
 
-                    flow = InstalledAppFlow.from_client_secrets_file(self.CREDENTIALS_FILE, self.SCOPES)
-                    self.creds = flow.run_local_server(port=0)
+                        self.creds = flow.run_local_server(port=0)
+
+                    # Save the credentials for the next run
+                    self._save_token()
+
+                # Share one authorized, keep-alive HTTP connection across all Sheets calls.
+                # httplib2 is not thread-safe, so the worker thread gets a connection of its own.
+                # build_http keeps the client library's default timeout and redirect handling.
+                self._http = AuthorizedHttp(self.creds, http=build_http())
+                self._worker_http = AuthorizedHttp(self.creds, http=build_http())
 
-                # Save the credentials for the next run
-                with open(self.TOKEN_FILE, 'wb') as token:
-                    pickle.dump(self.creds, token)
+                # Build the service from the bundled discovery document (no HTTP fetch)
+                self.service = build('sheets', 'v4', http=self._http,
+                                     cache_discovery=False, static_discovery=True)
 
-            # Build the service
-            self.service = build('sheets', 'v4', credentials=self.creds)
+            self._schedule_token_refresh()
             return True, "Authentication successful"
 
         except Exception as e:
             return False, f"Authentication failed: {str(e)}"
 
+    def _schedule_token_refresh(self):
+        """Arm a background timer that refreshes the token shortly before it expires."""
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+            self._refresh_timer = None
+
+        if not self.creds or not self.creds.refresh_token or not self.creds.expiry:
+            return
+
+        # Credentials.expiry is a naive UTC datetime
+        now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+        delay = (self.creds.expiry - now).total_seconds() - self.TOKEN_REFRESH_MARGIN
+        self._refresh_timer = threading.Timer(max(delay, 0), self._background_refresh)
+        self._refresh_timer.daemon = True
+        self._refresh_timer.start()
+
+    def _background_refresh(self):
+        """Refresh the OAuth token off the upload path and re-arm the timer."""
+        from google.auth.transport.requests import Request
+
+        try:
+            with self._creds_lock:
+                if self.creds is None:
+                    return  # Credentials were removed while the timer was due
+                self.creds.refresh(Request())
+                self._save_token()
+        except Exception as e:
+            # Leave the inline refresh in authenticate() to recover
+            print(f"Background token refresh failed: {e}")
+            return
+        self._schedule_token_refresh()
+
+    def _migrate_legacy_token(self):
+        """Move a token.pickle left by an older release to TOKEN_FILE, once."""
+        if not os.path.exists(self.LEGACY_TOKEN_FILE):
+            return
+        try:
+            with open(self.LEGACY_TOKEN_FILE, 'rb') as token:
+                self.creds = pickle.load(token)
+            self._save_token()
+        except Exception as e:
+            # Fall back to a fresh login, which replaces the old token anyway
+            print(f"Could not migrate {self.LEGACY_TOKEN_FILE}: {e}")
+            self.creds = None
+        try:
+            os.unlink(self.LEGACY_TOKEN_FILE)
+        except OSError:
+            pass
+
+    def _save_token(self):
+        """Atomically write the OAuth token to TOKEN_FILE as JSON."""
+        tmp_path = self.TOKEN_FILE + '.tmp'
+        with open(tmp_path, 'w') as token:
+            token.write(self.creds.to_json())
+        os.replace(tmp_path, self.TOKEN_FILE)
+        self._token_exists = True
+
     def is_setup_complete(self):
         """Check if Google Sheets setup is complete."""
-        return (os.path.exists(self.CREDENTIALS_FILE) or
-                os.path.exists(self.ENCRYPTED_CREDENTIALS_FILE)) and \
-               os.path.exists(self.TOKEN_FILE)
+        if self._token_exists is None:
+            # authenticate() migrates a legacy token on first use
+            self._token_exists = os.path.exists(self.TOKEN_FILE) or os.path.exists(self.LEGACY_TOKEN_FILE)
+        return self.has_credentials() and self._token_exists
 
-    def upload_data(self, spreadsheet_id, data, sheet_name=None, prepend=True, add_breaks=False):
+    def upload_data(self, spreadsheet_id, data, sheet_name=None, prepend=True, add_breaks=False,
+                    serial_dates=False):
         """
         Upload parsed log data to Google Sheets.
 
@@ -228,40 +488,82 @@ class GoogleSheetsManager:
             sheet_name (str): Optional sheet name to target
             prepend (bool): Whether to prepend (True) or append (False) data
             add_breaks (bool): Whether to add breaks between log entries
+            serial_dates (bool): Send Date and Time as Sheets serial numbers instead of text.
+                Sheets stores them without parsing, but the target columns must be
+                formatted as Date/Time to display them as such.
+
+        Returns:
+            tuple: (bool, str) - Success status and error message if failed
+        """
+        return self.upload_data_batch(spreadsheet_id, [data], sheet_name, prepend=prepend,
+                                      add_breaks=add_breaks, serial_dates=serial_dates)
+
+    def upload_data_batch(self, spreadsheet_id, data_list, sheet_name=None, prepend=True, add_breaks=False,
+                          serial_dates=False, unique_files_list=None):
+        """
+        Upload several parsed logs to Google Sheets with a single write request.
+
+        The resulting sheet matches uploading each log in turn with upload_data.
+
+        Args:
+            spreadsheet_id (str): Google Sheets spreadsheet ID
+            data_list (list): Parsed log data dicts, in processing order
+            sheet_name (str): Optional sheet name to target
+            prepend (bool): Whether to prepend (True) or append (False) data
+            add_breaks (bool): Whether to add breaks between log entries
+            serial_dates (bool): Send Date and Time as Sheets serial numbers instead of text
+            unique_files_list (list, optional): extract_unique_files() of each log, if the caller already has them
 
         Returns:
             tuple: (bool, str) - Success status and error message if failed
         """
+        from googleapiclient.errors import HttpError
+
         try:
             if not self.service:
                 if not self.authenticate():
                     return False, "Failed to authenticate with Google Sheets"
 
-            # Extract data for upload
-            from syncsentinel.parser import extract_unique_files
-            unique_files = extract_unique_files(data)
-
-            if not unique_files:
+            # Stay under the per-user request quota during bursts of new logs
+            self._upload_bucket.acquire()
+
+            # Extract data for upload, one group of rows per log
+            if unique_files_list is None:
+                from syncsentinel.parser import extract_unique_files
+                unique_files_list = [extract_unique_files(data) for data in data_list]
+            row_groups = []
+            for data, unique_files in zip(data_list, unique_files_list):
+                if not unique_files:
+                    continue
+
+                date = data['date']
+                rows = [
+                    [date, info['timestamp'], info['file_type'], info['section'], info['file_name']]
+                    for info in unique_files.values()
+                ]
+                if serial_dates:
+                    for row in rows:
+                        serial = _to_sheets_serial(row[0], row[1])
+                        if serial:
+                            row[0], row[1] = serial
+                row_groups.append(rows)
+
+            if not row_groups:
                 return False, "No data to upload - no files found in parsed data"
 
             # Prepare data for Google Sheets
             headers = ['Date', 'Time', 'Type', 'Section', 'File Name']
-            new_rows = []
-
-            for file_name, info in unique_files.items():
-                row = [
-                    data['date'],
-                    info['timestamp'],
-                    info['file_type'],
-                    info['section'],
-                    info['file_name']
-                ]
-                new_rows.append(row)
-
-            # Calculate total rows to insert (new data + break if enabled)
-            num_new_rows = len(new_rows)
-            if add_breaks:
-                num_new_rows += 1  # Add space for break row
+            break_row = ['--- New Log Entry ---', '', '', '', '']
+            num_rows = sum(len(rows) for rows in row_groups)
+
+            # Rows to insert below the header in prepend mode: each log's rows (plus break)
+            # end up above the previously uploaded ones, so the last log comes first
+            all_new_data = []
+            for rows in reversed(row_groups):
+                all_new_data.extend(rows)
+                if add_breaks:
+                    all_new_data.append(break_row)
+            num_new_rows = len(all_new_data)
 
             # Resolve sheet name if provided
             actual_sheet_name = None
@@ -278,132 +580,116 @@ class GoogleSheetsManager:
                 else:
                     actual_sheet_name = sheet_name
 
-            # Get sheet ID for batchUpdate operations
-            sheet_id = None
+            # Sheet-qualified A1 range prefix, e.g. "'Sheet1'!"
+            sheet_prefix = f"'{actual_sheet_name}'!" if actual_sheet_name else ''
+
+            # Get sheet ID for batchUpdate operations. The metadata fetch runs on the
+            # worker thread (with its own connection) while the header check below runs here.
+            meta_future = None
             if actual_sheet_name:
-                try:
-                    spreadsheet = self.service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
-                    sheets = spreadsheet.get('sheets', [])
-                    for sheet in sheets:
-                        properties = sheet.get('properties', {})
-                        if properties.get('title') == actual_sheet_name:
-                            sheet_id = properties.get('sheetId')
-                            break
-                except Exception as e:
-                    print(f"Warning: Could not get sheet ID for {actual_sheet_name}: {e}")
+                meta_future = self._pool.submit(self._get_sheets_meta, spreadsheet_id, self._worker_http)
 
-            # Check if sheet has data and handle empty sheets
-            range_name = f"'{actual_sheet_name}'!A:A" if actual_sheet_name else "A:A"
+            # Check if sheet has data and handle empty sheets. Prepend only needs to know
+            # whether row 1 is populated; append needs column A to find the last row.
+            check_range = "A:A" if not prepend else "A1:E1"
+            range_name = f"{sheet_prefix}{check_range}"
             try:
                 existing_data = self.service.spreadsheets().values().get(
                     spreadsheetId=spreadsheet_id,
                     range=range_name
-                ).execute()
+                ).execute(num_retries=self.NUM_RETRIES)
                 existing_values = existing_data.get('values', [])
-                has_header = len(existing_values) > 0 and existing_values[0]
+                has_header = bool(existing_values and existing_values[0])
             except Exception:
                 # Sheet might be empty or not exist
                 has_header = False
                 existing_values = []
 
+            sheet_id = None
+            if meta_future is not None:
+                try:
+                    sheets = meta_future.result()
+                    sheet_id = next((properties.get('sheetId')
+                                     for properties in (sheet.get('properties', {}) for sheet in sheets)
+                                     if properties.get('title') == actual_sheet_name), None)
+                except Exception as e:
+                    print(f"Warning: Could not get sheet ID for {actual_sheet_name}: {e}")
+
+            # Use insertDimension to shift all existing rows down (including checkboxes in column F).
+            # The header, row insertion and data write are sent together in a single batchUpdate call.
+            if prepend and sheet_id is not None and num_new_rows > 0:
+                try:
+                    batch_requests = []
+                    if not has_header:
+                        batch_requests.append(self._update_cells_request(sheet_id, 0, [headers]))
+
+                    # Insert rows after header (startIndex=1)
+                    batch_requests.append({
+                        'insertDimension': {
+                            'range': {
+                                'sheetId': sheet_id,
+                                'dimension': 'ROWS',
+                                'startIndex': 1,  # After header row
+                                'endIndex': 1 + num_new_rows
+                            },
+                            'inheritFromBefore': False
+                        }
+                    })
+
+                    # Write the new data to the inserted rows
+                    batch_requests.append(self._update_cells_request(sheet_id, 1, all_new_data))
+
+                    self.service.spreadsheets().batchUpdate(
+                        spreadsheetId=spreadsheet_id,
+                        body={'requests': batch_requests}
+                    ).execute(num_retries=self.NUM_RETRIES)
+
+                    return True, f"Successfully prepended {num_rows} rows to Google Sheets (sheet: {actual_sheet_name or 'default'})"
+
+                except Exception as e:
+                    print(f"Insert dimension failed, falling back to manual method: {e}")
+                    self._invalidate_sheets_meta(spreadsheet_id)
+                    # Fall back to the old method if insertDimension fails
+
             # Add header if sheet is empty
             if not has_header:
                 try:
                     header_body = {'values': [headers]}
-                    header_range = f"'{actual_sheet_name}'!A1:E1" if actual_sheet_name else "A1:E1"
+                    header_range = f"{sheet_prefix}A1:E1"
                     self.service.spreadsheets().values().update(
                         spreadsheetId=spreadsheet_id,
                         range=header_range,
                         valueInputOption='RAW',
                         body=header_body
-                    ).execute()
+                    ).execute(num_retries=self.NUM_RETRIES)
                     existing_values = [headers]  # Update our local copy
                 except Exception as e:
                     return False, f"Failed to add header to sheet: {str(e)}"
 
             if prepend:
-                # Use insertDimension to shift all existing rows down (including checkboxes in column F)
-                if sheet_id is not None and num_new_rows > 0:
-                    try:
-                        # Insert rows after header (startIndex=1)
-                        insert_request = {
-                            'insertDimension': {
-                                'range': {
-                                    'sheetId': sheet_id,
-                                    'dimension': 'ROWS',
-                                    'startIndex': 1,  # After header row
-                                    'endIndex': 1 + num_new_rows
-                                },
-                                'inheritFromBefore': False
-                            }
-                        }
-
-                        batch_update_body = {'requests': [insert_request]}
-                        self.service.spreadsheets().batchUpdate(
-                            spreadsheetId=spreadsheet_id,
-                            body=batch_update_body
-                        ).execute()
-
-                        # Now write the new data to the inserted rows
-                        all_new_data = new_rows.copy()
-                        if add_breaks:
-                            all_new_data.append(['--- New Log Entry ---', '', '', '', ''])
-
-                        insert_body = {'values': all_new_data}
-                        insert_range = f"'{actual_sheet_name}'!A2:E{1 + len(all_new_data)}" if actual_sheet_name else f"A2:E{1 + len(all_new_data)}"
-
-                        self.service.spreadsheets().values().update(
-                            spreadsheetId=spreadsheet_id,
-                            range=insert_range,
-                            valueInputOption='RAW',
-                            body=insert_body
-                        ).execute()
-
-                        return True, f"Successfully prepended {len(new_rows)} rows to Google Sheets (sheet: {actual_sheet_name or 'default'})"
-
-                    except Exception as e:
-                        print(f"Insert dimension failed, falling back to manual method: {e}")
-                        # Fall back to the old method if insertDimension fails
-
                 # Fallback: Manual prepend method (old approach)
                 try:
                     # Read existing data (excluding header)
-                    existing_data_range = f"'{actual_sheet_name}'!A2:E" if actual_sheet_name else "A2:E"
+                    existing_data_range = f"{sheet_prefix}A2:E"
                     existing_data_result = self.service.spreadsheets().values().get(
                         spreadsheetId=spreadsheet_id,
                         range=existing_data_range
-                    ).execute()
+                    ).execute(num_retries=self.NUM_RETRIES)
                     existing_rows = existing_data_result.get('values', [])
 
                     # Insert new data at row 2
-                    all_new_data = new_rows.copy()
-                    if add_breaks:
-                        all_new_data.append(['--- New Log Entry ---', '', '', '', ''])
-
-                    insert_body = {'values': all_new_data}
-                    insert_range = f"'{actual_sheet_name}'!A2:E{1 + len(all_new_data)}" if actual_sheet_name else f"A2:E{1 + len(all_new_data)}"
-
-                    self.service.spreadsheets().values().update(
-                        spreadsheetId=spreadsheet_id,
-                        range=insert_range,
-                        valueInputOption='RAW',
-                        body=insert_body
-                    ).execute()
+                    insert_range = f"{sheet_prefix}A2:E{1 + len(all_new_data)}"
+                    value_ranges = [{'range': insert_range, 'values': all_new_data}]
 
                     # Write existing data after the new data
                     if existing_rows:
-                        existing_body = {'values': existing_rows}
                         existing_start_row = 2 + len(all_new_data)
-                        existing_insert_range = f"'{actual_sheet_name}'!A{existing_start_row}:E{existing_start_row - 1 + len(existing_rows)}" if actual_sheet_name else f"A{existing_start_row}:E{existing_start_row - 1 + len(existing_rows)}"
+                        existing_insert_range = f"{sheet_prefix}A{existing_start_row}:E{existing_start_row - 1 + len(existing_rows)}"
+                        value_ranges.append({'range': existing_insert_range, 'values': existing_rows})
 
-                        self.service.spreadsheets().values().update(
-                            spreadsheetId=spreadsheet_id,
-                            range=existing_insert_range,
-                            valueInputOption='RAW',
-                            body=existing_body
-                        ).execute()
+                    self._batch_update_values(spreadsheet_id, value_ranges)
 
-                    return True, f"Successfully prepended {len(new_rows)} rows to Google Sheets (sheet: {actual_sheet_name or 'default'})"
+                    return True, f"Successfully prepended {num_rows} rows to Google Sheets (sheet: {actual_sheet_name or 'default'})"
 
                 except Exception as e:
                     return False, f"Failed to prepend data: {str(e)}"
@@ -412,36 +698,27 @@ class GoogleSheetsManager:
                 # Append mode - find the last row and add data there
                 try:
                     last_row = len(existing_values) + 1
+                    append_rows = []
 
-                    # Add break row if enabled and there's existing data beyond header
-                    if add_breaks and len(existing_values) > 1:  # More than just header
-                        break_body = {'values': [['--- New Log Entry ---', '', '', '', '']]}
-                        break_range = f"'{actual_sheet_name}'!A{last_row}:E{last_row}" if actual_sheet_name else f"A{last_row}:E{last_row}"
-                        self.service.spreadsheets().values().update(
-                            spreadsheetId=spreadsheet_id,
-                            range=break_range,
-                            valueInputOption='RAW',
-                            body=break_body
-                        ).execute()
-                        last_row += 1
+                    for index, rows in enumerate(row_groups):
+                        # Add break row if enabled and there's existing data beyond header
+                        if add_breaks and (index > 0 or len(existing_values) > 1):  # More than just header
+                            append_rows.append(break_row)
+                        append_rows.extend(rows)
 
                     # Append new data
-                    insert_body = {'values': new_rows}
-                    insert_range = f"'{actual_sheet_name}'!A{last_row}:E{last_row - 1 + len(new_rows)}" if actual_sheet_name else f"A{last_row}:E{last_row - 1 + len(new_rows)}"
+                    insert_range = f"{sheet_prefix}A{last_row}:E{last_row - 1 + len(append_rows)}"
+                    self._batch_update_values(spreadsheet_id, [{'range': insert_range, 'values': append_rows}])
 
-                    self.service.spreadsheets().values().update(
-                        spreadsheetId=spreadsheet_id,
-                        range=insert_range,
-                        valueInputOption='RAW',
-                        body=insert_body
-                    ).execute()
-
-                    return True, f"Successfully appended {len(new_rows)} rows to Google Sheets (sheet: {actual_sheet_name or 'default'})"
+                    return True, f"Successfully appended {num_rows} rows to Google Sheets (sheet: {actual_sheet_name or 'default'})"
 
                 except Exception as e:
                     return False, f"Failed to append data: {str(e)}"
 
         except HttpError as e:
+            if hasattr(e, 'resp') and getattr(e.resp, 'status', None) in (400, 404):
+                # Sheet layout may have changed; refetch metadata next time
+                self._invalidate_sheets_meta(spreadsheet_id)
             error_details = f"Google Sheets API error: {e}"
             if hasattr(e, 'resp') and hasattr(e.resp, 'status'):
                 error_details += f" (HTTP {e.resp.status})"
@@ -449,6 +726,86 @@ class GoogleSheetsManager:
         except Exception as e:
             return False, f"Upload failed: {str(e)}"
 
+    def _get_sheets_meta(self, spreadsheet_id, http=None):
+        """
+        Get the sheets list of a spreadsheet, cached for METADATA_CACHE_TTL seconds.
+
+        Args:
+            spreadsheet_id (str): Google Sheets spreadsheet ID
+            http (optional): HTTP object to send the request with instead of the service's own
+
+        Returns:
+            list: Sheet entries from the spreadsheet metadata
+        """
+        cached = self._meta_cache.get(spreadsheet_id)
+        if cached and time.monotonic() - cached[0] < self.METADATA_CACHE_TTL:
+            return cached[1]
+
+        # Only sheet IDs and titles are used, so skip the rest of the metadata
+        spreadsheet = self.service.spreadsheets().get(
+            spreadsheetId=spreadsheet_id,
+            fields='sheets(properties(sheetId,title))'
+        ).execute(http=http, num_retries=self.NUM_RETRIES)
+        sheets = spreadsheet.get('sheets', [])
+        self._meta_cache[spreadsheet_id] = (time.monotonic(), sheets)
+        return sheets
+
+    def _invalidate_sheets_meta(self, spreadsheet_id=None):
+        """
+        Drop cached spreadsheet metadata.
+
+        Args:
+            spreadsheet_id (str, optional): Spreadsheet to invalidate; all if None
+        """
+        if spreadsheet_id is None:
+            self._meta_cache.clear()
+        else:
+            self._meta_cache.pop(spreadsheet_id, None)
+
+    def _batch_update_values(self, spreadsheet_id, value_ranges):
+        """
+        Write several value ranges in a single values().batchUpdate call.
+
+        Args:
+            spreadsheet_id (str): Google Sheets spreadsheet ID
+            value_ranges (list): List of {'range': str, 'values': list} entries
+        """
+        self.service.spreadsheets().values().batchUpdate(
+            spreadsheetId=spreadsheet_id,
+            body={'valueInputOption': 'RAW', 'data': value_ranges}
+        ).execute(num_retries=self.NUM_RETRIES)
+
+    def _update_cells_request(self, sheet_id, row_index, rows):
+        """
+        Build an updateCells request writing rows of string or numeric values.
+
+        Args:
+            sheet_id (int): Numeric sheet ID
+            row_index (int): Zero-based row index of the first row to write
+            rows (list): List of rows, each a list of cell values
+
+        Returns:
+            dict: updateCells request for spreadsheets().batchUpdate
+        """
+        return {
+            'updateCells': {
+                'start': {
+                    'sheetId': sheet_id,
+                    'rowIndex': row_index,
+                    'columnIndex': 0
+                },
+                'rows': [
+                    {'values': [
+                        {'userEnteredValue': {'numberValue': value}} if isinstance(value, (int, float))
+                        else {'userEnteredValue': {'stringValue': str(value)}}
+                        for value in row
+                    ]}
+                    for row in rows
+                ],
+                'fields': 'userEnteredValue'
+            }
+        }
+
     def get_sheet_names(self, spreadsheet_id):
         """
         Get all sheet names from a Google Sheets spreadsheet.
@@ -465,8 +822,7 @@ class GoogleSheetsManager:
                     return None
 
             # Get spreadsheet metadata
-            spreadsheet = self.service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
-            sheets = spreadsheet.get('sheets', [])
+            sheets = self._get_sheets_meta(spreadsheet_id)
 
             sheet_names = []
             for sheet in sheets:
@@ -505,62 +861,15 @@ class GoogleSheetsManager:
             gid = sheet_identifier.split('_')[1]
 
             # Get spreadsheet metadata to find the sheet with matching gid
-            spreadsheet = self.service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
-            sheets = spreadsheet.get('sheets', [])
-
-            for sheet in sheets:
-                properties = sheet.get('properties', {})
-                sheet_gid = properties.get('sheetId')
-                title = properties.get('title')
+            sheets = self._get_sheets_meta(spreadsheet_id)
 
-                if str(sheet_gid) == gid and title:
-                    return title
-
-            return None
+            return next((properties['title']
+                         for properties in (sheet.get('properties', {}) for sheet in sheets)
+                         if str(properties.get('sheetId')) == gid and properties.get('title')), None)
 
         except Exception as e:
             print(f"Failed to resolve sheet name for {sheet_identifier}: {e}")
             return None
 
-    def extract_sheet_info(self, url_or_id):
-        """
-        Extract spreadsheet ID and sheet name/ID from URL or return ID if already provided.
-
-        Args:
-            url_or_id (str): Google Sheets URL or ID
-
-        Returns:
-            dict: {'spreadsheet_id': str, 'sheet_name': str or None}
-        """
-        spreadsheet_id = None
-        sheet_name = None
-
-        if '/' in url_or_id:
-            # Extract from URL
-            if 'docs.google.com/spreadsheets' in url_or_id:
-                # URL format: https://docs.google.com/spreadsheets/d/SPREADSHEET_ID/edit#gid=SHEET_ID
-                parts = url_or_id.split('/')
-                try:
-                    id_index = parts.index('d') + 1
-                    spreadsheet_id = parts[id_index]
-
-                    # Check for sheet ID in URL fragment
-                    if '#' in url_or_id:
-                        fragment = url_or_id.split('#')[-1]
-                        if fragment.startswith('gid='):
-                            # For gid, we can't reliably determine the sheet name without API call
-                            # Store the gid for now, we'll resolve it later if needed
-                            gid = fragment.split('=')[-1]
-                            sheet_name = f"gid_{gid}"  # Special marker for gid-based sheets
-                        elif fragment:
-                            sheet_name = fragment
-                except (ValueError, IndexError):
-                    pass
-        else:
-            # Assume it's already an ID
-            spreadsheet_id = url_or_id
-
-        return {
-            'spreadsheet_id': spreadsheet_id,
-            'sheet_name': sheet_name
-        }
\ No newline at end of file
+    # Kept on the manager for existing callers
+    extract_sheet_info = staticmethod(extract_sheet_info)
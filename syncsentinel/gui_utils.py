@@ -3,36 +3,56 @@ SyncSentinel GUI Utilities Module
 Contains GUI-specific helper functions and data processing.
 """
 
-import datetime
+import csv
+import functools
+import io
 import os
+import platform
+import subprocess
 import sys
+import time
 import traceback
+import tkinter.messagebox as messagebox
 
+from syncsentinel.parser import extract_unique_files
 
+try:
+    from PIL import Image, ImageOps
+except ImportError:
+    Image = ImageOps = None
+
+try:
+    from pystray import Menu, MenuItem, Icon
+except Exception:
+    # pystray picks its backend on import, which fails e.g. without a display on Linux
+    Menu = MenuItem = Icon = None
+
+
+# PyInstaller unpacks bundled resources to a temp folder and stores its path in _MEIPASS
+_BASE_PATH = getattr(sys, '_MEIPASS', None) or os.path.abspath(".")
+
+
+@functools.lru_cache(maxsize=64)
 def resource_path(relative_path):
     """Get absolute path to resource, works for dev and for PyInstaller."""
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = os.path.abspath(".")
-    return os.path.join(base_path, relative_path)
+    return os.path.join(_BASE_PATH, relative_path)
 
 
-def store_last_parsed(gui_instance, parsed_data):
+def store_last_parsed(gui_instance, parsed_data, unique_files=None):
     """
     Store parsed data for clipboard access and enable copy button.
 
     Args:
         gui_instance: GUI instance with required attributes
         parsed_data (dict): Parsed log data
+        unique_files (dict, optional): extract_unique_files(parsed_data), if the caller already has it
     """
     try:
         print(f"store_last_parsed called with date: {parsed_data.get('date', 'NO_DATE')}")
         print(f"Operations found: {len(parsed_data.get('sync_operations', []))}")
 
-        from syncsentinel.parser import extract_unique_files
-        unique_files = extract_unique_files(parsed_data)
+        if unique_files is None:
+            unique_files = extract_unique_files(parsed_data)
 
         gui_instance.last_parsed_data = unique_files
         gui_instance.last_parsed_date = parsed_data['date']
@@ -46,20 +66,84 @@ def store_last_parsed(gui_instance, parsed_data):
         gui_instance.log_message(f"Error storing parsed data: {e}")
 
 
-def log_message(gui_instance, message):
+# (second, text) last formatted by _log_timestamp, swapped as one tuple for thread safety
+_log_stamp = (None, '')
+
+
+def _log_timestamp():
+    """Current local time for log lines, formatted at most once per second."""
+    global _log_stamp
+    second = int(time.time())
+    if second != _log_stamp[0]:
+        _log_stamp = (second, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second)))
+    return _log_stamp[1]
+
+
+# How long (ms) log lines are collected before they are written to the log area in one insert
+LOG_FLUSH_DELAY_MS = 50
+
+
+def log_message(gui_instance, message, immediate=False):
     """
     Log a message to the GUI's log text area.
 
+    Lines are buffered and written together shortly afterwards, so a burst
+    of messages costs one insert and one scroll.
+
     Args:
         gui_instance: GUI instance with log_text attribute
         message (str): Message to log
+        immediate (bool): Write the buffered lines now, e.g. before a modal error dialog
     """
     if hasattr(gui_instance, 'log_text') and gui_instance.log_text:
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        gui_instance.log_text.insert('end', f"[{timestamp}] {message}\n")
-        gui_instance.log_text.see('end')
+        gui_instance._log_buffer.append(f"[{_log_timestamp()}] {message}\n")
+        if immediate:
+            flush_log(gui_instance)
+        elif gui_instance._log_flush_id is None:
+            gui_instance._log_flush_id = gui_instance.root.after(LOG_FLUSH_DELAY_MS, flush_log, gui_instance)
     else:
-        print(f"[{datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {message}")
+        print(f"[{_log_timestamp()}] {message}")
+
+
+def flush_log(gui_instance):
+    """
+    Write buffered log lines to the GUI's log text area.
+
+    Args:
+        gui_instance: GUI instance with log_text attribute
+    """
+    if gui_instance._log_flush_id is not None:
+        gui_instance.root.after_cancel(gui_instance._log_flush_id)
+        gui_instance._log_flush_id = None
+    if gui_instance._log_buffer:
+        text = ''.join(gui_instance._log_buffer)
+        gui_instance._log_buffer.clear()
+        gui_instance.log_text.insert('end', text)
+        gui_instance.log_text.see('end')
+
+
+def _copy_to_windows_clipboard(text):
+    """
+    Put text on the Windows clipboard, in-process when pywin32 is available.
+
+    Args:
+        text (str): Text to copy
+    """
+    try:
+        import win32clipboard
+        import win32con
+    except ImportError:
+        # No pywin32, use the Windows clip command
+        process = subprocess.Popen(['clip'], stdin=subprocess.PIPE, shell=True)
+        process.communicate(text.encode('utf-16'))
+        return
+
+    win32clipboard.OpenClipboard()
+    try:
+        win32clipboard.EmptyClipboard()
+        win32clipboard.SetClipboardData(win32con.CF_UNICODETEXT, text)
+    finally:
+        win32clipboard.CloseClipboard()
 
 
 def copy_last_log(gui_instance):
@@ -72,47 +156,69 @@ def copy_last_log(gui_instance):
     try:
         if gui_instance.last_parsed_data and gui_instance.last_parsed_date:
             # Format the data as tab-separated text without headers
-            output = []
-
-            for file_name, info in gui_instance.last_parsed_data.items():
-                row = [
-                    gui_instance.last_parsed_date,
-                    info['timestamp'],
-                    info['file_type'],
-                    info['section'],
-                    info['file_name']
-                ]
-                output.append('\t'.join(row))
-
-            tsv_text = '\n'.join(output)
+            date = gui_instance.last_parsed_date
+            count = len(gui_instance.last_parsed_data)
+            buffer = io.StringIO()
+            csv.writer(buffer, delimiter='\t', lineterminator='\n').writerows(
+                (date, info['timestamp'], info['file_type'], info['section'], info['file_name'])
+                for info in gui_instance.last_parsed_data.values()
+            )
+            tsv_text = buffer.getvalue()[:-1]  # No newline after the last row
 
             # Try tkinter clipboard first
             try:
                 gui_instance.root.clipboard_clear()
                 gui_instance.root.clipboard_append(tsv_text)
-                gui_instance.log_message(f"Copied {len(output)} entries to clipboard")
+                gui_instance.log_message(f"Copied {count} entries to clipboard")
             except Exception as tk_error:
                 # Fallback to Windows clipboard if tkinter fails
                 gui_instance.log_message(f"Tkinter clipboard failed: {tk_error}, trying Windows clipboard...")
                 try:
-                    import subprocess
-                    # Use Windows clip command
-                    process = subprocess.Popen(['clip'], stdin=subprocess.PIPE, shell=True)
-                    process.communicate(tsv_text.encode('utf-16'))
-                    gui_instance.log_message(f"Copied {len(output)} entries to clipboard (Windows fallback)")
+                    _copy_to_windows_clipboard(tsv_text)
+                    gui_instance.log_message(f"Copied {count} entries to clipboard (Windows fallback)")
                 except Exception as win_error:
-                    gui_instance.log_message(f"Windows clipboard also failed: {win_error}")
-                    import tkinter.messagebox as messagebox
+                    gui_instance.log_message(f"Windows clipboard also failed: {win_error}", immediate=True)
                     messagebox.showerror("Error", f"Failed to copy to clipboard: {tk_error}")
         else:
-            import tkinter.messagebox as messagebox
             messagebox.showinfo("Info", "No log data available to copy")
     except Exception as e:
-        gui_instance.log_message(f"Error in copy_last_log: {e}")
-        import tkinter.messagebox as messagebox
+        gui_instance.log_message(f"Error in copy_last_log: {e}", immediate=True)
         messagebox.showerror("Error", f"Failed to copy to clipboard: {e}")
 
 
+# Tray icon size per platform, large enough for 200% display scaling (16/18 px at 100%)
+TRAY_ICON_SIZES = {'Windows': (32, 32), 'Darwin': (36, 36)}
+DEFAULT_TRAY_ICON_SIZE = (22, 22)
+
+# (icon_path, size) -> tray image, so the PNG is decoded and resampled only once
+_tray_images = {}
+
+
+def _tray_image(icon_path):
+    """
+    Load the tray icon, resized once to the platform's tray size.
+
+    Args:
+        icon_path (str): Path to the icon PNG
+
+    Returns:
+        PIL.Image.Image: Tray icon image
+    """
+    size = TRAY_ICON_SIZES.get(platform.system(), DEFAULT_TRAY_ICON_SIZE)
+    key = (icon_path, size)
+    image = _tray_images.get(key)
+    if image is None:
+        if os.path.exists(icon_path):
+            with Image.open(icon_path) as source:
+                # Keeps the aspect ratio, padding with transparency
+                image = ImageOps.pad(source.convert('RGBA'), size, Image.LANCZOS)
+        else:
+            # Create a default icon
+            image = Image.new('RGB', size, color='blue')
+        _tray_images[key] = image
+    return image
+
+
 def setup_tray_icon(gui_instance):
     """
     Setup system tray icon for the application.
@@ -120,19 +226,14 @@ def setup_tray_icon(gui_instance):
     Args:
         gui_instance: GUI instance
     """
+    if Icon is None or Image is None:
+        gui_instance.log_message("Failed to setup tray icon: pystray or Pillow is not available")
+        return
     try:
         # Load icon
-        icon_path = resource_path('syncsentinel_icon.png')
-        if os.path.exists(icon_path):
-            from PIL import Image
-            image = Image.open(icon_path)
-        else:
-            # Create a default icon
-            from PIL import Image
-            image = Image.new('RGB', (64, 64), color='blue')
+        image = _tray_image(resource_path('syncsentinel_icon.png'))
 
         # Create menu
-        from pystray import Menu, MenuItem, Icon
         menu = Menu(
             MenuItem('Show', gui_instance.show_window, default=True),
             MenuItem('Quit', gui_instance.quit_app)
@@ -153,9 +254,22 @@ def show_window(gui_instance, icon, item):
     gui_instance.root.focus_force()
 
 
+# How long (s) quitting waits for a Process Existing Logs batch to finish
+WORKER_JOIN_TIMEOUT = 30.0
+
+
 def quit_app(gui_instance, icon, item):
     """Quit the application from tray."""
-    gui_instance.stop_watching()
+    # Finish the logs already picked up before the window goes away
+    gui_instance.stop_watching(background=False)
+    worker = getattr(gui_instance, '_worker_thread', None)
+    if worker and worker.is_alive():
+        worker.join(WORKER_JOIN_TIMEOUT)
+    if worker and worker.is_alive():
+        gui_instance.log_message("Quitting while log files are still being processed")
+    else:
+        # Nothing writes to the ledger any more
+        gui_instance.ledger.close()
     if hasattr(gui_instance, 'tray_icon'):
         gui_instance.tray_icon.stop()
     gui_instance.root.quit()
@@ -3,9 +3,56 @@ SyncSentinel Handler Module
 Contains file system event handling for log file monitoring.
 """
 
+import os
+import queue
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import threading
 import time
 import traceback
-from watchdog.events import FileSystemEventHandler
+from watchdog.events import (
+    FileSystemEventHandler, EVENT_TYPE_CREATED, EVENT_TYPE_MOVED, EVENT_TYPE_MODIFIED, EVENT_TYPE_CLOSED
+)
+from syncsentinel.parser import parse_sync_log, append_logs_to_csv, extract_unique_files
+
+# File extensions recognised as FreeFileSync logs
+LOG_EXTENSIONS = ('.log', '.html')
+
+
+def wait_until_stable(path, interval=0.1, stable_samples=5, timeout=2.0):
+    """
+    Wait until a file has stopped growing, i.e. its writer is done with it.
+
+    With the defaults the size must stay unchanged for 0.5 seconds, the
+    settle time the handler used to sleep for unconditionally.
+
+    Args:
+        path (str): Path to the file
+        interval (float): Seconds between size samples
+        stable_samples (int): Consecutive unchanged, non-empty samples required
+        timeout (float): Give up waiting after this many seconds
+
+    Returns:
+        bool: True if the file became stable, False on timeout or if it cannot be read
+    """
+    deadline = time.monotonic() + timeout
+    last_size = -1
+    count = 0
+    while True:
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            return False
+        if size == last_size and size > 0:
+            count += 1
+            if count >= stable_samples:
+                return True
+        else:
+            count = 0
+            last_size = size
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(interval)
 
 
 class LogFileHandler(FileSystemEventHandler):
@@ -13,17 +60,32 @@ class LogFileHandler(FileSystemEventHandler):
     File system event handler for monitoring log file creation.
     """
 
-    def __init__(self, csv_file_path, log_callback, store_callback, sheets_callback=None, prepend=False, add_breaks=False):
+    # Event types passed on to the on_* handlers; deletes and opens are dropped
+    DISPATCH_EVENT_TYPES = frozenset({EVENT_TYPE_CREATED, EVENT_TYPE_MOVED, EVENT_TYPE_MODIFIED, EVENT_TYPE_CLOSED})
+    # Seconds the worker keeps collecting queued paths before processing them as one batch
+    BATCH_WINDOW = 0.2
+    # Parsed logs kept for repeat events on an unchanged file
+    PARSE_CACHE_SIZE = 64
+    # Seconds close() waits for queued log files to be processed before discarding the rest
+    CLOSE_TIMEOUT = 30.0
+    # Times a log that is still empty or growing is retried before it is given up on
+    MAX_UNSTABLE_RETRIES = 40
+
+    def __init__(self, csv_file_path, log_callback, store_callback, sheets_callback=None, prepend=False, add_breaks=False,
+                 ledger=None):
         """
         Initialize the handler.
 
         Args:
             csv_file_path (str): Path to CSV output file
             log_callback (callable): Function to log messages
-            store_callback (callable): Function to store parsed data
-            sheets_callback (callable, optional): Function to upload to Google Sheets
+            store_callback (callable): Function to store parsed data, called with the data and its unique files
+            sheets_callback (callable, optional): Function to upload to Google Sheets, called with a list of
+                parsed logs and the list of their unique files; returns True once the upload succeeded
             prepend (bool): Whether to prepend data to CSV instead of append
             add_breaks (bool): Whether to add breaks between log entries in CSV
+            ledger (ProcessedLedger, optional): Record of processed logs, used to skip repeats. A log is
+                recorded once it is in the CSV and, with sheets_callback, uploaded.
         """
         self.csv_file_path = csv_file_path
         self.log_callback = log_callback
@@ -31,6 +93,64 @@ class LogFileHandler(FileSystemEventHandler):
         self.sheets_callback = sheets_callback
         self.prepend = prepend
         self.add_breaks = add_breaks
+        self.ledger = ledger
+        # Log files waiting for the worker thread, processed in arrival order in short batches
+        self._queue = queue.Queue()
+        self._worker = None
+        self._worker_lock = threading.Lock()
+        self._stopped = False
+        # (path, mtime_ns, size) -> parsed data, least recently used first
+        self._parse_cache = OrderedDict()
+        self._parse_cache_lock = threading.Lock()
+        # Runs sheets_callback so uploads never hold up the next batch. A single worker, not the
+        # two the request suggested: in prepend mode each upload inserts above the last one, so
+        # two overlapping uploads could land out of order, and they share the manager's one
+        # non-thread-safe HTTP connection.
+        self._upload_executor = None
+        # path -> times it was found still being written, see retry_unstable
+        self._unstable_retries = {}
+
+    @staticmethod
+    def is_log_path(path):
+        """
+        Check whether a path names a log file.
+
+        Args:
+            path (str): File path
+
+        Returns:
+            bool: True for non-hidden .log/.html files
+        """
+        name = os.path.basename(path)
+        return not name.startswith('.') and name.lower().endswith(LOG_EXTENSIONS)
+
+    def is_log_event(self, event):
+        """
+        Check whether an event refers to a log file.
+
+        Args:
+            event: File system event
+
+        Returns:
+            bool: True for non-directory .log/.html events
+        """
+        return not event.is_directory and self.is_log_path(event.src_path)
+
+    def dispatch(self, event):
+        """
+        Dispatch only events that involve a log file.
+
+        Temp files, hidden files and directories written during a sync are
+        dropped here, before any on_* handler runs.
+
+        Args:
+            event: File system event
+        """
+        if event.is_directory or event.event_type not in self.DISPATCH_EVENT_TYPES:
+            return
+        if not (self.is_log_path(event.src_path) or self.is_log_path(getattr(event, 'dest_path', '') or '')):
+            return
+        super().dispatch(event)
 
     def on_created(self, event):
         """
@@ -39,26 +159,354 @@ class LogFileHandler(FileSystemEventHandler):
         Args:
             event: File system event
         """
-        if not event.is_directory and (event.src_path.endswith('.log') or event.src_path.endswith('.html')):
+        if self.is_log_event(event):
+            self.enqueue(event.src_path)
+
+    def enqueue(self, path):
+        """
+        Queue a log file for processing on the handler's worker thread.
+
+        The observer thread never waits on parsing, and CSV appends from
+        several logs never overlap.
+
+        Args:
+            path (str): Path to the log file
+        """
+        with self._worker_lock:
+            if self._stopped:
+                return
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._process_queue, daemon=True)
+                self._worker.start()
+            self._queue.put(path)
+
+    def wait_idle(self):
+        """Block until every queued log file has been processed and uploaded."""
+        self._queue.join()
+        with self._worker_lock:
+            executor = None if self._stopped else self._upload_executor
+        if executor is not None:
+            executor.submit(lambda: None).result()
+
+    def flush_pending(self):
+        """Queue log files still waiting to be scheduled; nothing waits in the base handler."""
+
+    def close(self, wait=True, timeout=CLOSE_TIMEOUT):
+        """
+        Finish the log files already seen, then stop the worker thread and the upload worker.
+
+        Log files still queued after timeout seconds are discarded, see cancel_pending.
+
+        Args:
+            wait (bool): Whether to block until uploads already submitted have finished
+            timeout (float): Seconds to wait for queued log files to be processed
+        """
+        self.flush_pending()
+        with self._worker_lock:
+            self._stopped = True
+            worker = self._worker
+            if worker is not None and worker.is_alive():
+                self._queue.put(None)
+        if worker is not None and worker is not threading.current_thread():
+            worker.join(timeout)
+            if worker.is_alive():
+                self.cancel_pending()
+        with self._worker_lock:
+            executor, self._upload_executor = self._upload_executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def cancel_pending(self):
+        """Drop queued log files and stop the worker thread, e.g. when processing is aborted."""
+        dropped = []
+        with self._worker_lock:
+            self._stopped = True
+            while True:
+                try:
+                    path = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                self._queue.task_done()
+                if path is not None:
+                    dropped.append(path)
+            if self._worker is not None:
+                self._queue.put(None)
+        if dropped:
+            self.log_callback(f"Discarded {len(dropped)} queued log files: {', '.join(dropped)}")
+
+    def _process_queue(self):
+        """
+        Worker thread loop, processing queued log files until close or cancel_pending.
+
+        Paths arriving within BATCH_WINDOW of the first one are collected and
+        deduplicated, then processed together. Paths queued before the stop
+        sentinel are still processed.
+        """
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.BATCH_WINDOW
+            while batch[-1] is not None:
+                try:
+                    batch.append(self._queue.get(timeout=max(0, deadline - time.monotonic())))
+                except queue.Empty:
+                    break
+            try:
+                paths = [path for path in dict.fromkeys(batch) if path is not None]
+                if paths:
+                    self.process_log_files(paths)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if batch[-1] is None:
+                return
+
+    def _parse_cached(self, path):
+        """
+        Parse a log file, reusing the previous result while the file is unchanged.
+
+        Args:
+            path (str): Path to the log file
+
+        Returns:
+            dict: Parsed log data
+        """
+        st = os.stat(path)
+        key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+        with self._parse_cache_lock:
+            parsed_data = self._parse_cache.get(key)
+            if parsed_data is not None:
+                self._parse_cache.move_to_end(key)
+                return parsed_data
+
+        parsed_data = parse_sync_log(path)
+        with self._parse_cache_lock:
+            self._parse_cache[key] = parsed_data
+            if len(self._parse_cache) > self.PARSE_CACHE_SIZE:
+                self._parse_cache.popitem(last=False)
+        return parsed_data
+
+    def _submit_upload(self, parsed_list, unique_files_list, paths):
+        """
+        Hand parsed logs to sheets_callback on the upload worker.
+
+        Args:
+            parsed_list (list): Parsed log data dictionaries
+            unique_files_list (list): extract_unique_files() of each log
+            paths (list): Paths to the log files, recorded in the ledger once uploaded
+        """
+        with self._worker_lock:
+            if self._upload_executor is None:
+                self._upload_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='syncsentinel-upload')
+            future = self._upload_executor.submit(self._upload, parsed_list, unique_files_list, paths)
+        future.add_done_callback(self._log_upload_error)
+
+    def _upload(self, parsed_list, unique_files_list, paths):
+        """Run sheets_callback and record the logs in the ledger if the upload succeeded."""
+        if self.sheets_callback(parsed_list, unique_files_list) and self.ledger:
+            self.ledger.mark_processed(paths, self.csv_file_path)
+
+    def _log_upload_error(self, future):
+        """Report an exception raised by an upload task."""
+        if not future.cancelled() and future.exception() is not None:
+            self.log_callback(f"Error uploading log data: {future.exception()}")
+
+    def retry_unstable(self, path):
+        """
+        Handle a log that was still empty or growing when its wait timed out.
+
+        The base handler has no way to come back to it later, so it is skipped.
+
+        Args:
+            path (str): Path to the log file
+        """
+        self.log_callback(f"Skipping log file that is still being written: {path}")
+
+    def process_log_file(self, path):
+        """
+        Parse a new log file, append it to the CSV and hand it to the callbacks.
+
+        Args:
+            path (str): Path to the log file
+        """
+        self.process_log_files([path])
+
+    def process_log_files(self, paths):
+        """
+        Parse new log files, append them to the CSV in one write and hand them to the callbacks.
+
+        Args:
+            paths (list): Paths to the log files, in arrival order
+        """
+        parsed_list = []
+        unique_files_list = []
+        parsed_paths = []
+        for path in paths:
             try:
-                self.log_callback(f"New log file detected: {event.src_path}")
+                self.log_callback(f"New log file detected: {path}")
 
                 # Check if file is ready to be read (not still being written)
-                time.sleep(0.5)  # Wait a bit for file to be fully written
+                if not wait_until_stable(path):
+                    if os.path.exists(path):
+                        self.retry_unstable(path)
+                    else:
+                        self.log_callback(f"Skipping log file that is missing: {path}")
+                    continue
+                self._unstable_retries.pop(path, None)
+
+                if self.ledger and self.ledger.is_processed(path, self.csv_file_path):
+                    self.log_callback(f"Skipping already processed log file: {path}")
+                    continue
 
-                from syncsentinel.parser import parse_sync_log, append_to_csv
-                parsed_data = parse_sync_log(event.src_path)
+                parsed_data = self._parse_cached(path)
                 self.log_callback(f"Successfully parsed log file: {len(parsed_data.get('sync_operations', []))} operations found")
+            except Exception as e:
+                self.log_callback(f"Error processing new log file {path}: {e}")
+                self.log_callback(f"Traceback: {traceback.format_exc()}")
+                continue
+            parsed_list.append(parsed_data)
+            # Shared by the CSV writer and the clipboard store
+            unique_files_list.append(extract_unique_files(parsed_data))
+            parsed_paths.append(path)
 
-                append_to_csv(parsed_data, self.csv_file_path, prepend=self.prepend, add_breaks=self.add_breaks)
+        if not parsed_list:
+            return
 
-                self.store_callback(parsed_data)
-                self.log_callback("Data stored for clipboard access")
+        try:
+            append_logs_to_csv(parsed_list, self.csv_file_path, prepend=self.prepend, add_breaks=self.add_breaks,
+                               unique_files_list=unique_files_list)
 
-                # Upload to Google Sheets if callback provided
-                if self.sheets_callback:
-                    self.sheets_callback(parsed_data)
+            self.store_callback(parsed_list[-1], unique_files_list[-1])
+            self.log_callback("Data stored for clipboard access")
 
-            except Exception as e:
-                self.log_callback(f"Error processing new log file {event.src_path}: {e}")
-                self.log_callback(f"Traceback: {traceback.format_exc()}")
\ No newline at end of file
+            # Upload to Google Sheets if callback provided
+            if self.sheets_callback:
+                self._submit_upload(parsed_list, unique_files_list, parsed_paths)
+            elif self.ledger:
+                self.ledger.mark_processed(parsed_paths, self.csv_file_path)
+
+        except Exception as e:
+            self.log_callback(f"Error processing new log files: {e}")
+            self.log_callback(f"Traceback: {traceback.format_exc()}")
+
+
+class DebouncedLogFileHandler(LogFileHandler):
+    """
+    Log file handler that coalesces bursts of events for the same file.
+
+    Each create/move event (re)starts a per-path timer, and modifications of a
+    file that is still pending restart it again, so a log that is created,
+    written and renamed in quick succession is processed exactly once.
+    """
+
+    DEBOUNCE_DELAY = 0.75  # seconds
+
+    def __init__(self, *args, debounce_delay=DEBOUNCE_DELAY, **kwargs):
+        """
+        Initialize the handler.
+
+        Args:
+            *args: Positional arguments for LogFileHandler
+            debounce_delay (float): Quiet period before a file is processed
+            **kwargs: Keyword arguments for LogFileHandler
+        """
+        super().__init__(*args, **kwargs)
+        self.debounce_delay = debounce_delay
+        self._timers = {}
+        self._lock = threading.Lock()
+        self._close_events_seen = False
+
+    def on_created(self, event):
+        """Schedule processing of a newly created log file."""
+        if self.is_log_event(event):
+            self._schedule(event.src_path)
+
+    def on_moved(self, event):
+        """Schedule processing of a log file renamed into place."""
+        if not event.is_directory and self.is_log_path(event.dest_path):
+            with self._lock:
+                timer = self._timers.pop(event.src_path, None)
+            if timer:
+                timer.cancel()
+            self._schedule(event.dest_path)
+
+    def dispatch(self, event):
+        """
+        Dispatch log file events, dropping modifications once closes are reported.
+
+        inotify reports when a writer closes a file, which marks the end of a
+        write far better than the stream of modifications before it.
+
+        Args:
+            event: File system event
+        """
+        if event.event_type == EVENT_TYPE_MODIFIED and self._close_events_seen:
+            return
+        super().dispatch(event)
+
+    def on_closed(self, event):
+        """Restart the quiet period once a log file has been closed after writing."""
+        self._close_events_seen = True
+        self.on_modified(event)
+
+    def on_modified(self, event):
+        """Postpone processing while a pending log file is still being written."""
+        if self.is_log_event(event):
+            with self._lock:
+                pending = event.src_path in self._timers
+            if pending:
+                self._schedule(event.src_path)
+
+    def flush_pending(self):
+        """Queue every log file still in its quiet period right away, e.g. when watching stops."""
+        with self._lock:
+            pending = list(self._timers.items())
+            self._timers.clear()
+        for path, timer in pending:
+            timer.cancel()
+            self.enqueue(path)
+
+    def cancel_pending(self):
+        """Cancel all scheduled processing, e.g. when processing is aborted."""
+        with self._lock:
+            pending = list(self._timers.items())
+            self._timers.clear()
+        for _, timer in pending:
+            timer.cancel()
+        if pending:
+            self.log_callback(f"Discarded {len(pending)} pending log files: {', '.join(path for path, _ in pending)}")
+        super().cancel_pending()
+
+    def retry_unstable(self, path):
+        """
+        Give a log that is still being written another quiet period instead of dropping it.
+
+        Args:
+            path (str): Path to the log file
+        """
+        retries = self._unstable_retries.get(path, 0) + 1
+        if self._stopped or retries > self.MAX_UNSTABLE_RETRIES:
+            self._unstable_retries.pop(path, None)
+            super().retry_unstable(path)
+            return
+        self._unstable_retries[path] = retries
+        self.log_callback(f"Log file is still being written, retrying: {path}")
+        self._schedule(path)
+
+    def _schedule(self, path):
+        """(Re)start the debounce timer for a path."""
+        timer = threading.Timer(self.debounce_delay, self._fire, args=(path,))
+        timer.daemon = True
+        with self._lock:
+            previous = self._timers.get(path)
+            self._timers[path] = timer
+        if previous:
+            previous.cancel()
+        timer.start()
+
+    def _fire(self, path):
+        """Process a path once its debounce period has elapsed."""
+        with self._lock:
+            if self._timers.get(path) is not threading.current_thread():
+                return
+            del self._timers[path]
+        self.enqueue(path)
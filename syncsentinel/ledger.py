@@ -0,0 +1,85 @@
+"""
+SyncSentinel Ledger Module
+Tracks which log files have already been processed.
+"""
+
+import os
+import sqlite3
+import threading
+
+
+class ProcessedLedger:
+    """
+    SQLite record of processed log files, keyed by log path and target CSV.
+
+    A file counts as processed only while its size and modification time
+    match the recorded values, so a log that is rewritten is picked up again,
+    and only for the CSV it was written to.
+    """
+
+    def __init__(self, db_path):
+        """
+        Open (or create) the ledger database.
+
+        Args:
+            db_path (str): Path to the SQLite database file
+        """
+        # Shared by the observer and worker threads, serialized by _lock
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS processed_logs('
+                'path TEXT, target TEXT, size INT, mtime REAL, PRIMARY KEY (path, target))'
+            )
+            self._conn.commit()
+
+    def is_processed(self, path, target):
+        """
+        Check whether a log file was processed in its current state.
+
+        Args:
+            path (str): Path to the log file
+            target (str): Path to the CSV file the log is written to
+
+        Returns:
+            bool: True if the file's size and mtime match the ledger entry
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            return False
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT size, mtime FROM processed_logs WHERE path = ? AND target = ?',
+                (os.path.abspath(path), os.path.abspath(target))
+            ).fetchone()
+        return row is not None and row[0] == st.st_size and row[1] == st.st_mtime
+
+    def mark_processed(self, paths, target):
+        """
+        Record log files as processed, committing once for the whole batch.
+
+        Args:
+            paths (list): Paths to the processed log files
+            target (str): Path to the CSV file they were written to
+        """
+        target = os.path.abspath(target)
+        records = []
+        for path in paths:
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            records.append((os.path.abspath(path), target, st.st_size, st.st_mtime))
+        if not records:
+            return
+        with self._lock:
+            self._conn.executemany('INSERT OR REPLACE INTO processed_logs VALUES (?, ?, ?, ?)', records)
+            self._conn.commit()
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -9,23 +9,116 @@ import platform
 import subprocess
 import threading
 import json
+import hashlib
+import heapq
+import multiprocessing
+import queue
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
 
 import tkinter as tk
 from tkinter import filedialog, scrolledtext, messagebox
 import tkinter.ttk as ttk
 
-from syncsentinel.parser import parse_sync_log, append_to_csv
-from syncsentinel.handler import LogFileHandler
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to the standard library json module
+
+from syncsentinel.parser import parse_sync_log, append_logs_to_csv, extract_unique_files
+from syncsentinel.handler import DebouncedLogFileHandler, LogFileHandler
+from syncsentinel.ledger import ProcessedLedger
 from syncsentinel.gui_utils import (
     store_last_parsed, log_message, copy_last_log,
     setup_tray_icon, show_window, quit_app, minimize_to_tray
 )
-from syncsentinel.google_sheets import GoogleSheetsManager
 
 # Version information
 VERSION = "0.9.0"
 
+# Text of the Help > About dialog
+ABOUT_TEXT = f"""SyncSentinel v{VERSION}
+
+A comprehensive tool for monitoring and parsing FreeFileSync log files with automated CSV export and optional Google Sheets integration.
+
+Features:
+• Real-time monitoring of FreeFileSync logs
+• Dual format support (.log and .html)
+• CSV export with file type detection
+• Google Sheets integration
+• System tray support
+• Cross-platform compatibility
+
+Built with Python and Tkinter"""
+
+# Maximum number of log files offered in the "Process Existing Logs" dialog
+MAX_LISTED_LOGS = 500
+
+# Number of log files added to that dialog's list per event loop tick; the first
+# chunk fills the visible rows, the rest arrive after the dialog has painted
+LOG_LIST_CHUNK_SIZE = 100
+
+# Number of parse results kept, so re-processing unchanged or copied logs skips parsing
+PARSE_CACHE_SIZE = 256
+
+# Size (bytes) below which a log cannot hold a single "Creating file" entry,
+# so it is skipped without being parsed (empty or cut-off logs)
+MIN_LOG_SIZE = 48
+
+# How often (ms) the Tk main loop runs work posted from background threads
+UI_QUEUE_POLL_MS = 100
+
+# Dark mode colors, registered as the DARK_THEME_NAME ttk theme
+DARK_THEME_NAME = 'syncsentinel-dark'
+DARK_THEME = {
+    'bg': "#2b2b2b",
+    'fg': "#ffffff",
+    'entry_bg': "#404040",
+    'button_bg': "#505050",
+    'select_bg': "#505050",
+}
+
+# Delay (ms) used to coalesce bursts of config changes into one write
+CONFIG_SAVE_DELAY_MS = 1500
+
+# Pause in typing (ms) before the folder and CSV entries are validated
+CHECK_INPUTS_DELAY_MS = 250
+
+# How long (s) a watch folder existence check is reused
+ISDIR_CACHE_TTL = 2
+
+# Mount types treated as network shares on Linux (see /proc/self/mounts)
+NETWORK_FS_TYPES = frozenset({'nfs', 'nfs4', 'cifs', 'smb3', 'smbfs', 'fuse.sshfs', '9p'})
+
+# GetDriveTypeW result for a mapped network drive
+_DRIVE_REMOTE = 4
+
+# Platform details that do not change while the app runs
+_SYSTEM = platform.system()
+
+# Opens a file or folder with the platform's default handler
+_OPEN_FILE = {
+    'Windows': lambda path: os.startfile(path),
+    'Darwin': lambda path: subprocess.run(['open', path]),  # macOS
+}.get(_SYSTEM, lambda path: subprocess.run(['xdg-open', path]))  # Linux and others
+
+# Default FreeFileSync logs folder for this OS
+if _SYSTEM == 'Windows':
+    _DEFAULT_LOGS_PATH = os.path.join(os.path.expanduser('~'), 'AppData', 'Roaming', 'FreeFileSync', 'Logs')
+elif _SYSTEM == 'Darwin':  # macOS
+    _DEFAULT_LOGS_PATH = os.path.join(os.path.expanduser('~'), 'Library', 'Application Support', 'FreeFileSync', 'Logs')
+else:
+    _DEFAULT_LOGS_PATH = ''  # Default empty for other OS
+
+# Use proper Windows AppData location for user data
+if _SYSTEM == 'Windows':
+    _CONFIG_DIR = os.path.join(os.environ.get('APPDATA', os.path.expanduser('~')), 'SyncSentinel')
+else:
+    # For other platforms, use home directory
+    _CONFIG_DIR = os.path.join(os.path.expanduser('~'), '.syncsentinel')
+
 
 def resource_path(relative_path):
     """Get absolute path to resource, works for dev and for PyInstaller."""
@@ -37,6 +130,63 @@ def resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 
+# Window icon, resolved once
+_ICON_PATH = resource_path('syncsentinel_icon.ico')
+
+
+def _is_network_path(path):
+    """
+    Check whether a path lives on a network share.
+
+    Covers UNC paths, mapped network drives on Windows and network mounts
+    on Linux. Anything that cannot be told apart counts as local.
+
+    Args:
+        path (str): File or folder path
+
+    Returns:
+        bool: True for network shares
+    """
+    if path.startswith(('\\\\', '//')):
+        return True
+    path = os.path.abspath(path)
+    if _SYSTEM == 'Windows':
+        import ctypes
+        drive = os.path.splitdrive(path)[0]
+        return bool(drive) and ctypes.windll.kernel32.GetDriveTypeW(drive + '\\') == _DRIVE_REMOTE
+    try:
+        with open('/proc/self/mounts') as f:
+            mounts = [line.split()[1:3] for line in f]
+    except OSError:
+        return False  # Not Linux
+    # The longest mount point containing the path is the one it lives on
+    best, best_type = '', None
+    for mount_point, fs_type in mounts:
+        if (path == mount_point or path.startswith(mount_point.rstrip('/') + '/')) and len(mount_point) > len(best):
+            best, best_type = mount_point, fs_type
+    return best_type in NETWORK_FS_TYPES
+
+
+def _file_digest(path):
+    """
+    Hash a file's contents.
+
+    Args:
+        path (str): Path to the file
+
+    Returns:
+        bytes: 16-byte BLAKE2b digest, or None if the file cannot be read
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.digest()
+
+
 class MediaAssetWatcherGUI:
     """
     Main GUI application for SyncSentinel.
@@ -48,13 +198,21 @@ class MediaAssetWatcherGUI:
         self.root.title("SyncSentinel")
         self.root.geometry("900x575")
         try:
-            self.root.iconbitmap(resource_path('syncsentinel_icon.ico'))
+            # Loaded once and used by every Toplevel opened later, dialogs included
+            self.root.iconbitmap(default=_ICON_PATH)
         except Exception:
             pass  # Icon not found, continue without it
 
         # Initialize variables
         self.watching = False
         self.observer = None
+        self.event_handler = None
+        # Set while a batch is being written outside the watcher; the CSV controls stay off
+        self._busy = False
+        self._worker_thread = None
+        # Log lines waiting for the next flush_log, and its pending after() id
+        self._log_buffer = []
+        self._log_flush_id = None
         self.watch_path = ""
         self.csv_file = ""
         self.last_parsed_data = None
@@ -64,22 +222,36 @@ class MediaAssetWatcherGUI:
         self.google_sheet_name = None
         self.google_credentials = None
         self.google_sheet_url = ""
+        self._ui_queue = queue.Queue()
+        self._save_after_id = None
+        self._saved_config = None
+        self._check_after_id = None
+        self._input_state = None  # (folder_valid, csv_valid) the buttons reflect
+        self._isdir_cache = None  # (path, checked at, result)
+        self._creds_ui_state = None  # (has_credentials, is_complete) the Sheets dialog shows
+        self._status_pending = False  # update_setup_status already scheduled
+        self._status_label_alive = False  # Google Sheets dialog status label is on screen
+        self._dialog_status = None  # (text, color) the status label shows
+        # (path, size, mtime_ns) -> [content digest or None, parse_sync_log result], oldest first
+        self._parse_cache = {}
         
-        # Use proper Windows AppData location for user data
-        if platform.system() == 'Windows':
-            self.config_dir = os.path.join(os.environ.get('APPDATA', os.path.expanduser('~')), 'SyncSentinel')
-        else:
-            # For other platforms, use home directory
-            self.config_dir = os.path.join(os.path.expanduser('~'), '.syncsentinel')
+        self.config_dir = _CONFIG_DIR
         os.makedirs(self.config_dir, exist_ok=True)
         self.config_file = os.path.join(self.config_dir, 'config.json')
+        self.ledger = ProcessedLedger(os.path.join(self.config_dir, 'ledger.db'))
         
         # Settings
         self.dark_mode = False
         self.log_breaks = True
         self.prepend_mode = True
+        self.sheets_serial_dates = False
+        # Reused by every settings dialog, refreshed from the settings above when it opens
+        self.settings_dark_var = tk.BooleanVar(master=self.root)
+        self.settings_breaks_var = tk.BooleanVar(master=self.root)
+        self.settings_mode_var = tk.BooleanVar(master=self.root)
+        self.settings_serial_var = tk.BooleanVar(master=self.root)
         
-        self.sheets_manager = GoogleSheetsManager()
+        self._sheets_manager = None  # Created on first use, see sheets_manager
 
         # Load configuration
         self.load_config()
@@ -96,108 +268,107 @@ class MediaAssetWatcherGUI:
         # Setup window close handler
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
 
+        # Run widget updates posted by worker and watchdog threads
+        self.root.after(UI_QUEUE_POLL_MS, self._drain_ui_queue)
+
+    @property
+    def sheets_manager(self):
+        """Google Sheets manager, imported and created on first access."""
+        if self._sheets_manager is None:
+            from syncsentinel.google_sheets import GoogleSheetsManager
+            self._sheets_manager = GoogleSheetsManager()
+        return self._sheets_manager
+
     def setup_ui(self):
         """Setup the user interface."""
         # Create menu bar
         self.menubar = tk.Menu(self.root)
         self.root.config(menu=self.menubar)
 
-        # File menu
-        self.file_menu = tk.Menu(self.menubar, tearoff=0)
-        self.menubar.add_cascade(label="File", menu=self.file_menu)
-        self.file_menu.add_command(label="Exit", command=self.quit_app)
-
-        # Tools menu
-        self.tools_menu = tk.Menu(self.menubar, tearoff=0)
-        self.menubar.add_cascade(label="Tools", menu=self.tools_menu)
-        self.tools_menu.add_command(label="Google Sheets", command=self.show_google_sheets_dialog)
-        self.tools_menu.add_command(label="Settings", command=self.show_settings_dialog)
-
-        # Help menu
-        self.help_menu = tk.Menu(self.menubar, tearoff=0)
-        self.menubar.add_cascade(label="Help", menu=self.help_menu)
-        self.help_menu.add_command(label="About", command=self.show_about)
+        # File, Tools and Help menus, built from (attribute, label, items)
+        for attr, label, items in (
+            ('file_menu', "File", (("Exit", self.quit_app),)),
+            ('tools_menu', "Tools", (("Google Sheets", self.show_google_sheets_dialog),
+                                     ("Settings", self.show_settings_dialog))),
+            ('help_menu', "Help", (("About", self.show_about),)),
+        ):
+            menu = tk.Menu(self.menubar, tearoff=0)
+            self.menubar.add_cascade(label=label, menu=menu)
+            for item_label, command in items:
+                menu.add_command(label=item_label, command=command)
+            setattr(self, attr, menu)
 
         # Folder selection
-        self.folder_frame = tk.Frame(self.root)
+        self.folder_frame = ttk.Frame(self.root)
         self.folder_frame.pack(pady=10)
 
-        self.folder_label = tk.Label(self.folder_frame, text="Watch Folder:")
+        self.folder_label = ttk.Label(self.folder_frame, text="Watch Folder:")
         self.folder_label.pack(side=tk.LEFT)
 
-        self.folder_entry = tk.Entry(self.folder_frame, width=60)
+        self.folder_entry = ttk.Entry(self.folder_frame, width=60)
         self.folder_entry.pack(side=tk.LEFT, padx=5)
 
         # Set default path based on OS
-        if platform.system() == 'Windows':
-            default_logs_path = os.path.join(os.path.expanduser('~'), 'AppData', 'Roaming', 'FreeFileSync', 'Logs')
-        elif platform.system() == 'Darwin':  # macOS
-            default_logs_path = os.path.join(os.path.expanduser('~'), 'Library', 'Application Support', 'FreeFileSync', 'Logs')
-        else:
-            default_logs_path = ''  # Default empty for other OS
+        self.folder_entry.insert(0, _DEFAULT_LOGS_PATH)
 
-        self.folder_entry.insert(0, default_logs_path)
-
-        self.set_folder_button = tk.Button(self.folder_frame, text="Set Folder", command=self.set_folder)
+        self.set_folder_button = ttk.Button(self.folder_frame, text="Set Folder", command=self.set_folder)
         self.set_folder_button.pack(side=tk.LEFT)
 
-        self.open_folder_button = tk.Button(self.folder_frame, text="Open Folder", command=self.open_current_folder, state=tk.DISABLED)
+        self.open_folder_button = ttk.Button(self.folder_frame, text="Open Folder", command=self.open_current_folder, state=tk.DISABLED)
         self.open_folder_button.pack(side=tk.LEFT)
 
         # CSV file selection
-        self.csv_frame = tk.Frame(self.root)
+        self.csv_frame = ttk.Frame(self.root)
         self.csv_frame.pack(pady=10)
 
-        self.csv_label = tk.Label(self.csv_frame, text="CSV Output File:")
+        self.csv_label = ttk.Label(self.csv_frame, text="CSV Output File:")
         self.csv_label.pack(side=tk.LEFT)
 
-        self.csv_entry = tk.Entry(self.csv_frame, width=60)
+        self.csv_entry = ttk.Entry(self.csv_frame, width=60)
         self.csv_entry.pack(side=tk.LEFT, padx=5)
 
         # Set default CSV path inside the default watch folder
-        default_csv_path = os.path.join(default_logs_path, 'media_assets.csv') if default_logs_path else 'media_assets.csv'
+        default_csv_path = os.path.join(_DEFAULT_LOGS_PATH, 'media_assets.csv') if _DEFAULT_LOGS_PATH else 'media_assets.csv'
         self.csv_entry.insert(0, default_csv_path)
 
-        self.set_csv_button = tk.Button(self.csv_frame, text="Set File", command=self.set_csv)
+        self.set_csv_button = ttk.Button(self.csv_frame, text="Set File", command=self.set_csv)
         self.set_csv_button.pack(side=tk.LEFT)
 
-        self.open_csv_button = tk.Button(self.csv_frame, text="Open File", command=self.open_current_csv, state=tk.DISABLED)
+        self.open_csv_button = ttk.Button(self.csv_frame, text="Open File", command=self.open_current_csv, state=tk.DISABLED)
         self.open_csv_button.pack(side=tk.LEFT)
 
         # Google Sheets integration
-        self.sheets_frame = tk.Frame(self.root)
+        self.sheets_frame = ttk.Frame(self.root)
         self.sheets_frame.pack(pady=10)
 
         self.sheets_var = tk.BooleanVar()
-        self.sheets_checkbox = tk.Checkbutton(self.sheets_frame, text="Upload to Google Sheets",
-                                            variable=self.sheets_var, command=self.toggle_google_sheets)
+        self.sheets_checkbox = ttk.Checkbutton(self.sheets_frame, text="Upload to Google Sheets",
+                                             variable=self.sheets_var, command=self.toggle_google_sheets)
         self.sheets_checkbox.pack(side=tk.LEFT)
 
         # Initialize Google Sheets state
         self.update_google_sheets_ui()
 
         # Control buttons
-        self.button_frame = tk.Frame(self.root)
+        self.button_frame = ttk.Frame(self.root)
         self.button_frame.pack(pady=10)
 
-        self.start_button = tk.Button(self.button_frame, text="Start Watching", command=self.start_watching, state=tk.DISABLED)
-        self.start_button.pack(side=tk.LEFT, padx=5)
-
-        self.process_button = tk.Button(self.button_frame, text="Process Existing Logs", command=self.process_existing_logs, state=tk.DISABLED)
-        self.process_button.pack(side=tk.LEFT, padx=5)
-
-        self.stop_button = tk.Button(self.button_frame, text="Stop Watching", command=self.stop_watching, state=tk.DISABLED)
-        self.stop_button.pack(side=tk.LEFT, padx=5)
-
-        self.copy_button = tk.Button(self.button_frame, text="Copy Last Log", command=self.copy_last_log, state=tk.DISABLED)
-        self.copy_button.pack(side=tk.LEFT, padx=5)
+        for attr, text, command in (
+            ('start_button', "Start Watching", self.start_watching),
+            ('process_button', "Process Existing Logs", self.process_existing_logs),
+            ('stop_button', "Stop Watching", self.stop_watching),
+            ('copy_button', "Copy Last Log", self.copy_last_log),
+        ):
+            button = ttk.Button(self.button_frame, text=text, command=command, state=tk.DISABLED)
+            button.pack(side=tk.LEFT, padx=5)
+            setattr(self, attr, button)
 
         # Log area
-        self.log_label = tk.Label(self.root, text="Activity Log:")
+        self.log_label = ttk.Label(self.root, text="Activity Log:")
         self.log_label.pack(anchor=tk.W, padx=10)
 
         # Create a frame for the log text with scrollbars
-        self.log_frame = tk.Frame(self.root)
+        self.log_frame = ttk.Frame(self.root)
         self.log_frame.pack(padx=10, pady=5, fill=tk.BOTH, expand=True)
 
         # Create text widget with no wrap
@@ -205,19 +376,25 @@ class MediaAssetWatcherGUI:
         self.log_text.pack(fill=tk.BOTH, expand=True)
 
         # Bind entries change
-        self.folder_entry.bind('<KeyRelease>', self.check_inputs)
-        self.csv_entry.bind('<KeyRelease>', self.check_inputs)
+        self.folder_entry.bind('<KeyRelease>', self._schedule_check_inputs)
+        self.csv_entry.bind('<KeyRelease>', self._schedule_check_inputs)
         self.csv_entry.bind('<FocusOut>', self.add_csv_extension)
 
         # Check inputs initially to enable buttons if defaults are valid
         self.check_inputs()
         
-        # Apply theme
+        # Apply theme; the light theme is whatever ttk picked for this platform
+        self.style = ttk.Style(self.root)
+        self._light_theme_name = self.style.theme_use()
+        self._light_text_colors = {key: self.log_text.cget(key) for key in ('bg', 'fg', 'insertbackground')}
         if self.dark_mode:
             self.apply_dark_mode()
         else:
             self.apply_light_mode()
 
+        # Lay out the finished widget tree in one pass
+        self.root.update_idletasks()
+
     def setup_tray_icon(self):
         """Setup system tray icon."""
         setup_tray_icon(self)
@@ -243,8 +420,9 @@ class MediaAssetWatcherGUI:
         """Load configuration from file."""
         if os.path.exists(self.config_file):
             try:
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
+                with open(self.config_file, 'rb') as f:
+                    self._saved_config = f.read()
+                config = json.loads(self._saved_config)
                 self.watch_path = config.get('watch_path', self.watch_path)
                 self.csv_file = config.get('csv_file', self.csv_file)
                 self.google_sheets_enabled = config.get('google_sheets_enabled', False)
@@ -252,15 +430,21 @@ class MediaAssetWatcherGUI:
                 self.dark_mode = config.get('dark_mode', False)
                 self.log_breaks = config.get('log_breaks', True)
                 self.prepend_mode = config.get('prepend_mode', True)
+                self.sheets_serial_dates = config.get('sheets_serial_dates', False)
                 if self.google_sheet_url:
-                    sheet_info = self.sheets_manager.extract_sheet_info(self.google_sheet_url)
+                    # Plain URL parsing, the manager is only created once Sheets is used
+                    from syncsentinel.google_sheets import extract_sheet_info
+                    sheet_info = extract_sheet_info(self.google_sheet_url)
                     self.google_sheet_id = sheet_info['spreadsheet_id']
                     self.google_sheet_name = sheet_info['sheet_name']
             except Exception as e:
                 self.log_message(f"Error loading config: {e}")
 
     def save_config(self):
-        """Save configuration to file."""
+        """Save configuration to file if it changed since the last save."""
+        if self._save_after_id:
+            self.root.after_cancel(self._save_after_id)
+            self._save_after_id = None
         try:
             config = {
                 'watch_path': self.watch_path,
@@ -269,13 +453,35 @@ class MediaAssetWatcherGUI:
                 'google_sheet_url': self.google_sheet_url,
                 'dark_mode': self.dark_mode,
                 'log_breaks': self.log_breaks,
-                'prepend_mode': self.prepend_mode
+                'prepend_mode': self.prepend_mode,
+                'sheets_serial_dates': self.sheets_serial_dates
             }
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=4)
+            if orjson is not None:
+                serialized = orjson.dumps(config)
+            else:
+                serialized = json.dumps(config, separators=(',', ':')).encode()
+            if serialized == self._saved_config:
+                return
+            # Write to a temporary file and swap it in so a crash never leaves a torn config
+            tmp_file = self.config_file + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                f.write(serialized)
+            os.replace(tmp_file, self.config_file)
+            self._saved_config = serialized
         except Exception as e:
             self.log_message(f"Error saving config: {e}")
 
+    def _schedule_save(self):
+        """Save configuration shortly, coalescing repeated changes into one write."""
+        if self._save_after_id:
+            self.root.after_cancel(self._save_after_id)
+        self._save_after_id = self.root.after(CONFIG_SAVE_DELAY_MS, self._flush_save)
+
+    def _flush_save(self):
+        """Write the configuration scheduled by _schedule_save."""
+        self._save_after_id = None
+        self.save_config()
+
     def update_ui_from_config(self):
         """Update UI elements with loaded configuration."""
         if self.watch_path:
@@ -299,7 +505,7 @@ class MediaAssetWatcherGUI:
             self.folder_entry.delete(0, tk.END)
             self.folder_entry.insert(0, folder)
             self.check_inputs()
-            self.save_config()
+            self._schedule_save()
 
     def open_current_folder(self):
         if self.watch_path:
@@ -317,17 +523,12 @@ class MediaAssetWatcherGUI:
             self.csv_entry.delete(0, tk.END)
             self.csv_entry.insert(0, file_path)
             self.check_inputs()
-            self.save_config()
+            self._schedule_save()
 
     def open_current_csv(self):
         if self.csv_file and os.path.isfile(self.csv_file):
             try:
-                if platform.system() == 'Windows':
-                    os.startfile(self.csv_file)
-                elif platform.system() == 'Darwin':  # macOS
-                    subprocess.run(['open', self.csv_file])
-                else:  # Linux and others
-                    subprocess.run(['xdg-open', self.csv_file])
+                _OPEN_FILE(self.csv_file)
             except Exception as e:
                 self.log_message(f"Could not open CSV file: {e}")
         else:
@@ -336,18 +537,13 @@ class MediaAssetWatcherGUI:
     def open_folder(self, path):
         """Cross-platform function to open a folder in the file explorer."""
         try:
-            if platform.system() == 'Windows':
-                os.startfile(path)
-            elif platform.system() == 'Darwin':  # macOS
-                subprocess.run(['open', path])
-            else:  # Linux and others
-                subprocess.run(['xdg-open', path])
+            _OPEN_FILE(path)
         except Exception as e:
             self.log_message(f"Could not open folder: {e}")
 
     def add_csv_extension(self, event=None):
         csv_path = self.csv_entry.get()
-        if csv_path.strip() and not csv_path.lower().endswith('.csv'):
+        if csv_path.strip() and os.path.splitext(csv_path)[1].lower() != '.csv':
             self.csv_entry.insert(tk.END, '.csv')
             self.check_inputs()
 
@@ -366,78 +562,156 @@ class MediaAssetWatcherGUI:
             messagebox.showinfo("Google Sheets Setup Required", 
                                 "Google Sheets integration is enabled, but no sheet is configured.\n\n"
                                 "Please go to Tools → Google Sheets to configure your Google Sheet URL/ID.")
-        self.save_config()
+        self._schedule_save()
 
     def authenticate_google(self):
-        """Authenticate with Google Sheets API."""
+        """Authenticate with Google Sheets API on a background thread."""
+        self.log_message("Authenticating with Google Sheets...")
+        # Only update dialog status if dialog is open
+        if self._status_label_alive:
+            self._set_dialog_status("Authenticating...", "blue")
+            self.dialog_auth_button.config(state=tk.DISABLED)
+
+        auth_queue = queue.Queue()
+        threading.Thread(target=self._auth_worker, args=(auth_queue,), daemon=True).start()
+        self.root.after(UI_QUEUE_POLL_MS, self._check_auth_result, auth_queue)
+
+    def _auth_worker(self, auth_queue):
+        """Run the Google authentication flow and post its result."""
         try:
-            self.log_message("Authenticating with Google Sheets...")
-            # Only update dialog status if dialog is open
-            if hasattr(self, 'dialog_status_label') and self.dialog_status_label.winfo_exists():
-                self.dialog_status_label.config(text="Authenticating...", fg="blue")
-                self.root.update()
+            auth_queue.put(self.sheets_manager.authenticate())
+        except Exception as e:
+            auth_queue.put((False, e))
 
-            success, message = self.sheets_manager.authenticate()
-            if success:
-                self.log_message("Google Sheets authentication completed")
-                # Only update dialog status if dialog is open
-                if hasattr(self, 'dialog_status_label') and self.dialog_status_label.winfo_exists():
-                    self.dialog_status_label.config(text="Authentication successful", fg="green")
-                    self.update_setup_status()
+    def _check_auth_result(self, auth_queue):
+        """Poll for the authentication result and update the UI once it arrives."""
+        try:
+            success, message = auth_queue.get_nowait()
+        except queue.Empty:
+            self.root.after(UI_QUEUE_POLL_MS, self._check_auth_result, auth_queue)
+            return
 
-                # Update main window UI
-                self.update_google_sheets_ui()
-            else:
-                self.log_message(f"Google Sheets authentication failed: {message}")
-                # Only update dialog status if dialog is open
-                if hasattr(self, 'dialog_status_label') and self.dialog_status_label.winfo_exists():
-                    self.dialog_status_label.config(text=f"Authentication failed: {message}", fg="red")
-        except Exception as e:
-            self.log_message(f"Google Sheets authentication failed: {e}")
+        dialog_open = self._status_label_alive
+        if success:
+            self.log_message("Google Sheets authentication completed")
+            # Only update dialog status if dialog is open
+            if dialog_open:
+                self._set_dialog_status("Authentication successful", "green")
+                self.update_credentials_ui()
+
+            # Update main window UI
+            self.update_google_sheets_ui()
+        else:
+            self.log_message(f"Google Sheets authentication failed: {message}")
             # Only update dialog status if dialog is open
-            if hasattr(self, 'dialog_status_label') and self.dialog_status_label.winfo_exists():
-                self.dialog_status_label.config(text=f"Error: {str(e)}", fg="red")
+            if dialog_open:
+                self.dialog_auth_button.config(state=tk.NORMAL)
+                if isinstance(message, Exception):
+                    self._set_dialog_status(f"Error: {str(message)}", "red")
+                else:
+                    self._set_dialog_status(f"Authentication failed: {message}", "red")
 
     def upload_to_google_sheets(self, parsed_data):
         """Upload parsed data to Google Sheets."""
+        self.upload_batch_to_google_sheets([parsed_data])
+
+    def upload_batch_to_google_sheets(self, parsed_data_list, unique_files_list=None):
+        """
+        Upload several parsed logs to Google Sheets in one request, reusing their unique files if given.
+
+        Returns:
+            bool: True if the upload succeeded
+        """
         try:
             if not self.google_sheet_id:
                 self.log_message("No Google Sheet ID configured")
-                return
+                return False
 
             self.log_message("Uploading data to Google Sheets...")
-            success, message = self.sheets_manager.upload_data(
-                self.google_sheet_id, 
-                parsed_data, 
+            success, message = self.sheets_manager.upload_data_batch(
+                self.google_sheet_id,
+                parsed_data_list,
                 self.google_sheet_name,
                 prepend=self.prepend_mode,
-                add_breaks=self.log_breaks
+                add_breaks=self.log_breaks,
+                serial_dates=self.sheets_serial_dates,
+                unique_files_list=unique_files_list
             )
             if success:
                 self.log_message(message)
             else:
                 self.log_message(f"Failed to upload data to Google Sheets: {message}")
+            return success
         except Exception as e:
             self.log_message(f"Error uploading to Google Sheets: {e}")
+            return False
 
-    def store_last_parsed(self, parsed_data):
+    def store_last_parsed(self, parsed_data, unique_files=None):
         """Store parsed data for clipboard access."""
-        store_last_parsed(self, parsed_data)
+        self._run_on_ui(store_last_parsed, self, parsed_data, unique_files)
 
-    def log_message(self, message):
+    def log_message(self, message, immediate=False):
         """Log a message to the GUI."""
-        log_message(self, message)
+        self._run_on_ui(log_message, self, message, immediate)
+
+    def _run_on_ui(self, func, *args):
+        """Call func now on the Tk thread, or queue it when called from another thread."""
+        if threading.current_thread() is threading.main_thread():
+            func(*args)
+        else:
+            self._ui_queue.put((func, args))
+
+    def _drain_ui_queue(self):
+        """Run queued widget updates on the Tk thread and reschedule."""
+        try:
+            while True:
+                func, args = self._ui_queue.get_nowait()
+                try:
+                    func(*args)
+                except Exception as e:
+                    print(f"Error in queued UI update: {e}")
+        except queue.Empty:
+            pass
+        self.root.after(UI_QUEUE_POLL_MS, self._drain_ui_queue)
+
+    def _schedule_check_inputs(self, event=None):
+        """Validate the entries once typing pauses."""
+        if self._check_after_id:
+            self.root.after_cancel(self._check_after_id)
+        self._check_after_id = self.root.after(CHECK_INPUTS_DELAY_MS, self.check_inputs)
+
+    def _is_dir_cached(self, path):
+        """os.path.isdir, reusing the last result for the same path for ISDIR_CACHE_TTL seconds."""
+        now = time.monotonic()
+        if self._isdir_cache and self._isdir_cache[0] == path and now - self._isdir_cache[1] < ISDIR_CACHE_TTL:
+            return self._isdir_cache[2]
+        result = os.path.isdir(path)
+        self._isdir_cache = (path, now, result)
+        return result
 
     def check_inputs(self, event=None):
+        if self._check_after_id:
+            self.root.after_cancel(self._check_after_id)
+            self._check_after_id = None
+        if self.watching or self._busy:
+            return
+
         folder_path = self.folder_entry.get()
         csv_path = self.csv_entry.get()
 
-        folder_valid = os.path.isdir(folder_path)
+        folder_valid = self._is_dir_cached(folder_path)
         csv_valid = bool(csv_path.strip())
 
         if folder_valid and csv_valid:
             self.watch_path = folder_path
             self.csv_file = csv_path
+
+        # Leave the buttons alone unless their state actually changes
+        if (folder_valid, csv_valid) == self._input_state:
+            return
+        self._input_state = (folder_valid, csv_valid)
+
+        if folder_valid and csv_valid:
             self.start_button.config(state=tk.NORMAL)
             self.process_button.config(state=tk.NORMAL)
             self.open_folder_button.config(state=tk.NORMAL)
@@ -452,7 +726,44 @@ class MediaAssetWatcherGUI:
         """Copy the last parsed log data to clipboard."""
         copy_last_log(self)
 
+    def _set_busy(self, busy):
+        """Disable the controls that write to the CSV while a batch is in flight.
+
+        Args:
+            busy: True when a worker starts writing, False once it has finished.
+        """
+        self._busy = busy
+        if busy:
+            self.start_button.config(state=tk.DISABLED)
+            self.process_button.config(state=tk.DISABLED)
+            self.set_csv_button.config(state=tk.DISABLED)
+            self.csv_entry.config(state=tk.DISABLED)
+        elif not self.watching:
+            self.set_folder_button.config(state=tk.NORMAL)
+            self.set_csv_button.config(state=tk.NORMAL)
+            self.folder_entry.config(state=tk.NORMAL)
+            self.csv_entry.config(state=tk.NORMAL)
+            self._input_state = None  # Work out start/process afresh
+            self.check_inputs()
+
+    def _run_worker(self, target, *args):
+        """Run target on a background thread, keeping the CSV controls off until it returns."""
+        self._set_busy(True)
+
+        def run():
+            try:
+                target(*args)
+            finally:
+                self._run_on_ui(self._set_busy, False)
+
+        self._worker_thread = threading.Thread(target=run, daemon=True)
+        self._worker_thread.start()
+
     def start_watching(self):
+        if self._busy:
+            return
+        if self._check_after_id:
+            self.check_inputs()  # Apply any edit still waiting for its debounce
         if not self.watch_path:
             messagebox.showerror("Error", "Please select a valid folder to watch.")
             return
@@ -470,36 +781,63 @@ class MediaAssetWatcherGUI:
 
         # Start watching
         self.log_message(f"Starting to watch {self.watch_path} for new log files...")
-        sheets_callback = self.upload_to_google_sheets if self.google_sheets_enabled and self.google_sheet_id else None
-        event_handler = LogFileHandler(self.csv_file, self.log_message, self.store_last_parsed, sheets_callback, prepend=self.prepend_mode, add_breaks=self.log_breaks)
-        self.observer = Observer()
-        self.observer.schedule(event_handler, self.watch_path, recursive=False)
+        sheets_callback = self.upload_batch_to_google_sheets if self.google_sheets_enabled and self.google_sheet_id else None
+        self.event_handler = DebouncedLogFileHandler(self.csv_file, self.log_message, self.store_last_parsed, sheets_callback, prepend=self.prepend_mode, add_breaks=self.log_breaks,
+                                                     ledger=self.ledger)
+        if _is_network_path(self.watch_path):
+            # Native change notifications are unreliable on network shares, so poll instead
+            self.observer = PollingObserver(timeout=5)
+        else:
+            self.observer = Observer()
+        self.observer.schedule(self.event_handler, self.watch_path, recursive=False)
         self.observer.start()
 
-    def stop_watching(self):
+    def stop_watching(self, background=True):
+        """Stop the observer and let the handler finish the logs it already has.
+
+        Args:
+            background: Drain the handler on a worker thread, keeping the CSV
+                controls off until it is done. When False (on quit) wait here.
+        """
         if self.observer:
             self.observer.stop()
             self.observer.join()
+            self.observer = None
+        handler, self.event_handler = self.event_handler, None
+        was_watching = self.watching
         self.watching = False
-        self.start_button.config(state=tk.NORMAL)
         self.stop_button.config(state=tk.DISABLED)
-        self.process_button.config(state=tk.NORMAL)
-        self.set_folder_button.config(state=tk.NORMAL)
-        self.set_csv_button.config(state=tk.NORMAL)
-        self.open_folder_button.config(state=tk.NORMAL)
-        self.open_csv_button.config(state=tk.NORMAL)
-        self.folder_entry.config(state=tk.NORMAL)
-        self.csv_entry.config(state=tk.NORMAL)
-        self.log_message("Stopped watching.")
+        if handler is None or not background:
+            if handler:
+                handler.close()
+            if not self._busy:
+                self._set_busy(False)
+            if was_watching:
+                self.log_message("Stopped watching.")
+            return
+
+        def drain():
+            handler.close()
+            self.log_message("Stopped watching.")
+
+        self.log_message("Stopping, finishing pending log files...")
+        self._run_worker(drain)
 
     def process_existing_logs(self):
+        if self._busy:
+            return
+        if self._check_after_id:
+            self.check_inputs()  # Apply any edit still waiting for its debounce
         if not self.watch_path:
             messagebox.showerror("Error", "Please select a valid folder to watch.")
             return
 
-        # Get list of log files and sort by creation date (newest first)
-        log_files = [f for f in os.listdir(self.watch_path) if f.endswith(('.log', '.html'))]
-        log_files.sort(key=lambda x: os.path.getctime(os.path.join(self.watch_path, x)), reverse=True)
+        # Get the newest log files by creation date (newest first), one stat per file;
+        # the directory scan already tells files from folders, so that check is free
+        with os.scandir(self.watch_path) as it:
+            entries = [(e.stat().st_ctime, e.name) for e in it
+                       if LogFileHandler.is_log_path(e.name) and e.is_file()]
+        log_files = [name for _, name in heapq.nlargest(MAX_LISTED_LOGS, entries)]
 
         if not log_files:
             messagebox.showinfo("Info", "No log files found in the watch folder.")
@@ -512,45 +850,37 @@ class MediaAssetWatcherGUI:
         dialog.transient(self.root)
         dialog.grab_set()
 
-        # Listbox
-        listbox = tk.Listbox(dialog, selectmode=tk.MULTIPLE, height=15)
-        listbox.pack(pady=10, padx=10, fill=tk.BOTH, expand=True)
+        # File list
+        tree = ttk.Treeview(dialog, show='tree', selectmode='extended', height=15)
+        tree.pack(pady=10, padx=10, fill=tk.BOTH, expand=True)
 
-        for f in log_files:
-            listbox.insert(tk.END, f)
+        def fill_tree(start=0):
+            # Insert in chunks so the dialog paints before the whole list is loaded
+            if not tree.winfo_exists():
+                return
+            end = min(start + LOG_LIST_CHUNK_SIZE, len(log_files))
+            for i in range(start, end):
+                tree.insert('', 'end', iid=str(i), text=log_files[i])
+            if end < len(log_files):
+                self.root.after(1, fill_tree, end)
+
+        fill_tree()
 
         # Buttons
         button_frame = tk.Frame(dialog)
         button_frame.pack(pady=5)
 
         def on_ok():
-            selected_indices = listbox.curselection()
+            selected_indices = tree.selection()
             if not selected_indices:
                 messagebox.showwarning("Warning", "No files selected.")
                 return
 
-            selected_files = [log_files[i] for i in selected_indices]
+            selected_files = [log_files[i] for i in sorted(map(int, selected_indices))]
             dialog.destroy()
 
-            # Process selected files
-            self.log_message(f"Processing {len(selected_files)} selected log files...")
-            processed_count = 0
-            for filename in selected_files:
-                log_path = os.path.join(self.watch_path, filename)
-                self.log_message(f"Processing: {filename}")
-                try:
-                    parsed_data = parse_sync_log(log_path)
-                    append_to_csv(parsed_data, self.csv_file, prepend=self.prepend_mode, add_breaks=self.log_breaks)
-                    self.store_last_parsed(parsed_data)
-
-                    # Upload to Google Sheets if enabled
-                    if self.google_sheets_enabled and self.google_sheet_id:
-                        self.upload_to_google_sheets(parsed_data)
-
-                    processed_count += 1
-                except Exception as e:
-                    self.log_message(f"Error processing {filename}: {e}")
-            self.log_message(f"Successfully processed {processed_count} log files.")
+            # Process selected files off the Tk thread so the window stays responsive
+            self._run_worker(self._process_files_worker, selected_files)
 
         def on_cancel():
             dialog.destroy()
@@ -561,6 +891,146 @@ class MediaAssetWatcherGUI:
         cancel_button = tk.Button(button_frame, text="Cancel", command=on_cancel)
         cancel_button.pack(side=tk.LEFT, padx=5)
 
+    def _process_files_worker(self, selected_files):
+        """Parse the selected log files, write them to CSV and upload them."""
+        self.log_message(f"Processing {len(selected_files)} selected log files...")
+        processed_count = 0
+        parsed_logs = []
+        parsed_unique_files = []
+        parsed_paths = []
+        # The ledger is not consulted, a manual selection is processed as chosen
+        pending = []
+        for filename in selected_files:
+            log_path = os.path.join(self.watch_path, filename)
+            try:
+                if os.path.getsize(log_path) < MIN_LOG_SIZE:
+                    self.log_message(f"Skipping empty or incomplete log: {filename}")
+                    continue
+            except OSError:
+                pass  # Reported when parsing fails
+            # Logs parsed before, or with the same contents as one parsed before, reuse its result
+            key, cached = self._lookup_parse(log_path)
+            pending.append((filename, log_path, key, cached))
+
+        # Parsing is CPU bound, so several logs are parsed in worker processes. They are
+        # spawned rather than forked, since this process runs Tk, the observer and timers
+        # on other threads; parse_sync_log is pickled by reference to syncsentinel.parser.
+        to_parse = sum(1 for *_, cached in pending if cached is None)
+        if to_parse > 1:
+            executor = ProcessPoolExecutor(max_workers=min(to_parse, os.cpu_count() or 1),
+                                           mp_context=multiprocessing.get_context('spawn'))
+        else:
+            executor = ThreadPoolExecutor(max_workers=1)
+        with executor:
+            futures = [executor.submit(parse_sync_log, log_path) if cached is None else None
+                       for _, log_path, _, cached in pending]
+            for (filename, log_path, key, cached), future in zip(pending, futures):
+                self.log_message(f"Processing: {filename}")
+                try:
+                    if future is None:
+                        parsed_data = cached
+                    else:
+                        parsed_data = future.result()
+                        self._cache_parse_result(key, parsed_data)
+                    unique_files = extract_unique_files(parsed_data)
+                    parsed_logs.append(parsed_data)
+                    parsed_unique_files.append(unique_files)
+                    parsed_paths.append(log_path)
+
+                    processed_count += 1
+                except Exception as e:
+                    self.log_message(f"Error processing {filename}: {e}")
+
+        # Only the last log stays available for the clipboard, so store just that one
+        if parsed_logs:
+            self.store_last_parsed(parsed_logs[-1], parsed_unique_files[-1])
+
+        # Write all parsed logs to the CSV in a single pass
+        if parsed_logs:
+            try:
+                append_logs_to_csv(parsed_logs, self.csv_file, prepend=self.prepend_mode, add_breaks=self.log_breaks,
+                                   unique_files_list=parsed_unique_files)
+            except Exception as e:
+                self.log_message(f"Error writing to CSV: {e}")
+                processed_count = 0
+        self.log_message(f"Successfully processed {processed_count} log files.")
+
+        # Upload all processed logs to Google Sheets in one request if enabled
+        uploaded = True
+        if parsed_logs and self.google_sheets_enabled and self.google_sheet_id:
+            uploaded = self.upload_batch_to_google_sheets(parsed_logs, parsed_unique_files)
+
+        # Record the logs once they are in the CSV and, if enabled, the sheet
+        if processed_count and uploaded:
+            self.ledger.mark_processed(parsed_paths, self.csv_file)
+
+    def _lookup_parse(self, log_path):
+        """
+        Find a cached parse result for a log file.
+
+        An unchanged file is found by its (path, size, mtime) stamp without
+        reading it. Only when a cached log has the same size are both files
+        hashed, to catch copies with identical contents.
+
+        Args:
+            log_path (str): Path to the log file
+
+        Returns:
+            tuple: (cache key for _cache_parse_result, cached result or None). The key is None
+                if the file cannot be read.
+        """
+        try:
+            st = os.stat(log_path)
+        except OSError:
+            return None, None
+        stamp = (os.path.abspath(log_path), st.st_size, st.st_mtime_ns)
+        entry = self._parse_cache.get(stamp)
+        if entry is not None:
+            return (stamp, entry[0]), entry[1]
+
+        same_size = [other for other in self._parse_cache if other[1] == st.st_size]
+        if not same_size:
+            return (stamp, None), None
+        digest = _file_digest(log_path)
+        for other in same_size:
+            entry = self._parse_cache[other]
+            if entry[0] is None:
+                entry[0] = self._stamp_digest(other)
+                if entry[0] is None:
+                    del self._parse_cache[other]  # Changed or gone since it was parsed
+                    continue
+            if digest is not None and entry[0] == digest:
+                self._cache_parse_result((stamp, digest), entry[1])
+                return (stamp, digest), entry[1]
+        return (stamp, digest), None
+
+    @staticmethod
+    def _stamp_digest(stamp):
+        """Hash the file a cache stamp refers to, or None if it has changed since."""
+        path, size, mtime_ns = stamp
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        if (st.st_size, st.st_mtime_ns) != (size, mtime_ns):
+            return None
+        return _file_digest(path)
+
+    def _cache_parse_result(self, key, parsed_data):
+        """
+        Remember a parse result, dropping the oldest beyond PARSE_CACHE_SIZE.
+
+        Args:
+            key (tuple): (stamp, digest) from _lookup_parse, or None if the file could not be read
+            parsed_data (dict): Result of parse_sync_log
+        """
+        if key is None:
+            return
+        stamp, digest = key
+        self._parse_cache[stamp] = [digest, parsed_data]
+        while len(self._parse_cache) > PARSE_CACHE_SIZE:
+            del self._parse_cache[next(iter(self._parse_cache))]
+
     def show_google_sheets_dialog(self):
         """Show the Google Sheets configuration dialog."""
         dialog = tk.Toplevel(self.root)
@@ -568,13 +1038,9 @@ class MediaAssetWatcherGUI:
         dialog.geometry("700x600")
         dialog.transient(self.root)
         dialog.grab_set()
-        try:
-            dialog.iconbitmap(resource_path('syncsentinel_icon.ico'))
-        except Exception:
-            pass  # Icon not found, continue without it
 
         # Create notebook for tabs
-        notebook = tk.ttk.Notebook(dialog)
+        notebook = ttk.Notebook(dialog)
         notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
         # Google Sheets tab
@@ -683,11 +1149,19 @@ class MediaAssetWatcherGUI:
         # Status label
         self.dialog_status_label = tk.Label(creds_frame, text="", fg="blue")
         self.dialog_status_label.pack(anchor=tk.W, pady=5)
+        self._status_label_alive = True
+        self._dialog_status = ("", "blue")
+        # <Destroy> also fires for every child, so only react to the dialog itself
+        dialog.bind('<Destroy>', lambda e: e.widget is dialog and setattr(self, '_status_label_alive', False))
 
         # Update dialog state
         self.toggle_dialog_sheets()
 
-        # Update credentials UI
+        # Update credentials UI for the freshly built dialog
+        self._cid_frame = self.client_id_entry.master
+        self._csecret_frame = self.client_secret_entry.master
+        self._pid_frame = self.project_id_entry.master
+        self._creds_ui_state = None
         self.update_credentials_ui()
 
         # Check setup status
@@ -746,61 +1220,137 @@ class MediaAssetWatcherGUI:
             project_id = self.project_id_entry.get().strip()
 
             if not all([client_id, client_secret, project_id]):
-                self.dialog_status_label.config(text="Please fill in all credential fields", fg="red")
+                self._set_dialog_status("Please fill in all credential fields", "red")
                 return
 
-            self.dialog_status_label.config(text="Downloading credentials...", fg="blue")
-            self.root.update()
+            self._set_dialog_status("Downloading credentials...", "blue")
+            self.download_button.config(state=tk.DISABLED)
 
-            if self.sheets_manager.download_credentials(client_id, client_secret, project_id):
-                self.dialog_status_label.config(text="Credentials downloaded successfully!", fg="green")
-                self.log_message("Google Sheets credentials downloaded and encrypted")
+            threading.Thread(target=self._download_credentials_worker,
+                             args=(client_id, client_secret, project_id), daemon=True).start()
 
-                # Show popup confirmation
-                messagebox.showinfo("Credentials Downloaded",
-                                  "Google Sheets credentials have been successfully downloaded and encrypted!\n\n"
-                                  "You can now proceed to the Configuration section to enable Google Sheets upload and authenticate.")
+        except Exception as e:
+            self._set_dialog_status(f"Error: {str(e)}", "red")
+            self.log_message(f"Error downloading credentials: {e}")
 
-                # Clear the credential fields for security
-                self.client_id_entry.delete(0, tk.END)
-                self.client_secret_entry.delete(0, tk.END)
-                self.project_id_entry.delete(0, tk.END)
+    def _download_credentials_worker(self, client_id, client_secret, project_id):
+        """Encrypt and save the credentials, then report back on the Tk thread."""
+        try:
+            result = self.sheets_manager.download_credentials(client_id, client_secret, project_id)
+        except Exception as e:
+            result = e
+        self._run_on_ui(self._on_credentials_downloaded, result)
+
+    def _on_credentials_downloaded(self, result):
+        """Update the Google Sheets dialog once credentials have been saved."""
+        if isinstance(result, Exception):
+            self.log_message(f"Error downloading credentials: {result}")
+        elif result:
+            self.log_message("Google Sheets credentials downloaded and encrypted")
+
+        # Nothing else to update if the dialog was closed meanwhile
+        if not self._status_label_alive:
+            return
+        self.download_button.config(state=tk.NORMAL)
 
-                # Update UI to show credentials are active
-                self.update_credentials_ui()
+        if isinstance(result, Exception):
+            self._set_dialog_status(f"Error: {str(result)}", "red")
+        elif result:
+            self._set_dialog_status("Credentials downloaded successfully!", "green")
 
-                # Update setup status
-                self.update_setup_status()
-            else:
-                self.dialog_status_label.config(text="Failed to download credentials", fg="red")
+            # Show popup confirmation
+            messagebox.showinfo("Credentials Downloaded",
+                              "Google Sheets credentials have been successfully downloaded and encrypted!\n\n"
+                              "You can now proceed to the Configuration section to enable Google Sheets upload and authenticate.")
 
-        except Exception as e:
-            self.dialog_status_label.config(text=f"Error: {str(e)}", fg="red")
-            self.log_message(f"Error downloading credentials: {e}")
+            # Clear the credential fields for security
+            self.client_id_entry.delete(0, tk.END)
+            self.client_secret_entry.delete(0, tk.END)
+            self.project_id_entry.delete(0, tk.END)
 
-    def remove_credentials(self):
-        """Remove Google Sheets credentials."""
-        try:
-            # Confirm removal
-            if not messagebox.askyesno("Remove Credentials",
-                                     "Are you sure you want to remove the Google Sheets credentials?\n\n"
-                                     "This will delete the encrypted credentials and you will need to re-enter them."):
-                return
+            # Update UI to show credentials are active
+            self.update_credentials_ui()
 
-            # Remove credential files
-            import os
-            files_to_remove = [
-                self.sheets_manager.ENCRYPTED_CREDENTIALS_FILE,
-                self.sheets_manager.CREDENTIALS_FILE,
-                self.sheets_manager.TOKEN_FILE,
-                self.sheets_manager.KEY_FILE
-            ]
+            # Update setup status
+            self.update_setup_status()
+        else:
+            self._set_dialog_status("Failed to download credentials", "red")
+
+    def _confirm_async(self, title, message, on_yes):
+        """
+        Ask a Yes/No question in a modal Toplevel without a nested event loop.
+
+        Args:
+            title (str): Dialog title
+            message (str): Question to show
+            on_yes (callable): Called with no arguments if the user clicks Yes
+        """
+        # Hand the grab back to whichever dialog held it, e.g. the Google Sheets dialog
+        previous_grab = self.root.grab_current()
+        parent = previous_grab or self.root
+        dialog = tk.Toplevel(parent)
+        dialog.title(title)
+        dialog.transient(parent)
+        dialog.resizable(False, False)
+
+        frame = ttk.Frame(dialog, padding=10)
+        frame.pack(fill=tk.BOTH, expand=True)
+        ttk.Label(frame, text=message, wraplength=360, justify=tk.LEFT).pack(anchor=tk.W, pady=(0, 10))
+
+        button_frame = ttk.Frame(frame)
+        button_frame.pack()
+
+        def close(confirmed):
+            dialog.grab_release()
+            dialog.destroy()
+            if previous_grab is not None and previous_grab.winfo_exists():
+                previous_grab.grab_set()
+            if confirmed:
+                on_yes()
+
+        yes_button = ttk.Button(button_frame, text="Yes", command=lambda: close(True))
+        yes_button.pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="No", command=lambda: close(False)).pack(side=tk.LEFT, padx=5)
+        dialog.protocol("WM_DELETE_WINDOW", lambda: close(False))
+        dialog.bind('<Escape>', lambda e: close(False))
+
+        dialog.grab_set()
+        yes_button.focus_set()
 
+    def remove_credentials(self):
+        """Remove Google Sheets credentials after the user confirms."""
+        self._confirm_async("Remove Credentials",
+                            "Are you sure you want to remove the Google Sheets credentials?\n\n"
+                            "This will delete the encrypted credentials and you will need to re-enter them.",
+                            self._remove_credential_files)
+
+    def _remove_credential_files(self):
+        """Delete the stored credential files and refresh the credentials UI."""
+        try:
+            # Stop the token refresh first, it would write token.json again
+            self.sheets_manager.clear_credentials()
+            # Remove credential files. On a network home directory each unlink waits on a
+            # round trip, so they are removed in parallel there; locally a pool costs more
             removed_count = 0
-            for file_path in files_to_remove:
-                if os.path.exists(file_path):
-                    os.remove(file_path)
+            file_paths = self.sheets_manager.credential_files
+            if _is_network_path(self.sheets_manager.base_dir):
+                with ThreadPoolExecutor(max_workers=len(file_paths)) as pool:
+                    futures = [pool.submit(os.remove, file_path) for file_path in file_paths]
+                errors = [future.exception() for future in futures]
+            else:
+                errors = []
+                for file_path in file_paths:
+                    try:
+                        os.remove(file_path)
+                        errors.append(None)
+                    except OSError as e:
+                        errors.append(e)
+            for file_path, error in zip(file_paths, errors):
+                if error is None:
                     removed_count += 1
+                elif not isinstance(error, FileNotFoundError):
+                    self.log_message(f"Could not remove {file_path}: {error}")
+            self.sheets_manager.invalidate_status_cache()
 
             if removed_count > 0:
                 self.log_message(f"Removed {removed_count} credential files")
@@ -823,15 +1373,18 @@ class MediaAssetWatcherGUI:
         has_credentials = self.sheets_manager.has_credentials()
         is_complete = self.sheets_manager.is_setup_complete()
 
+        # Skip the repacking when the dialog already shows this state
+        state = (has_credentials, is_complete)
+        if self._creds_ui_state == state:
+            self.update_setup_status()
+            return
+        self._creds_ui_state = state
+
         if has_credentials:
             # Hide input fields and their labels
-            client_id_frame = self.client_id_entry.master
-            client_secret_frame = self.client_secret_entry.master
-            project_id_frame = self.project_id_entry.master
-
-            client_id_frame.pack_forget()
-            client_secret_frame.pack_forget()
-            project_id_frame.pack_forget()
+            self._cid_frame.pack_forget()
+            self._csecret_frame.pack_forget()
+            self._pid_frame.pack_forget()
             self.download_button.pack_forget()
 
             # Show remove button
@@ -848,13 +1401,9 @@ class MediaAssetWatcherGUI:
             self.update_setup_status()
         else:
             # Show input fields and their labels
-            client_id_frame = self.client_id_entry.master
-            client_secret_frame = self.client_secret_entry.master
-            project_id_frame = self.project_id_entry.master
-
-            client_id_frame.pack(fill=tk.X, pady=2)
-            client_secret_frame.pack(fill=tk.X, pady=2)
-            project_id_frame.pack(fill=tk.X, pady=2)
+            self._cid_frame.pack(fill=tk.X, pady=2)
+            self._csecret_frame.pack(fill=tk.X, pady=2)
+            self._pid_frame.pack(fill=tk.X, pady=2)
             self.download_button.pack(side=tk.LEFT, padx=(0, 5))
 
             # Hide remove button
@@ -878,7 +1427,7 @@ class MediaAssetWatcherGUI:
         self.dialog_sheets_entry.config(state=tk.NORMAL)
         self.set_sheet_button.config(state=tk.NORMAL)
         
-        self.save_config()
+        self._schedule_save()
         self.log_message("Google Sheet URL cleared")
         self.update_setup_status()
 
@@ -886,12 +1435,16 @@ class MediaAssetWatcherGUI:
         """Set the Google Sheet from the entered URL/ID."""
         url_or_id = self.dialog_sheets_entry.get().strip()
         if url_or_id:
-            sheet_info = self.sheets_manager.extract_sheet_info(url_or_id)
+            if url_or_id == self.google_sheet_url and self.google_sheet_id:
+                # Already configured from this URL, reuse the parsed values
+                sheet_info = {'spreadsheet_id': self.google_sheet_id, 'sheet_name': self.google_sheet_name}
+            else:
+                sheet_info = self.sheets_manager.extract_sheet_info(url_or_id)
             if sheet_info['spreadsheet_id']:
                 self.google_sheet_id = sheet_info['spreadsheet_id']
                 self.google_sheet_name = sheet_info['sheet_name']
                 self.google_sheet_url = url_or_id
-                self.save_config()
+                self._schedule_save()
                 self.log_message(f"Sheet ID configured: {self.google_sheet_id}")
                 if self.google_sheet_name:
                     self.log_message(f"Target sheet: {self.google_sheet_name}")
@@ -901,71 +1454,99 @@ class MediaAssetWatcherGUI:
                 self.set_sheet_button.config(state=tk.DISABLED)
                 
                 # Update dialog status
-                if hasattr(self, 'dialog_status_label') and self.dialog_status_label.winfo_exists():
+                if self._status_label_alive:
                     self.update_setup_status()
             else:
                 self.log_message("Invalid Google Sheets URL or ID")
-                if hasattr(self, 'dialog_status_label') and self.dialog_status_label.winfo_exists():
-                    self.dialog_status_label.config(text="Invalid Sheet ID/URL", fg="red")
+                if self._status_label_alive:
+                    self._set_dialog_status("Invalid Sheet ID/URL", "red")
         else:
             self.log_message("No Sheet ID/URL provided")
-            if hasattr(self, 'dialog_status_label') and self.dialog_status_label.winfo_exists():
-                self.dialog_status_label.config(text="Please enter Sheet ID/URL", fg="orange")
+            if self._status_label_alive:
+                self._set_dialog_status("Please enter Sheet ID/URL", "orange")
 
     def update_setup_status(self):
-        """Update the setup status in the Google Sheets dialog."""
-        if hasattr(self, 'dialog_status_label'):
+        """Update the setup status in the Google Sheets dialog once the current burst of changes is done."""
+        if self._status_pending:
+            return
+        self._status_pending = True
+        self.root.after_idle(self._do_update_setup_status)
+
+    def _set_dialog_status(self, text, color):
+        """
+        Show a message in the Google Sheets dialog status label unless it is already shown.
+
+        Args:
+            text (str): Status message
+            color (str): Text color
+        """
+        if (text, color) == self._dialog_status:
+            return
+        self._dialog_status = (text, color)
+        self.dialog_status_label.config(text=text, fg=color)
+
+    def _do_update_setup_status(self):
+        """Show the current setup status in the Google Sheets dialog."""
+        self._status_pending = False
+        if self._status_label_alive:
             if self.sheets_manager.is_setup_complete() and self.google_sheet_id:
-                self.dialog_status_label.config(text="✓ Fully configured", fg="green")
+                self._set_dialog_status("✓ Fully configured", "green")
             elif self.sheets_manager.is_setup_complete():
-                self.dialog_status_label.config(text="Authenticated - Set Sheet ID/URL", fg="blue")
+                self._set_dialog_status("Authenticated - Set Sheet ID/URL", "blue")
             elif self.sheets_manager.has_credentials():
-                self.dialog_status_label.config(text="Credentials available - Click Authenticate Credentials", fg="blue")
+                self._set_dialog_status("Credentials available - Click Authenticate Credentials", "blue")
             else:
-                self.dialog_status_label.config(text="Setup required - Follow instructions above", fg="orange")
+                self._set_dialog_status("Setup required - Follow instructions above", "orange")
 
     def show_settings_dialog(self):
         """Show the settings dialog for application preferences."""
         dialog = tk.Toplevel(self.root)
         dialog.title("Settings")
-        dialog.geometry("400x300")
+        dialog.geometry("440x330")
         dialog.transient(self.root)
         dialog.grab_set()
-        try:
-            dialog.iconbitmap(resource_path('syncsentinel_icon.ico'))
-        except Exception:
-            pass  # Icon not found, continue without it
+
+        # ttk widgets follow the theme, the Toplevel behind them does not
+        dialog.configure(bg=self.style.lookup('TFrame', 'background'))
 
         # Settings frame
-        settings_frame = tk.LabelFrame(dialog, text="Application Settings", padx=10, pady=10)
+        settings_frame = ttk.LabelFrame(dialog, text="Application Settings", padding=10)
         settings_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
         # Dark mode setting
-        dark_frame = tk.Frame(settings_frame)
+        dark_frame = ttk.Frame(settings_frame)
         dark_frame.pack(fill=tk.X, pady=5)
-        self.settings_dark_var = tk.BooleanVar(value=self.dark_mode)
-        dark_checkbox = tk.Checkbutton(dark_frame, text="Dark Mode", variable=self.settings_dark_var)
+        self.settings_dark_var.set(self.dark_mode)
+        dark_checkbox = ttk.Checkbutton(dark_frame, text="Dark Mode", variable=self.settings_dark_var)
         dark_checkbox.pack(side=tk.LEFT)
-        tk.Label(dark_frame, text="(experimental)").pack(side=tk.LEFT, padx=(5, 0))
+        ttk.Label(dark_frame, text="(experimental)").pack(side=tk.LEFT, padx=(5, 0))
 
         # Log breaks setting
-        breaks_frame = tk.Frame(settings_frame)
+        breaks_frame = ttk.Frame(settings_frame)
         breaks_frame.pack(fill=tk.X, pady=5)
-        self.settings_breaks_var = tk.BooleanVar(value=self.log_breaks)
-        breaks_checkbox = tk.Checkbutton(breaks_frame, text="Insert breaks between log entries (CSV & Google Sheets)", 
-                                       variable=self.settings_breaks_var)
+        self.settings_breaks_var.set(self.log_breaks)
+        breaks_checkbox = ttk.Checkbutton(breaks_frame, text="Insert breaks between log entries (CSV & Google Sheets)", 
+                                        variable=self.settings_breaks_var)
         breaks_checkbox.pack(side=tk.LEFT)
 
         # Prepend/Append setting
-        mode_frame = tk.Frame(settings_frame)
+        mode_frame = ttk.Frame(settings_frame)
         mode_frame.pack(fill=tk.X, pady=5)
-        self.settings_mode_var = tk.BooleanVar(value=self.prepend_mode)
-        mode_checkbox = tk.Checkbutton(mode_frame, text="Prepend data (uncheck for append) - CSV & Google Sheets", 
-                                     variable=self.settings_mode_var)
+        self.settings_mode_var.set(self.prepend_mode)
+        mode_checkbox = ttk.Checkbutton(mode_frame, text="Prepend data (uncheck for append) - CSV & Google Sheets", 
+                                      variable=self.settings_mode_var)
         mode_checkbox.pack(side=tk.LEFT)
 
+        # Google Sheets date format setting
+        serial_frame = ttk.Frame(settings_frame)
+        serial_frame.pack(fill=tk.X, pady=5)
+        self.settings_serial_var.set(self.sheets_serial_dates)
+        serial_checkbox = ttk.Checkbutton(serial_frame, text="Send dates as numbers (format Google Sheets columns as Date/Time)",
+                                          variable=self.settings_serial_var)
+        serial_checkbox.pack(side=tk.LEFT)
+
         # Buttons
-        button_frame = tk.Frame(dialog)
+        button_frame = ttk.Frame(dialog)
         button_frame.pack(pady=10)
 
         def on_ok():
@@ -973,6 +1554,7 @@ class MediaAssetWatcherGUI:
             self.dark_mode = self.settings_dark_var.get()
             self.log_breaks = self.settings_breaks_var.get()
             self.prepend_mode = self.settings_mode_var.get()
+            self.sheets_serial_dates = self.settings_serial_var.get()
             self.save_config()
             
             # Apply dark mode if changed
@@ -986,94 +1568,63 @@ class MediaAssetWatcherGUI:
         def on_cancel():
             dialog.destroy()
 
-        ok_button = tk.Button(button_frame, text="OK", command=on_ok)
+        ok_button = ttk.Button(button_frame, text="OK", command=on_ok)
         ok_button.pack(side=tk.LEFT, padx=5)
 
-        cancel_button = tk.Button(button_frame, text="Cancel", command=on_cancel)
+        cancel_button = ttk.Button(button_frame, text="Cancel", command=on_cancel)
         cancel_button.pack(side=tk.LEFT, padx=5)
 
     def apply_dark_mode(self):
         """Apply dark mode theme to the application."""
         try:
-            # Dark colors
-            bg_color = "#2b2b2b"
-            fg_color = "#ffffff"
-            entry_bg = "#404040"
-            button_bg = "#505050"
-            
-            # Apply to main window
-            self.root.configure(bg=bg_color)
-            
-            # Apply to frames
-            for widget in self.root.winfo_children():
-                if isinstance(widget, tk.Frame):
-                    widget.configure(bg=bg_color)
-                elif isinstance(widget, tk.Label):
-                    widget.configure(bg=bg_color, fg=fg_color)
-                elif isinstance(widget, tk.Button):
-                    widget.configure(bg=button_bg, fg=fg_color)
-                elif isinstance(widget, tk.Entry):
-                    widget.configure(bg=entry_bg, fg=fg_color, insertbackground=fg_color)
-                elif isinstance(widget, tk.Checkbutton):
-                    widget.configure(bg=bg_color, fg=fg_color, selectcolor=button_bg)
-                elif isinstance(widget, tk.Text):
-                    widget.configure(bg=entry_bg, fg=fg_color, insertbackground=fg_color)
-            
-            # Apply to log text specifically
-            if hasattr(self, 'log_text'):
-                self.log_text.configure(bg=entry_bg, fg=fg_color)
-                
+            self._apply_theme(dark=True)
         except Exception as e:
             self.log_message(f"Error applying dark mode: {e}")
 
     def apply_light_mode(self):
         """Apply light mode theme to the application."""
         try:
-            # Light colors (default)
-            bg_color = "SystemButtonFace"
-            fg_color = "SystemWindowText"
-            
-            # Apply to main window
-            self.root.configure(bg=bg_color)
-            
-            # Apply to frames and widgets
-            for widget in self.root.winfo_children():
-                if isinstance(widget, tk.Frame):
-                    widget.configure(bg=bg_color)
-                elif isinstance(widget, tk.Label):
-                    widget.configure(bg=bg_color, fg=fg_color)
-                elif isinstance(widget, tk.Button):
-                    widget.configure(bg="SystemButtonFace", fg=fg_color)
-                elif isinstance(widget, tk.Entry):
-                    widget.configure(bg="SystemWindow", fg=fg_color, insertbackground="SystemWindowText")
-                elif isinstance(widget, tk.Checkbutton):
-                    widget.configure(bg=bg_color, fg=fg_color, selectcolor="SystemWindow")
-                elif isinstance(widget, tk.Text):
-                    widget.configure(bg="SystemWindow", fg=fg_color, insertbackground="SystemWindowText")
-            
-            # Apply to log text specifically
-            if hasattr(self, 'log_text'):
-                self.log_text.configure(bg="SystemWindow", fg=fg_color)
-                
+            self._apply_theme(dark=False)
         except Exception as e:
             self.log_message(f"Error applying light mode: {e}")
 
+    def _apply_theme(self, dark):
+        """
+        Switch the ttk theme and recolor the few plain Tk widgets to match.
+
+        Args:
+            dark (bool): True for the dark palette, False for the platform default
+        """
+        if dark:
+            if DARK_THEME_NAME not in self.style.theme_names():
+                self._create_dark_theme()
+            self.style.theme_use(DARK_THEME_NAME)
+            self.log_text.configure(bg=DARK_THEME['entry_bg'], fg=DARK_THEME['fg'],
+                                    insertbackground=DARK_THEME['fg'])
+        else:
+            self.style.theme_use(self._light_theme_name)
+            self.log_text.configure(**self._light_text_colors)
+
+        # Apply to main window
+        self.root.configure(bg=self.style.lookup('TFrame', 'background'))
+
+    def _create_dark_theme(self):
+        """Register the dark ttk theme built from DARK_THEME."""
+        bg_color = DARK_THEME['bg']
+        fg_color = DARK_THEME['fg']
+        self.style.theme_create(DARK_THEME_NAME, parent='clam', settings={
+            '.': {'configure': {'background': bg_color, 'foreground': fg_color,
+                                'fieldbackground': DARK_THEME['entry_bg'], 'insertcolor': fg_color}},
+            'TButton': {'configure': {'background': DARK_THEME['button_bg']},
+                        'map': {'background': [('active', DARK_THEME['entry_bg'])]}},
+            'TCheckbutton': {'configure': {'indicatorbackground': DARK_THEME['select_bg']},
+                             'map': {'background': [('active', bg_color)]}},
+            'TEntry': {'map': {'fieldbackground': [('disabled', bg_color)]}},
+        })
+
     def show_about(self):
         """Show the about dialog."""
-        about_text = f"""SyncSentinel v{VERSION}
-
-A comprehensive tool for monitoring and parsing FreeFileSync log files with automated CSV export and optional Google Sheets integration.
-
-Features:
-• Real-time monitoring of FreeFileSync logs
-• Dual format support (.log and .html)
-• CSV export with file type detection
-• Google Sheets integration
-• System tray support
-• Cross-platform compatibility
-
-Built with Python and Tkinter"""
-        messagebox.showinfo("About SyncSentinel", about_text)
+        messagebox.showinfo("About SyncSentinel", ABOUT_TEXT)
 
 
 def main():
@@ -1087,4 +1638,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Lets the frozen executable act as a worker for the log parsing process pool
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
@@ -6,6 +6,31 @@ Contains log parsing and CSV writing functionality.
 import re
 import csv
 import os
+import shutil
+import sys
+
+# Patterns used by parse_sync_log, compiled once at import
+_RE_HTML_NAME = re.compile(r'<span style="font-weight:600; color:gray;">([^<]+)</span>')
+_RE_HTML_DATE = re.compile(r'(\d+/\d+/\d+)')
+_RE_HTML_START = re.compile(r'(\d+:\d+:\d+ \w+)</span>')
+# A message row's timestamp cell or a "Creating file" message, in document order
+_RE_HTML_ROW = re.compile(r'<td valign="top">(\d+:\d+:\d+ \w+)</td>|Creating file &quot;([^&]+)&quot;')
+# The .log patterns scan the whole file in MULTILINE mode; [^\S\n] is whitespace
+# that stays on one line, the way the old per-line matching behaved
+_RE_HEADER = re.compile(r"^[^\S\n]*(.+) (\d+/\d+/\d+) \[(\d+:\d+:\d+ \w+)\]", re.M)
+_RE_ITEMS = re.compile(r'^[^\S\n]*\|    Items processed: (\d+) \(([\d.]+ \w+)\)', re.M)
+_RE_TOTAL = re.compile(r'^[^\S\n]*\|    Total time: (\d+:\d+:\d+)', re.M)
+_RE_COMPARE = re.compile(
+    r'Info:[^\S\n]+Comparison finished: ([\d,]+) items found – Time elapsed: (\d+:\d+:\d+)')
+# A folder pair line followed by its source and destination lines; an empty
+# destination must still be a line of its own, not the end of a truncated file
+_RE_FOLDER_PAIR = re.compile(r'Synchronizing folder pair: Update >.*\n(.*)\n(.*)(?:(?<=[^\n])|(?=\n))')
+# Leading timestamp and created file path of a "Creating file" line, in one match
+_RE_CREATE = re.compile(r'^[^\S\n]*\[(\d+:\d+:\d+ \w+)\].*?Info:[^\S\n]+Creating file "(.+)"', re.M)
+
+# Summary fields of a parsed log, None until found
+_LOG_DATA_KEYS = ('sync_name', 'date', 'start_time', 'items_processed', 'total_size', 'total_time',
+                  'comparison_items', 'comparison_time')
 
 
 def parse_sync_log(log_file_path):
@@ -23,43 +48,35 @@ def parse_sync_log(log_file_path):
 
     if log_file_path.lower().endswith('.html'):
         # Parse HTML format
-        data = {
-            'sync_name': None,
-            'date': None,
-            'start_time': None,
-            'items_processed': None,
-            'total_size': None,
-            'total_time': None,
-            'comparison_items': None,
-            'comparison_time': None,
-            'sync_operations': []
-        }
+        data = dict.fromkeys(_LOG_DATA_KEYS)
+        data['sync_operations'] = []
 
         # Extract sync name
-        name_match = re.search(r'<span style="font-weight:600; color:gray;">([^<]+)</span>', content)
+        name_match = _RE_HTML_NAME.search(content)
         if name_match:
             data['sync_name'] = name_match.group(1)
 
         # Extract date
-        date_match = re.search(r'(\d+/\d+/\d+)', content)
+        date_match = _RE_HTML_DATE.search(content)
         if date_match:
             data['date'] = date_match.group(1)
 
         # Extract start time
-        time_match = re.search(r'(\d+:\d+:\d+ \w+)</span>', content)
+        time_match = _RE_HTML_START.search(content)
         if time_match:
             data['start_time'] = time_match.group(1)
 
-        # Extract file creations
-        timestamps = re.findall(r'<td valign="top">(\d+:\d+:\d+ \w+)</td>', content)
-        file_paths = re.findall(r'Creating file &quot;([^&]+)&quot;', content)
-
+        # Extract file creations in one pass, each with the timestamp of its own row
         files_created = []
-        for ts, fp in zip(timestamps, file_paths):
-            files_created.append({
-                'timestamp': ts,
-                'file_path': fp
-            })
+        timestamp = None
+        for ts, fp in _RE_HTML_ROW.findall(content):
+            if ts:
+                timestamp = ts
+            elif timestamp:
+                files_created.append({
+                    'timestamp': timestamp,
+                    'file_path': fp
+                })
 
         # Assume one operation
         data['sync_operations'].append({
@@ -69,89 +86,89 @@ def parse_sync_log(log_file_path):
         })
 
     else:
-        # Parse LOG format
-        lines = content.splitlines()
-
-        data = {
-            'sync_name': None,
-            'date': None,
-            'start_time': None,
-            'items_processed': None,
-            'total_size': None,
-            'total_time': None,
-            'comparison_items': None,
-            'comparison_time': None,
-            'sync_operations': []
-        }
-
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-            if not line:
-                i += 1
-                continue
-
-            # Parse header
-            match = re.match(r"(.+) (\d+/\d+/\d+) \[(\d+:\d+:\d+ \w+)\]", line)
-            if match:
-                data['sync_name'] = match.group(1)
-                data['date'] = match.group(2)
-                data['start_time'] = match.group(3)
-                i += 1
-                continue
-
-            # Parse summary
-            if line.startswith('|    Items processed:'):
-                match = re.search(r'Items processed: (\d+) \(([\d.]+ \w+)\)', line)
-                if match:
-                    data['items_processed'] = int(match.group(1))
-                    data['total_size'] = match.group(2)
-            elif line.startswith('|    Total time:'):
-                match = re.search(r'Total time: (\d+:\d+:\d+)', line)
-                if match:
-                    data['total_time'] = match.group(1)
-
-            # Parse comparison
-            match = re.search(r'Info:\s+Comparison finished: ([\d,]+) items found – Time elapsed: (\d+:\d+:\d+)', line)
-            if match:
-                data['comparison_items'] = int(match.group(1).replace(',', ''))
-                data['comparison_time'] = match.group(2)
-                i += 1
-                continue
-
-            # Parse synchronizing folder pair
-            if 'Synchronizing folder pair: Update >' in line:
-                # Next line is source, next next is dest
-                if i + 2 < len(lines):
-                    source = lines[i + 1].strip()
-                    dest = lines[i + 2].strip()
-                    current_operation = {
-                        'source': source,
-                        'destination': dest,
-                        'files_created': []
-                    }
-                    data['sync_operations'].append(current_operation)
-                    i += 3  # Skip the next two lines
-                    continue
-
-            # Parse creating file
-            match = re.search(r'Info:\s+Creating file "(.+)"', line)
-            if match and data['sync_operations']:
-                file_path = match.group(1)
-                # Extract timestamp
-                time_match = re.match(r'\[(\d+:\d+:\d+ \w+)\]', line)
-                if time_match:
-                    timestamp = time_match.group(1)
-                    data['sync_operations'][-1]['files_created'].append({
-                        'timestamp': timestamp,
-                        'file_path': file_path
-                    })
-            i += 1
+        # Parse LOG format, one pass over the whole text per pattern
+        data = dict.fromkeys(_LOG_DATA_KEYS)
+        data['sync_operations'] = []
+
+        # Later lines win, as they did when the log was read line by line
+        # Parse header
+        match = _last_match(_RE_HEADER, content)
+        if match:
+            data['sync_name'] = match.group(1)
+            data['date'] = match.group(2)
+            data['start_time'] = match.group(3)
+
+        # Parse summary
+        match = _last_match(_RE_ITEMS, content)
+        if match:
+            data['items_processed'] = int(match.group(1))
+            data['total_size'] = match.group(2)
+        match = _last_match(_RE_TOTAL, content)
+        if match:
+            data['total_time'] = match.group(1)
+
+        # Parse comparison
+        match = _last_match(_RE_COMPARE, content)
+        if match:
+            data['comparison_items'] = int(match.group(1).replace(',', ''))
+            data['comparison_time'] = match.group(2)
+
+        # Parse synchronizing folder pairs, the two lines after each are source and dest
+        pair_starts = []
+        for match in _RE_FOLDER_PAIR.finditer(content):
+            pair_starts.append(match.start())
+            data['sync_operations'].append({
+                'source': match.group(1).strip(),
+                'destination': match.group(2).strip(),
+                'files_created': []
+            })
+
+        # Parse creating file, each belongs to the last folder pair before it
+        operations = data['sync_operations']
+        op_index = -1
+        for match in _RE_CREATE.finditer(content):
+            while op_index + 1 < len(pair_starts) and pair_starts[op_index + 1] < match.start():
+                op_index += 1
+            if op_index >= 0:
+                operations[op_index]['files_created'].append({
+                    'timestamp': match.group(1),
+                    'file_path': match.group(2)
+                })
 
     return data
 
 
-def append_to_csv(data, csv_file_path, prepend=False, add_breaks=False):
+def _last_match(pattern, content):
+    """
+    Find the last match of a compiled pattern in a string.
+
+    Args:
+        pattern (re.Pattern): Compiled pattern
+        content (str): Text to scan
+
+    Returns:
+        re.Match: The last match, or None if there is none
+    """
+    match = None
+    for match in pattern.finditer(content):
+        pass
+    return match
+
+
+CSV_FIELDNAMES = ['Date', 'Time', 'Type', 'Section', 'File Name']
+CSV_BREAK_ROW = ('--- New Log Entry ---', '', '', '', '')
+
+# File type of each known extension, used by get_file_type
+FILE_TYPES = {
+    'Image': ['.png', '.jpeg', '.jpg', '.bmp', '.tiff', '.tif', '.exr', '.tga', '.dpx'],
+    'Video': ['.mov'],
+    'Audio': ['.mp3', '.wav', '.aiff'],
+    '3D': ['.abc', '.fbx', '.obj']
+}
+_EXT_TO_TYPE = {ext: type_name for type_name, exts in FILE_TYPES.items() for ext in exts}
+
+
+def append_to_csv(data, csv_file_path, prepend=False, add_breaks=False, unique_files=None):
     """
     Append parsed log data to CSV file.
 
@@ -160,83 +177,64 @@ def append_to_csv(data, csv_file_path, prepend=False, add_breaks=False):
         csv_file_path (str): Path to CSV file
         prepend (bool): Whether to prepend data instead of append
         add_breaks (bool): Whether to add blank rows between log entries
+        unique_files (dict, optional): extract_unique_files(data), if the caller already has it
+    """
+    append_logs_to_csv([data], csv_file_path, prepend=prepend, add_breaks=add_breaks,
+                       unique_files_list=None if unique_files is None else [unique_files])
+
+
+def append_logs_to_csv(data_list, csv_file_path, prepend=False, add_breaks=False, unique_files_list=None):
+    """
+    Append several parsed logs to CSV file, opening it only once.
+
+    The result is the same as calling append_to_csv for each log in turn.
+
+    Args:
+        data_list (list): Parsed log data dicts, in processing order
+        csv_file_path (str): Path to CSV file
+        prepend (bool): Whether to prepend data instead of append
+        add_breaks (bool): Whether to add blank rows between log entries
+        unique_files_list (list, optional): extract_unique_files() of each log, if the caller already has them
     """
     try:
-        file_exists = os.path.isfile(csv_file_path)
-        file_is_empty = file_exists and os.path.getsize(csv_file_path) == 0
-        
-        # Prepare new rows
-        fieldnames = ['Date', 'Time', 'Type', 'Section', 'File Name']
+        # One stat tells both whether the file exists and whether it already has a header
+        try:
+            needs_header = os.stat(csv_file_path).st_size == 0
+        except FileNotFoundError:
+            needs_header = True
+
+        # Prepare new rows; when prepending, each log lands above the previous one
+        if unique_files_list is None:
+            unique_files_list = [extract_unique_files(data) for data in data_list]
+        logs = list(zip(data_list, unique_files_list))
         new_rows = []
-
-        # Collect unique files
-        unique_files = {}
-        for operation in data['sync_operations']:
-            for file_info in operation['files_created']:
-                file_path = file_info['file_path']
-                # Extract file name
-                file_name = file_path.split('\\')[-1]
-                if file_name not in unique_files:
-                    # Extract extension
-                    extension = '.' + file_name.split('.')[-1] if '.' in file_name else ''
-                    # Get type
-                    file_type = get_file_type(extension)
-                    # Extract section
-                    path_parts = file_path.split('\\')
-                    try:
-                        video_file_index = path_parts.index('VideoFile')
-                        section = path_parts[video_file_index + 1] if video_file_index + 1 < len(path_parts) else ''
-                    except ValueError:
-                        section = ''
-
-                    unique_files[file_name] = {
-                        'timestamp': file_info['timestamp'],
-                        'file_type': file_type,
-                        'section': section,
-                        'file_name': file_name
-                    }
-
-        # Create new rows
-        for file_name, info in unique_files.items():
-            new_rows.append({
-                'Date': data['date'],
-                'Time': info['timestamp'],
-                'Type': info['file_type'],
-                'Section': info['section'],
-                'File Name': info['file_name']
-            })
-        
-        # Add break row if requested
-        if add_breaks:
-            new_rows.append({'Date': '--- New Log Entry ---', 'Time': '', 'Type': '', 'Section': '', 'File Name': ''})
-
-        if prepend and file_exists and not file_is_empty:
-            # Read existing content
-            existing_rows = []
-            with open(csv_file_path, 'r', newline='') as csvfile:
-                reader = csv.DictReader(csvfile)
-                for row in reader:
-                    existing_rows.append(row)
-            
-            # Write new content with new data first
-            with open(csv_file_path, 'w', newline='') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                # Write new rows first
-                for row in new_rows:
-                    writer.writerow(row)
-                # Write existing rows
-                for row in existing_rows:
-                    writer.writerow(row)
+        for data, unique_files in (reversed(logs) if prepend else logs):
+            new_rows.extend(_build_csv_rows(data, unique_files, add_breaks))
+
+        if prepend and not needs_header:
+            # Write the header and new rows to a temp file, then copy the existing
+            # rows after them byte for byte instead of re-parsing every row
+            tmp_path = csv_file_path + '.tmp'
+            try:
+                with open(csv_file_path, 'r', newline='') as src, \
+                        open(tmp_path, 'w', newline='', buffering=1 << 20) as dst:
+                    writer = csv.writer(dst)
+                    writer.writerow(CSV_FIELDNAMES)
+                    writer.writerows(new_rows)
+                    src.readline()  # Skip the existing header
+                    shutil.copyfileobj(src, dst, 1 << 20)
+                os.replace(tmp_path, csv_file_path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
         else:
             # Append mode or new file or empty file
-            with open(csv_file_path, 'a', newline='') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                if not file_exists or file_is_empty:
-                    writer.writeheader()
+            with open(csv_file_path, 'a', newline='', buffering=1 << 20) as csvfile:
+                writer = csv.writer(csvfile)
+                if needs_header:
+                    writer.writerow(CSV_FIELDNAMES)
                 # Write new rows
-                for row in new_rows:
-                    writer.writerow(row)
+                writer.writerows(new_rows)
 
     except Exception as e:
         print(f"Error in append_to_csv: {e}")
@@ -245,6 +243,50 @@ def append_to_csv(data, csv_file_path, prepend=False, add_breaks=False):
         raise
 
 
+def _build_csv_rows(data, unique_files, add_breaks=False):
+    """
+    Build the CSV rows for one parsed log.
+
+    Args:
+        data (dict): Parsed log data
+        unique_files (dict): Unique files of the log, as returned by extract_unique_files
+        add_breaks (bool): Whether to end the rows with a break row
+
+    Returns:
+        list: Row tuples in CSV_FIELDNAMES order
+    """
+    date = data['date']
+    new_rows = [(date, info['timestamp'], info['file_type'], info['section'], info['file_name'])
+                for info in unique_files.values()]
+
+    # Add break row if requested
+    if add_breaks:
+        new_rows.append(CSV_BREAK_ROW)
+
+    return new_rows
+
+
+def _file_section(file_path):
+    """
+    Get the section of a created file, the folder right below 'VideoFile'.
+
+    Args:
+        file_path (str): Windows path of the created file
+
+    Returns:
+        str: Section name, or an empty string if the path has no 'VideoFile' folder
+    """
+    if file_path.startswith('VideoFile\\'):
+        start = len('VideoFile\\')
+    else:
+        index = file_path.find('\\VideoFile\\')
+        if index == -1:
+            return ''
+        start = index + len('\\VideoFile\\')
+    # Many files share a section, so let them share one string too
+    return sys.intern(file_path[start:].partition('\\')[0])
+
+
 def get_file_type(extension):
     """
     Get file type based on extension.
@@ -255,18 +297,7 @@ def get_file_type(extension):
     Returns:
         str: File type category
     """
-    # Define file type mappings
-    file_types = {
-        'Image': ['.png', '.jpeg', '.jpg', '.bmp', '.tiff', '.tif', '.exr', '.tga', '.dpx'],
-        'Video': ['.mov'],
-        'Audio': ['.mp3', '.wav', '.aiff'],
-        '3D': ['.abc', '.fbx', '.obj']
-    }
-
-    for type_name, exts in file_types.items():
-        if extension.lower() in exts:
-            return type_name
-    return 'Unknown'
+    return _EXT_TO_TYPE.get(extension.lower(), 'Unknown')
 
 
 def extract_unique_files(parsed_data):
@@ -284,19 +315,15 @@ def extract_unique_files(parsed_data):
         for file_info in operation['files_created']:
             file_path = file_info['file_path']
             # Extract file name
-            file_name = file_path.split('\\')[-1]
+            file_name = file_path.rpartition('\\')[2]
             if file_name not in unique_files:
                 # Extract extension
-                extension = '.' + file_name.split('.')[-1] if '.' in file_name else ''
+                _, dot, ext = file_name.rpartition('.')
+                extension = '.' + ext if dot else ''
                 # Get type
                 file_type = get_file_type(extension)
                 # Extract section
-                path_parts = file_path.split('\\')
-                try:
-                    video_file_index = path_parts.index('VideoFile')
-                    section = path_parts[video_file_index + 1] if video_file_index + 1 < len(path_parts) else ''
-                except ValueError:
-                    section = ''
+                section = _file_section(file_path)
 
                 unique_files[file_name] = {
                     'timestamp': file_info['timestamp'],
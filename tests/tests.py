@@ -7,22 +7,25 @@ import unittest
 import tempfile
 import os
 import csv
+import threading
 from unittest.mock import Mock, patch, MagicMock
 
 # Import modules - adjust based on how the package is structured
 try:
-    from syncsentinel.parser import parse_sync_log, append_to_csv, get_file_type, extract_unique_files
-    from syncsentinel.handler import LogFileHandler
-    from syncsentinel.main import MediaAssetWatcherGUI
+    from syncsentinel.parser import parse_sync_log, append_to_csv, append_logs_to_csv, get_file_type, extract_unique_files
+    from syncsentinel.handler import LogFileHandler, DebouncedLogFileHandler, wait_until_stable
+    from syncsentinel.main import MediaAssetWatcherGUI, _file_digest
     from syncsentinel.google_sheets import GoogleSheetsManager
+    from syncsentinel.ledger import ProcessedLedger
 except ImportError:
     # Fallback for when running tests directly
     import sys
     sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-    from syncsentinel.parser import parse_sync_log, append_to_csv, get_file_type, extract_unique_files
-    from syncsentinel.handler import LogFileHandler
-    from syncsentinel.main import MediaAssetWatcherGUI
+    from syncsentinel.parser import parse_sync_log, append_to_csv, append_logs_to_csv, get_file_type, extract_unique_files
+    from syncsentinel.handler import LogFileHandler, DebouncedLogFileHandler, wait_until_stable
+    from syncsentinel.main import MediaAssetWatcherGUI, _file_digest
     from syncsentinel.google_sheets import GoogleSheetsManager
+    from syncsentinel.ledger import ProcessedLedger
 
 
 class TestParser(unittest.TestCase):
@@ -71,6 +74,37 @@ Creating file &quot;C:\\Dest\\VideoFile\\Project\\image.png&quot;
         finally:
             os.unlink(temp_path)
 
+    def test_parse_sync_log_assigns_files_to_folder_pairs(self):
+        """Test that created files are grouped under the folder pair above them."""
+        content = """Test Sync 9/13/2025 [2:30:15 PM]
+[2:30:16 PM]  Info:  Creating file "C:\\Dest\\early.png"
+[2:30:17 PM]  Info:  Synchronizing folder pair: Update >
+    C:\\SourceA
+    C:\\DestA
+[2:30:20 PM]  Info:  Creating file "C:\\DestA\\VideoFile\\Project\\test.mov"
+[2:30:21 PM]  Info:  Synchronizing folder pair: Update >
+    C:\\SourceB
+    C:\\DestB
+[2:30:25 PM]  Info:  Creating file "C:\\DestB\\VideoFile\\Project\\image.png"
+[2:30:26 PM]  Info:  Creating file "C:\\DestB\\VideoFile\\Project\\scene.fbx"
+"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.log', delete=False, encoding='utf-8') as f:
+            f.write(content)
+            temp_path = f.name
+
+        try:
+            result = parse_sync_log(temp_path)
+
+            operations = result['sync_operations']
+            self.assertEqual([(op['source'], op['destination']) for op in operations],
+                             [('C:\\SourceA', 'C:\\DestA'), ('C:\\SourceB', 'C:\\DestB')])
+            self.assertEqual(operations[0]['files_created'],
+                             [{'timestamp': '2:30:20 PM', 'file_path': 'C:\\DestA\\VideoFile\\Project\\test.mov'}])
+            self.assertEqual([f['timestamp'] for f in operations[1]['files_created']], ['2:30:25 PM', '2:30:26 PM'])
+
+        finally:
+            os.unlink(temp_path)
+
     def test_parse_sync_log_html(self):
         """Test parsing of .html format files."""
         with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False, encoding='utf-8') as f:
@@ -89,6 +123,24 @@ Creating file &quot;C:\\Dest\\VideoFile\\Project\\image.png&quot;
         finally:
             os.unlink(temp_path)
 
+    def test_parse_sync_log_html_pairs_files_with_their_row_timestamp(self):
+        """Test that rows without a file creation do not shift HTML timestamps."""
+        content = self.sample_html_content.replace(
+            '<td valign="top">2:30:25 PM</td>',
+            '<td valign="top">2:30:22 PM</td>\nDeleting file &quot;C:\\Dest\\old.png&quot;\n<td valign="top">2:30:25 PM</td>')
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False, encoding='utf-8') as f:
+            f.write(content)
+            temp_path = f.name
+
+        try:
+            result = parse_sync_log(temp_path)
+
+            self.assertEqual([f['timestamp'] for f in result['sync_operations'][0]['files_created']],
+                             ['2:30:20 PM', '2:30:25 PM'])
+
+        finally:
+            os.unlink(temp_path)
+
     def test_get_file_type(self):
         """Test file type detection."""
         self.assertEqual(get_file_type('.mov'), 'Video')
@@ -145,6 +197,50 @@ Creating file &quot;C:\\Dest\\VideoFile\\Project\\image.png&quot;
         finally:
             os.unlink(temp_path)
 
+    def test_append_logs_to_csv_matches_sequential_appends(self):
+        """Test that batched CSV writes match per-log appends in prepend mode."""
+        logs = [
+            {'date': f'9/1{i}/2025', 'sync_operations': [{
+                'files_created': [
+                    {'timestamp': '2:30:20 PM', 'file_path': f'C:\\Dest\\VideoFile\\Project\\clip{i}.mov'}
+                ]
+            }]}
+            for i in range(3)
+        ]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            sequential_path = os.path.join(temp_dir, 'sequential.csv')
+            batched_path = os.path.join(temp_dir, 'batched.csv')
+            append_to_csv(logs[0], sequential_path)
+            append_to_csv(logs[0], batched_path)
+
+            for data in logs[1:]:
+                append_to_csv(data, sequential_path, prepend=True, add_breaks=True)
+            append_logs_to_csv(logs[1:], batched_path, prepend=True, add_breaks=True)
+
+            with open(sequential_path, 'r') as f:
+                expected = f.read()
+            with open(batched_path, 'r') as f:
+                self.assertEqual(f.read(), expected)
+
+    def test_append_to_csv_prepend_puts_new_rows_first(self):
+        """Test that prepending keeps the header on top and existing rows below."""
+        def log(name):
+            return {'date': '9/13/2025', 'sync_operations': [{
+                'files_created': [{'timestamp': '2:30:20 PM', 'file_path': f'C:\\Dest\\VideoFile\\Project\\{name}'}]
+            }]}
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_path = os.path.join(temp_dir, 'out.csv')
+            append_to_csv(log('old.mov'), csv_path)
+            append_to_csv(log('new.mov'), csv_path, prepend=True)
+
+            with open(csv_path, 'r', newline='') as f:
+                rows = list(csv.reader(f))
+            self.assertEqual(rows[0][0], 'Date')
+            self.assertEqual([row[4] for row in rows[1:]], ['new.mov', 'old.mov'])
+            self.assertFalse(os.path.exists(csv_path + '.tmp'))
+
     def test_parse_sync_log_empty_file(self):
         """Test parsing of empty log files."""
         with tempfile.NamedTemporaryFile(mode='w', suffix='.log', delete=False) as f:
@@ -210,29 +306,79 @@ class TestHandler(unittest.TestCase):
         self.sheets_callback = Mock()
         self.handler = LogFileHandler('test.csv', self.log_callback, self.store_callback, self.sheets_callback, prepend=False, add_breaks=False)
 
-    @patch('syncsentinel.handler.time.sleep')
-    @patch('syncsentinel.parser.parse_sync_log')
-    @patch('syncsentinel.parser.append_to_csv')
-    def test_on_created_log_file(self, mock_append, mock_parse, mock_sleep):
+    @patch('syncsentinel.handler.wait_until_stable', return_value=True)
+    @patch('syncsentinel.handler.parse_sync_log')
+    @patch('syncsentinel.handler.append_logs_to_csv')
+    def test_on_created_log_file(self, mock_append, mock_parse, mock_wait):
         """Test handling of new log file creation."""
-        # Mock the file event
-        mock_event = Mock()
-        mock_event.is_directory = False
-        mock_event.src_path = 'test.log'
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_path = os.path.join(temp_dir, 'test.log')
+            with open(log_path, 'w') as f:
+                f.write('log')
 
-        # Mock parse result
-        mock_parse.return_value = {'sync_operations': [{'files_created': []}]}
+            # Mock the file event
+            mock_event = Mock()
+            mock_event.is_directory = False
+            mock_event.src_path = log_path
 
-        # Call the handler
-        self.handler.on_created(mock_event)
+            # Mock parse result
+            mock_parse.return_value = {'sync_operations': [{'files_created': []}]}
+
+            # Call the handler and wait for its worker thread
+            self.handler.on_created(mock_event)
+            self.handler.wait_idle()
 
         # Verify calls
-        self.log_callback.assert_any_call(f"New log file detected: test.log")
+        self.log_callback.assert_any_call(f"New log file detected: {log_path}")
         self.log_callback.assert_any_call("Data stored for clipboard access")
-        mock_parse.assert_called_with('test.log')
-        mock_append.assert_called_with({'sync_operations': [{'files_created': []}]}, 'test.csv', prepend=False, add_breaks=False)
-        self.store_callback.assert_called_once()
-        self.sheets_callback.assert_called_once()
+        mock_parse.assert_called_with(log_path)
+        mock_append.assert_called_with([{'sync_operations': [{'files_created': []}]}], 'test.csv', prepend=False, add_breaks=False,
+                                       unique_files_list=[{}])
+        self.store_callback.assert_called_once_with({'sync_operations': [{'files_created': []}]}, {})
+        self.sheets_callback.assert_called_once_with([{'sync_operations': [{'files_created': []}]}], [{}])
+
+    @patch('syncsentinel.handler.wait_until_stable', return_value=True)
+    @patch('syncsentinel.handler.parse_sync_log', return_value={'sync_operations': []})
+    @patch('syncsentinel.handler.append_logs_to_csv')
+    def test_ledger_records_log_only_after_upload_succeeds(self, mock_append, mock_parse, mock_wait):
+        """Test that a log whose upload failed is not recorded as processed."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_path = os.path.join(temp_dir, 'test.log')
+            with open(log_path, 'w') as f:
+                f.write('log')
+            self.handler.ledger = Mock()
+            self.handler.ledger.is_processed.return_value = False
+
+            self.sheets_callback.return_value = False
+            self.handler.process_log_files([log_path])
+            self.handler.close()
+            self.handler.ledger.mark_processed.assert_not_called()
+
+            self.sheets_callback.return_value = True
+            self.handler._upload([{}], [{}], [log_path])
+            self.handler.ledger.mark_processed.assert_called_once_with([log_path], 'test.csv')
+
+    @patch('syncsentinel.handler.parse_sync_log')
+    def test_parse_reused_for_unchanged_log(self, mock_parse):
+        """Test that a repeat event for an unchanged log does not parse it again."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_path = os.path.join(temp_dir, 'test.log')
+            with open(log_path, 'w') as f:
+                f.write('log')
+
+            mock_parse.return_value = {'sync_operations': []}
+            self.assertIs(self.handler._parse_cached(log_path), self.handler._parse_cached(log_path))
+            mock_parse.assert_called_once_with(log_path)
+
+    def test_queued_paths_processed_as_one_batch(self):
+        """Test that paths queued within the batch window are deduplicated and processed together."""
+        self.handler.process_log_files = Mock()
+
+        for path in ('a.log', 'b.log', 'a.log'):
+            self.handler.enqueue(path)
+        self.handler.wait_idle()
+
+        self.handler.process_log_files.assert_called_once_with(['a.log', 'b.log'])
 
     def test_on_created_non_log_file(self):
         """Test that non-log files are ignored."""
@@ -259,6 +405,142 @@ class TestHandler(unittest.TestCase):
         self.store_callback.assert_not_called()
 
 
+    def test_dispatch_skips_temp_and_hidden_files(self):
+        """Test that temp and hidden files never reach the event handlers."""
+        from watchdog.events import FileCreatedEvent, FileMovedEvent
+        self.handler.on_created = Mock()
+        self.handler.on_moved = Mock()
+
+        for path in ('sync.log.ffs_tmp', 'sync.tmp', '.sync.log', 'sync.log~'):
+            self.handler.dispatch(FileCreatedEvent(path))
+        self.handler.on_created.assert_not_called()
+
+        self.handler.dispatch(FileMovedEvent('sync.log.ffs_tmp', 'sync.log'))
+        self.handler.on_moved.assert_called_once()
+
+    def test_wait_until_stable(self):
+        """Test that a finished log is ready once its size held for the quiet period and a missing one is not waited on."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_path = os.path.join(temp_dir, 'sync.log')
+            with open(log_path, 'w') as f:
+                f.write('done')
+
+            with patch('syncsentinel.handler.time.sleep') as mock_sleep:
+                self.assertTrue(wait_until_stable(log_path))
+                self.assertEqual(mock_sleep.call_count, 5)
+                self.assertFalse(wait_until_stable(os.path.join(temp_dir, 'missing.log')))
+
+class TestDebouncedHandler(unittest.TestCase):
+    """Test cases for handler.py DebouncedLogFileHandler class."""
+
+    def test_burst_of_events_processed_once(self):
+        """Test that repeated events for one file collapse into a single parse."""
+        handler = DebouncedLogFileHandler('test.csv', Mock(), Mock(), debounce_delay=0.05)
+        processed = threading.Event()
+        handler.process_log_files = Mock(side_effect=lambda paths: processed.set())
+
+        mock_event = Mock()
+        mock_event.is_directory = False
+        mock_event.src_path = 'test.log'
+
+        handler.on_created(mock_event)
+        handler.on_modified(mock_event)
+        handler.on_modified(mock_event)
+
+        self.assertTrue(processed.wait(5))
+        handler.close()
+        handler.process_log_files.assert_called_once_with(['test.log'])
+
+    @patch('syncsentinel.handler.wait_until_stable', return_value=False)
+    def test_log_still_being_written_is_rescheduled(self, mock_wait):
+        """Test that a log whose wait timed out gets another quiet period instead of being dropped."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_path = os.path.join(temp_dir, 'test.log')
+            with open(log_path, 'w') as f:
+                f.write('still writing')
+            handler = DebouncedLogFileHandler('test.csv', Mock(), Mock(), debounce_delay=60)
+            handler._schedule = Mock()
+
+            handler.process_log_files([log_path])
+            handler._schedule.assert_called_once_with(log_path)
+
+            handler.MAX_UNSTABLE_RETRIES = 1
+            handler.process_log_files([log_path])
+            handler._schedule.assert_called_once_with(log_path)
+            handler.log_callback.assert_called_with(f"Skipping log file that is still being written: {log_path}")
+
+    def test_modified_without_pending_create_ignored(self):
+        """Test that edits to an already processed log do not trigger a reparse."""
+        handler = DebouncedLogFileHandler('test.csv', Mock(), Mock(), debounce_delay=0.05)
+        handler.process_log_files = Mock()
+
+        mock_event = Mock()
+        mock_event.is_directory = False
+        mock_event.src_path = 'test.log'
+
+        handler.on_modified(mock_event)
+
+        # close() processes anything still scheduled, so nothing may have been
+        self.assertEqual(handler._timers, {})
+        handler.close()
+        handler.process_log_files.assert_not_called()
+
+
+    def test_close_processes_logs_still_in_quiet_period(self):
+        """Test that stopping hands logs waiting on their debounce timer to the worker instead of dropping them."""
+        handler = DebouncedLogFileHandler('test.csv', Mock(), Mock(), debounce_delay=60)
+        handler.process_log_files = Mock()
+
+        mock_event = Mock()
+        mock_event.is_directory = False
+        mock_event.src_path = 'test.log'
+        handler.on_created(mock_event)
+
+        handler.close()
+        handler.process_log_files.assert_called_once_with(['test.log'])
+
+    def test_modified_events_dropped_after_close_events(self):
+        """Test that modifications stop being dispatched once the observer reports closes."""
+        from watchdog.events import FileModifiedEvent, FileClosedEvent, FileDeletedEvent
+        handler = DebouncedLogFileHandler('test.csv', Mock(), Mock())
+        handler.on_modified = Mock()
+        handler.on_deleted = Mock()
+
+        handler.dispatch(FileModifiedEvent('sync.log'))
+        handler.on_modified.assert_called_once()
+
+        handler.dispatch(FileClosedEvent('sync.log'))
+        handler.dispatch(FileModifiedEvent('sync.log'))
+        handler.dispatch(FileDeletedEvent('sync.log'))
+        self.assertEqual(handler.on_modified.call_count, 2)
+        handler.on_deleted.assert_not_called()
+
+class TestProcessedLedger(unittest.TestCase):
+    """Test cases for ledger.py ProcessedLedger class."""
+
+    def test_processed_until_file_changes(self):
+        """Test that a recorded log is skipped until its contents change."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_path = os.path.join(temp_dir, 'sync.log')
+            with open(log_path, 'w') as f:
+                f.write('first run')
+
+            csv_path = os.path.join(temp_dir, 'out.csv')
+            ledger = ProcessedLedger(os.path.join(temp_dir, 'ledger.db'))
+            try:
+                self.assertFalse(ledger.is_processed(log_path, csv_path))
+                ledger.mark_processed([log_path], csv_path)
+                self.assertTrue(ledger.is_processed(log_path, csv_path))
+                # Another CSV has not received the log yet
+                self.assertFalse(ledger.is_processed(log_path, os.path.join(temp_dir, 'other.csv')))
+
+                with open(log_path, 'a') as f:
+                    f.write(' and more')
+                self.assertFalse(ledger.is_processed(log_path, csv_path))
+            finally:
+                ledger.close()
+
+
 class TestGUIIntegration(unittest.TestCase):
     """Test GUI integration and user interactions."""
 
@@ -268,10 +550,147 @@ class TestGUIIntegration(unittest.TestCase):
         # These would be integration tests run separately
         self.assertTrue(True)
 
+    def test_run_on_ui_queues_calls_from_worker_threads(self):
+        """Test that widget updates from other threads wait for the Tk thread."""
+        import queue
+        import threading
+        gui = Mock()
+        gui._ui_queue = queue.Queue()
+        func = Mock()
+
+        worker = threading.Thread(target=MediaAssetWatcherGUI._run_on_ui, args=(gui, func, 'queued'))
+        worker.start()
+        worker.join()
+        func.assert_not_called()
+
+        MediaAssetWatcherGUI._drain_ui_queue(gui)
+        func.assert_called_once_with('queued')
+        gui.root.after.assert_called_once()
+
+        MediaAssetWatcherGUI._run_on_ui(gui, func, 'direct')
+        func.assert_called_with('direct')
+
+
+    def test_save_config_skips_unchanged_config(self):
+        """Test that saving an unchanged configuration does not rewrite the file."""
+        gui = Mock(watch_path='C:\\Logs', csv_file='out.csv', google_sheets_enabled=False,
+                   google_sheet_url='', dark_mode=False, log_breaks=True, prepend_mode=True,
+                   sheets_serial_dates=False, _save_after_id=None, _saved_config=None)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            gui.config_file = os.path.join(temp_dir, 'config.json')
+            MediaAssetWatcherGUI.save_config(gui)
+            self.assertTrue(os.path.isfile(gui.config_file))
+            os.unlink(gui.config_file)
+
+            MediaAssetWatcherGUI.save_config(gui)
+            self.assertFalse(os.path.isfile(gui.config_file))
+
+            gui.dark_mode = True
+            MediaAssetWatcherGUI.save_config(gui)
+            self.assertTrue(os.path.isfile(gui.config_file))
+
+    def test_log_messages_written_in_one_insert(self):
+        """Test that a burst of log lines reaches the log area as a single insert."""
+        from syncsentinel.gui_utils import log_message, flush_log
+        gui = Mock(_log_buffer=[], _log_flush_id=None)
+
+        log_message(gui, 'first')
+        log_message(gui, 'second')
+        gui.root.after.assert_called_once()
+        gui.log_text.insert.assert_not_called()
+
+        flush_log(gui)
+        gui.log_text.insert.assert_called_once()
+        lines = gui.log_text.insert.call_args[0][1].splitlines()
+        self.assertEqual([line.split('] ', 1)[1] for line in lines], ['first', 'second'])
+
+    @patch('syncsentinel.main.parse_sync_log')
+    def test_process_files_worker_reuses_parse_of_identical_logs(self, mock_parse):
+        """Test that a log with the same contents as one parsed before is not parsed again."""
+        mock_parse.return_value = {'date': '9/13/2025', 'sync_operations': []}
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for name in ('first.log', 'copy.log'):
+                with open(os.path.join(temp_dir, name), 'w') as f:
+                    f.write('Test Sync 9/13/2025 [2:30:15 PM]\n' * 4)
+            with open(os.path.join(temp_dir, 'other.log'), 'w') as f:
+                f.write('Test Sync 9/14/2025 [2:30:15 PM]\n' * 5)
+            gui = self._worker_gui(temp_dir)
+
+            with patch('syncsentinel.main._file_digest', wraps=_file_digest) as mock_digest:
+                MediaAssetWatcherGUI._process_files_worker(gui, ['first.log'])
+                MediaAssetWatcherGUI._process_files_worker(gui, ['other.log'])
+                # Nothing cached has the same size, so nothing was hashed
+                mock_digest.assert_not_called()
+                MediaAssetWatcherGUI._process_files_worker(gui, ['copy.log'])
+
+            self.assertEqual(mock_parse.call_count, 2)
+            self.assertNotIn(os.path.join(temp_dir, 'copy.log'), [c.args[0] for c in mock_parse.call_args_list])
+            self.assertEqual(gui.store_last_parsed.call_count, 3)
+
+    @staticmethod
+    def _worker_gui(temp_dir):
+        """Mock GUI running the real parse cache methods."""
+        gui = Mock(watch_path=temp_dir, csv_file=os.path.join(temp_dir, 'out.csv'),
+                   google_sheets_enabled=False, prepend_mode=False, log_breaks=False, _parse_cache={})
+        gui._lookup_parse = lambda path: MediaAssetWatcherGUI._lookup_parse(gui, path)
+        gui._stamp_digest = MediaAssetWatcherGUI._stamp_digest
+        gui._cache_parse_result = lambda key, data: MediaAssetWatcherGUI._cache_parse_result(gui, key, data)
+        return gui
+
+    def test_network_paths_detected_from_mounts(self):
+        """Test that UNC paths and paths under network mounts are told apart from local ones."""
+        from unittest.mock import mock_open
+        from syncsentinel.main import _is_network_path
+        mounts = "/dev/sda1 / ext4 rw 0 0\nserver:/logs /mnt/logs nfs4 rw 0 0\n"
+        self.assertTrue(_is_network_path('\\\\server\\logs'))
+        with patch('syncsentinel.main._SYSTEM', 'Linux'), patch('builtins.open', mock_open(read_data=mounts)):
+            self.assertTrue(_is_network_path('/mnt/logs/FreeFileSync'))
+            self.assertFalse(_is_network_path('/mnt/logsbackup'))
+            self.assertFalse(_is_network_path('/home/user/logs'))
+
+    def test_upload_batch_uses_serial_dates_setting(self):
+        """Test that the serial date setting reaches the Sheets upload."""
+        gui = Mock(google_sheet_id='sheet123', google_sheet_name=None, prepend_mode=True,
+                   log_breaks=False, sheets_serial_dates=True)
+        gui.sheets_manager.upload_data_batch.return_value = (True, "Uploaded")
+
+        self.assertTrue(MediaAssetWatcherGUI.upload_batch_to_google_sheets(gui, [{}], [{}]))
+        self.assertTrue(gui.sheets_manager.upload_data_batch.call_args.kwargs['serial_dates'])
+
+    def test_stop_watching_keeps_csv_controls_off_until_handler_drained(self):
+        """Test that the old handler's batch finishes before another can write the CSV."""
+        handler = Mock()
+        gui = Mock(watching=True, event_handler=handler, _busy=False)
+        gui._set_busy = lambda busy: MediaAssetWatcherGUI._set_busy(gui, busy)
+        gui._run_worker = lambda target, *args: MediaAssetWatcherGUI._run_worker(gui, target, *args)
+        ui_calls = []
+        gui._run_on_ui = lambda func, *args: ui_calls.append((func, args))
+
+        MediaAssetWatcherGUI.stop_watching(gui)
+        gui._worker_thread.join(1)
+
+        handler.close.assert_called_once_with()
+        self.assertIsNone(gui.event_handler)
+        self.assertTrue(gui._busy)
+        gui.process_button.config.assert_called_with(state='disabled')
+        for func, args in ui_calls:
+            func(*args)
+        self.assertFalse(gui._busy)
+        gui.check_inputs.assert_called_once_with()
+
 
 class TestGoogleSheets(unittest.TestCase):
     """Test cases for google_sheets.py GoogleSheetsManager class."""
 
+    def setUp(self):
+        """Keep the manager's config directory (key, token) out of the real home directory."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        env = patch.dict(os.environ, {'HOME': temp_dir.name, 'APPDATA': temp_dir.name})
+        env.start()
+        self.addCleanup(env.stop)
+
     def test_get_setup_instructions(self):
         """Test getting setup instructions."""
         manager = GoogleSheetsManager()
@@ -304,6 +723,164 @@ class TestGoogleSheets(unittest.TestCase):
         self.assertEqual(result['spreadsheet_id'], '1ABC123')
         self.assertIsNone(result['sheet_name'])
 
+    def test_encrypt_decrypt_credentials_roundtrip(self):
+        """Test that encrypted credentials decrypt back to the original data."""
+        manager = GoogleSheetsManager()
+        credentials_data = {'installed': {'client_id': 'abc', 'client_secret': 'xyz'}}
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager.ENCRYPTED_CREDENTIALS_FILE = os.path.join(temp_dir, 'credentials.enc')
+            encrypted_data = manager._encrypt_credentials(credentials_data)
+            self.assertNotIn(b'xyz', encrypted_data)
+            with open(manager.ENCRYPTED_CREDENTIALS_FILE, 'wb') as f:
+                f.write(encrypted_data)
+
+            self.assertEqual(manager._decrypt_credentials(), credentials_data)
+
+    def test_upload_data_prepend_single_batch_update(self):
+        """Test that prepend mode inserts and writes rows in one batchUpdate call."""
+        manager = GoogleSheetsManager()
+        manager.service = MagicMock()
+        spreadsheets = manager.service.spreadsheets.return_value
+        spreadsheets.get.return_value.execute.return_value = {
+            'sheets': [{'properties': {'sheetId': 7, 'title': 'Log'}}]
+        }
+        spreadsheets.values.return_value.get.return_value.execute.return_value = {'values': []}
+
+        sample_data = {
+            'date': '9/13/2025',
+            'sync_operations': [{
+                'files_created': [
+                    {'timestamp': '2:30:20 PM', 'file_path': 'C:\\Dest\\VideoFile\\Project\\test.mov'}
+                ]
+            }]
+        }
+
+        success, _ = manager.upload_data('sheet123', sample_data, sheet_name='Log', prepend=True)
+
+        self.assertTrue(success)
+        spreadsheets.batchUpdate.assert_called_once()
+        spreadsheets.values.return_value.update.assert_not_called()
+        batch_requests = spreadsheets.batchUpdate.call_args.kwargs['body']['requests']
+        self.assertEqual([list(r)[0] for r in batch_requests], ['updateCells', 'insertDimension', 'updateCells'])
+        self.assertEqual(batch_requests[0]['updateCells']['start']['rowIndex'], 0)
+        self.assertEqual(batch_requests[2]['updateCells']['start']['rowIndex'], 1)
+
+    def test_upload_data_append_single_values_batch_update(self):
+        """Test that append mode writes the break row and data in one values().batchUpdate call."""
+        manager = GoogleSheetsManager()
+        manager.service = MagicMock()
+        values = manager.service.spreadsheets.return_value.values.return_value
+        values.get.return_value.execute.return_value = {'values': [['Date'], ['9/12/2025']]}
+
+        sample_data = {
+            'date': '9/13/2025',
+            'sync_operations': [{
+                'files_created': [
+                    {'timestamp': '2:30:20 PM', 'file_path': 'C:\\Dest\\VideoFile\\Project\\test.mov'}
+                ]
+            }]
+        }
+
+        success, _ = manager.upload_data('sheet123', sample_data, prepend=False, add_breaks=True)
+
+        self.assertTrue(success)
+        values.update.assert_not_called()
+        values.batchUpdate.assert_called_once()
+        data = values.batchUpdate.call_args.kwargs['body']['data']
+        self.assertEqual(data, [{'range': 'A3:E4', 'values': [
+            ['--- New Log Entry ---', '', '', '', ''],
+            ['9/13/2025', '2:30:20 PM', 'Video', 'Project', 'test.mov']
+        ]}])
+
+    def test_upload_data_batch_prepend_matches_sequential_order(self):
+        """Test that a batch prepend puts the last log first, like sequential prepends would."""
+        manager = GoogleSheetsManager()
+        manager.service = MagicMock()
+        spreadsheets = manager.service.spreadsheets.return_value
+        spreadsheets.get.return_value.execute.return_value = {
+            'sheets': [{'properties': {'sheetId': 7, 'title': 'Log'}}]
+        }
+        spreadsheets.values.return_value.get.return_value.execute.return_value = {'values': [['Date']]}
+
+        def make_log(date, name):
+            return {'date': date, 'sync_operations': [{
+                'files_created': [{'timestamp': '2:30:20 PM', 'file_path': f'C:\\Dest\\VideoFile\\Project\\{name}'}]
+            }]}
+
+        success, _ = manager.upload_data_batch(
+            'sheet123', [make_log('9/12/2025', 'a.mov'), make_log('9/13/2025', 'b.mov')],
+            sheet_name='Log', prepend=True, add_breaks=True)
+
+        self.assertTrue(success)
+        spreadsheets.batchUpdate.assert_called_once()
+        batch_requests = spreadsheets.batchUpdate.call_args.kwargs['body']['requests']
+        self.assertEqual(batch_requests[0]['insertDimension']['range']['endIndex'], 5)
+        written = [row['values'][-1]['userEnteredValue']['stringValue']
+                   for row in batch_requests[1]['updateCells']['rows']]
+        self.assertEqual(written, ['b.mov', '', 'a.mov', ''])
+
+    def test_sheets_metadata_cached(self):
+        """Test that spreadsheet metadata is fetched once and reused."""
+        manager = GoogleSheetsManager()
+        manager.service = MagicMock()
+        spreadsheets = manager.service.spreadsheets.return_value
+        spreadsheets.get.return_value.execute.return_value = {
+            'sheets': [{'properties': {'sheetId': 7, 'title': 'Log'}}]
+        }
+
+        self.assertEqual(manager.get_sheet_names('sheet123'), ['Log'])
+        self.assertEqual(manager.resolve_sheet_name('sheet123', 'gid_7'), 'Log')
+        spreadsheets.get.assert_called_once()
+
+    def test_clear_credentials_stops_token_refresh(self):
+        """Test that removed credentials are not refreshed and saved again."""
+        manager = GoogleSheetsManager()
+        manager.creds = MagicMock()
+        manager.service = MagicMock()
+        timer = manager._refresh_timer = MagicMock()
+
+        manager.clear_credentials()
+        manager._background_refresh()
+
+        timer.cancel.assert_called_once_with()
+        self.assertIsNone(manager.creds)
+        self.assertIsNone(manager.service)
+        self.assertIsNone(manager._refresh_timer)
+
+    def test_legacy_pickle_token_migrated_to_json(self):
+        """Test that a token.pickle from an older release is saved as JSON and removed."""
+        import json
+        import pickle
+        from google.oauth2.credentials import Credentials
+        manager = GoogleSheetsManager()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager.TOKEN_FILE = os.path.join(temp_dir, 'token.json')
+            manager.LEGACY_TOKEN_FILE = os.path.join(temp_dir, 'token.pickle')
+            with open(manager.LEGACY_TOKEN_FILE, 'wb') as f:
+                pickle.dump(Credentials('old-token'), f)
+
+            manager._migrate_legacy_token()
+
+            self.assertFalse(os.path.exists(manager.LEGACY_TOKEN_FILE))
+            with open(manager.TOKEN_FILE) as f:
+                self.assertEqual(json.load(f)['token'], 'old-token')
+            self.assertEqual(manager.creds.token, 'old-token')
+
+    @patch('syncsentinel.google_sheets.time.sleep')
+    def test_token_bucket_waits_once_burst_is_spent(self, mock_sleep):
+        """Test that the upload rate limiter only sleeps after the burst is used up."""
+        from syncsentinel.google_sheets import TokenBucket
+        bucket = TokenBucket(rate=0.5, burst=2)
+
+        bucket.acquire()
+        bucket.acquire()
+        mock_sleep.assert_not_called()
+
+        bucket.acquire()
+        mock_sleep.assert_called_once()
+        self.assertAlmostEqual(mock_sleep.call_args[0][0], 2.0, places=1)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file